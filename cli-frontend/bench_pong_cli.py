@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the hot paths of pong_cli.py: message decode and
+dispatch, update_game_state, request encoding, one game_screen frame
+rendered into an in-memory screen and the per-frame log sites.
+
+Results are compared against a JSON baseline and runs slower than the
+baseline by more than the threshold are flagged (exit status 1). The first
+run, or a run with --save-baseline, stores its results as the new baseline.
+
+Usage:
+```
+python3 bench_pong_cli.py [--messages N] [--ticks N] [--frames N] [--recording FILE] [--baseline FILE] [--threshold 0.1]
+```
+"""
+
+import argparse
+import asyncio
+import curses
+import json
+import logging
+import logging.handlers
+import platform
+import queue
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pong_cli
+from pong_cli import FramePacer, GameClient, GameRenderer, HalfBlockRenderer, LiveGameState, LogQueueHandler, MessageDecoder, RateLimitedLog, SessionRecording
+
+BASELINE_FILE = Path(__file__).parent / "bench_baseline.json"
+
+
+def game_state_message(tick: int, game_id: str = "bench-Game-1") -> str:
+    """A game_state frame shaped like GameStateData in backend/src/api/pong/PongMessages.ts"""
+    return json.dumps({
+        "target_endpoint": "pong-api",
+        "type": "game_state",
+        "game": {
+            "id": game_id,
+            "status": "playing",
+            "ball": {"x": (tick % 97) / 97, "y": (tick % 61) / 61},
+            "leftPaddle": {"topPoint": {"x": 0, "y": 0.4 + (tick % 7) / 100}, "height": 0.2},
+            "rightPaddle": {"topPoint": {"x": 0.99, "y": 0.4 - (tick % 5) / 100}, "height": 0.2},
+            "lastUpdateTime": 1,
+            "maxScore": 10,
+            "scores": [{"alias": "left", "score": tick // 300}, {"alias": "right", "score": tick // 450}],
+            "countdown": 5,
+        }
+    }, separators=(",", ":"))
+
+
+def message_stream(count: int) -> List[str]:
+    """Mostly game_state frames with the occasional control message, as seen during a match"""
+    messages: List[str] = []
+    for tick in range(count):
+        if tick % 250 == 0:
+            messages.append(json.dumps({"target_endpoint": "pong-api", "type": "countdown", "value": 2}))
+        elif tick % 250 == 125:
+            messages.append(json.dumps({"target_endpoint": "pong-api", "type": "game_list", "games": []}))
+        else:
+            messages.append(game_state_message(tick))
+    return messages
+
+
+def recorded_stream(path: Path, count: int) -> List[str]:
+    """The frames a client received in a recorded session (pong_cli.py --record), repeated up to `count` messages"""
+    frames = SessionRecording.load(path).incoming
+    if not frames:
+        raise SystemExit(f"No incoming frames recorded in {path}")
+    return [frames[index % len(frames)] for index in range(count)]
+
+
+def legacy_dispatch(client: GameClient, raw: str) -> None:
+    """
+    Reference copy of the original consume_backend_messages body: stdlib json,
+    an elif chain on the message type and the raw dict stored as game state.
+    Logging calls are left out on both sides of the comparison.
+    """
+    try:
+        message: Dict[str, Any] = json.loads(raw)
+    except Exception:
+        return
+    if not message.get('target_endpoint') == "pong-api":
+        return
+    msg_type = message.get('type')
+    if msg_type == "error":
+        pong_data = message.get('pong_data', {})
+        client._error = (pong_data.get('message', 'Unknown error'), pong_data.get('code', 500))
+    elif msg_type == "game_list":
+        client._available_games.put_nowait(message.get('games', []))
+    elif msg_type == "game_states":
+        client._available_games.put_nowait(message.get('pong_data', []))
+    elif msg_type == "game_state":
+        game_data = message.get('game', {})
+        if not game_data:
+            return
+        game_id = game_data.get('id', 'unknown')
+        if game_data.get('status', 'unknown') == 'finished':
+            return
+        if client.game_id and client.game_id != game_id and not client._in_tournament:
+            return
+        client.legacy_game_data = game_data
+        if not client.game_id:
+            client.game_id = game_id
+    elif msg_type == "game_created":
+        client.game_id = message.get('gameId')
+    elif msg_type == "countdown":
+        client._tournament_countdown = message.get('value', 0)
+
+
+class MemoryScreen:
+    """Stand-in for a curses window that writes into a character grid instead of a terminal"""
+    def __init__(self, rows: int, cols: int) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.grid: List[List[str]] = [[' '] * cols for _ in range(rows)]
+        self.refreshes: int = 0
+        # curses only defines the line drawing characters after initscr()
+        for name in ("ACS_HLINE", "ACS_VLINE", "ACS_ULCORNER", "ACS_URCORNER", "ACS_LLCORNER", "ACS_LRCORNER"):
+            if not hasattr(curses, name):
+                setattr(curses, name, ord('+'))
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        return self.rows, self.cols
+
+    def clear(self) -> None:
+        for row in self.grid:
+            row[:] = [' '] * self.cols
+
+    def addch(self, y: int, x: int, glyph: Any) -> None:
+        if not (0 <= y < self.rows and 0 <= x < self.cols):
+            raise curses.error("addch() returned ERR")
+        self.grid[y][x] = glyph if isinstance(glyph, str) else chr(glyph)
+
+    def addstr(self, y: int, x: int, text: str) -> None:
+        if not (0 <= y < self.rows and 0 <= x < self.cols):
+            raise curses.error("addstr() returned ERR")
+        text = text[:self.cols - x]
+        self.grid[y][x:x + len(text)] = text
+
+    def refresh(self) -> None:
+        self.refreshes += 1
+
+
+class Results:
+    """Throughput of every benchmark in operations per second, higher is better"""
+    def __init__(self, repeat: int) -> None:
+        self.repeat = repeat
+        self.rates: Dict[str, float] = {}
+
+    def run(self, name: str, label: str, count: int, unit: str, body: Callable[[], None]) -> float:
+        """Run `body`, which processes `count` items, `repeat` times and keep the best rate"""
+        best = 0.0
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            body()
+            best = max(best, count / (time.perf_counter() - start))
+        self.rates[name] = best
+        print(f"  {label:<40} {best:>12,.0f} {unit}")
+        return best
+
+
+def run_timed(results: Results, name: str, label: str, messages: List[str], dispatch: Callable[[str], None]) -> float:
+    def body() -> None:
+        for raw in messages:
+            dispatch(raw)
+    return results.run(name, label, len(messages), "msg/s", body)
+
+
+async def bench_decode(results: Results, messages: List[str], source: str) -> None:
+    print(f"Message decode and dispatch ({len(messages)} {source} messages)")
+    # recorded streams differ from run to run, keep them apart from the synthetic baseline
+    prefix = "decode" if source == "synthetic" else f"decode.{source}"
+
+    client = GameClient("bench", "bench", "http://localhost")
+    run_timed(results, f"{prefix}.legacy", "before: json + elif chain", messages, lambda raw: legacy_dispatch(client, raw))
+
+    client = GameClient("bench", "bench", "http://localhost")
+    client.decoder = MessageDecoder(json.loads, "json")
+    run_timed(results, f"{prefix}.json", "after: json + handler registry", messages, client.dispatch_message)
+
+    if pong_cli.orjson is not None:
+        client = GameClient("bench", "bench", "http://localhost")
+        client.decoder = MessageDecoder(pong_cli.orjson.loads, "orjson")
+        run_timed(results, f"{prefix}.orjson", "after: orjson + handler registry", messages, client.dispatch_message)
+    else:
+        print("  (orjson not installed, skipping)")
+
+
+async def bench_update_game_state(results: Results, count: int) -> None:
+    print(f"update_game_state ({count} decoded game_state frames)")
+    games = [json.loads(game_state_message(tick))["game"] for tick in range(count)]
+    client = GameClient("bench", "bench", "http://localhost")
+
+    def body() -> None:
+        for game in games:
+            client.update_game_state(game)
+    results.run("update_game_state", "update_game_state", count, "states/s", body)
+
+
+async def bench_encode(results: Results, count: int) -> None:
+    print(f"Request encoding ({count} requests)")
+    client = GameClient("bench", "bench", "http://localhost")
+    client.user_data = {"username": "bench"}
+    payloads = [
+        {"type": "input", "pong_data": {"userId": "bench", "up": True}},
+        {"type": "input", "pong_data": {"userId": "bench", "up": False}},
+        {"type": "game_list"},
+        {"type": "create_game", "pong_data": {"playerAlias": "bench", "gameMode": "remote", "localOpponent": ""}},
+        {"type": "join_game", "pong_data": {"OpponentName": "bench", "OpponentAlias": "bench", "gameId": "bench-Game-1"}},
+    ]
+    requests = [payloads[index % len(payloads)] for index in range(count)]
+
+    def encode() -> None:
+        for payload in requests:
+            GameClient.to_pong_api_request(payload)
+    results.run("encode.to_pong_api_request", "to_pong_api_request", count, "req/s", encode)
+
+    directions = [index % 3 == 0 for index in range(count)]
+
+    def input_frames() -> None:
+        for up in directions:
+            client._encode_input_frames()[up]
+    results.run("encode.input_frames", "pre-encoded input frames", count, "req/s", input_frames)
+
+
+async def bench_logging(results: Results, count: int) -> None:
+    print(f"Per-frame log site ({count} calls)")
+    data = game_state_message(0)
+    bench_logger = logging.getLogger("bench_pong_cli")
+    bench_logger.propagate = False
+    # main() disables logging for the other benchmarks
+    logging.disable(logging.NOTSET)
+    with tempfile.TemporaryDirectory() as directory:
+        file_handler = logging.FileHandler(Path(directory) / "bench.log")
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+        def fstring() -> None:
+            for _ in range(count):
+                bench_logger.debug(f"Received WebSocket message: {data[:100]}...")
+
+        def lazy() -> None:
+            for _ in range(count):
+                bench_logger.debug("Received WebSocket message: %.100s...", data)
+
+        rate_limited = RateLimitedLog(bench_logger, logging.DEBUG)
+
+        def limited() -> None:
+            for _ in range(count):
+                rate_limited("Received WebSocket message: %.100s...", data)
+
+        bench_logger.setLevel(logging.DEBUG)
+        bench_logger.addHandler(file_handler)
+        results.run("log.file", "before: f-string written to the file", count, "calls/s", fstring)
+        bench_logger.removeHandler(file_handler)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        bench_logger.addHandler(LogQueueHandler(log_queue))
+        results.run("log.queue", "after: lazy record put on the queue", count, "calls/s", lazy)
+        results.run("log.rate_limited", "after: rate-limited", count, "calls/s", limited)
+
+        bench_logger.setLevel(logging.INFO)
+        results.run("log.disabled.fstring", "below the level: f-string", count, "calls/s", fstring)
+        results.run("log.disabled.lazy", "below the level: lazy", count, "calls/s", lazy)
+        listener.stop()
+        file_handler.close()
+    logging.disable(logging.CRITICAL)
+
+
+def draw_frame(
+    renderer: GameRenderer, state: LiveGameState, instructions: str, max_score: int, frame_rate: str
+) -> None:
+    """One PongCli.game_screen frame without interpolation, prediction or HUD"""
+    renderer.draw_frame(
+        f"Game ID: {state.id} | Max Score: {max_score}", instructions, state, frame_rate,
+        state.left_score, state.right_score, ["", ""],
+        (state.ball_x, state.ball_y, state.left_paddle_y, state.right_paddle_y),
+    )
+    renderer.present()
+
+
+async def bench_render(results: Results, count: int, rows: int, cols: int) -> None:
+    print(f"game_screen frame render ({count} frames, {cols}x{rows} in-memory screen)")
+    states: List[LiveGameState] = []
+    for tick in range(count):
+        state = LiveGameState()
+        state.update_from_dict(json.loads(game_state_message(tick))["game"])
+        states.append(state)
+    instructions = pong_cli.PongCli.GAME_INSTRUCTIONS
+    frame_rate = FramePacer(0.0).status()
+    modes = [
+        ("render.frame", "frame (changed cells only)", GameRenderer),
+        ("render.frame.half_blocks", "frame with half blocks", HalfBlockRenderer),
+    ]
+    for name, label, renderer_class in modes:
+        screen = MemoryScreen(rows, cols)
+        renderer = renderer_class(screen, rows - 1, cols - 1)
+
+        def body() -> None:
+            renderer.draw_field()
+            for state in states:
+                draw_frame(renderer, state, instructions, 10, frame_rate)
+        rate = results.run(name, label, count, "frames/s", body)
+        cells, written = renderer.stats.per_frame()
+        print(f"  {'':<40} {1e6 / rate:>12.1f} µs/frame, {cells:.1f} cells / {written:.1f} bytes per frame")
+
+
+async def count_allocations(messages: List[str], dispatch: Callable[[str], None]) -> Tuple[float, float]:
+    """
+    Feed `messages` to `dispatch` one tick at a time. Returns the mean per tick
+    of the traced memory peak above the start of the tick, which includes the
+    short-lived objects of decoding, and of the blocks still allocated after it.
+    """
+    peak_bytes = 0
+    retained_blocks = 0
+    tracemalloc.start()
+    for raw in messages:
+        # run what the tick handed to the event loop, as the UI loop would
+        await asyncio.sleep(0)
+        blocks = sys.getallocatedblocks()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        dispatch(raw)
+        _, peak = tracemalloc.get_traced_memory()
+        retained_blocks += sys.getallocatedblocks() - blocks
+        peak_bytes += peak - current
+    tracemalloc.stop()
+    return peak_bytes / len(messages), retained_blocks / len(messages)
+
+
+async def bench_allocations(ticks: int) -> None:
+    print(f"Game state allocations per tick ({ticks} game_state frames)")
+    messages = [game_state_message(tick) for tick in range(ticks)]
+
+    def report(label: str, peak: float, retained: float) -> None:
+        print(f"  {label:<40} {peak:>8.0f} bytes peak {retained:>6.1f} blocks left after the tick")
+
+    client = GameClient("bench", "bench", "http://localhost")
+    report("before: dict-of-dicts per tick", *await count_allocations(messages, lambda raw: legacy_dispatch(client, raw)))
+
+    client = GameClient("bench", "bench", "http://localhost")
+    report("after: model updated in place", *await count_allocations(messages, client.dispatch_message))
+
+    # the default mode: the network thread hands a copy of every state and a wakeup
+    # callback to the UI loop, which frees them once it has run
+    client = GameClient("bench", "bench", "http://localhost")
+    client.ui_loop = asyncio.get_running_loop()
+    report("after: threaded, snapshot per tick", *await count_allocations(messages, client.dispatch_message))
+
+
+def load_baseline(path: Path) -> Optional[Dict[str, float]]:
+    try:
+        with open(path) as f:
+            return json.load(f)["results"]
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(path: Path, results: Results) -> None:
+    with open(path, "w") as f:
+        json.dump({
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results.rates,
+        }, f, indent=2)
+        f.write("\n")
+
+
+def compare(results: Results, baseline: Dict[str, float], threshold: float) -> List[str]:
+    """Print the change against the baseline and return the names of the benchmarks that regressed"""
+    print(f"Compared to baseline (regression threshold {threshold:.0%})")
+    regressions: List[str] = []
+    for name, rate in results.rates.items():
+        previous = baseline.get(name)
+        if not previous:
+            print(f"  {name:<40} {'new':>12}")
+            continue
+        change = rate / previous - 1
+        flag = ""
+        if change < -threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"  {name:<40} {change:>+12.1%}{flag}")
+    return regressions
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks for the pong_cli.py hot paths")
+    parser.add_argument("--messages", type=int, default=200_000, help="number of messages per decode run")
+    parser.add_argument("--ticks", type=int, default=10_000, help="number of game_state frames per allocation run")
+    parser.add_argument(
+        "--recording", type=Path, metavar="FILE",
+        help="decode the frames of a recorded session instead of the synthetic stream"
+    )
+    parser.add_argument("--frames", type=int, default=5_000, help="number of frames per render run")
+    parser.add_argument("--screen", default="120x40", metavar="COLSxROWS", help="size of the in-memory screen")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, the best one counts")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, metavar="FILE", help="baseline results (JSON)")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="flag benchmarks slower than the baseline by more than this fraction (default: %(default)s)"
+    )
+    args = parser.parse_args()
+    cols, rows = (int(value) for value in args.screen.split("x"))
+    # measure the code paths themselves, not the log file
+    logging.disable(logging.CRITICAL)
+
+    results = Results(args.repeat)
+    if args.recording:
+        await bench_decode(results, recorded_stream(args.recording, args.messages), "recorded")
+    else:
+        await bench_decode(results, message_stream(args.messages), "synthetic")
+    await bench_update_game_state(results, args.messages)
+    await bench_encode(results, args.messages)
+    await bench_render(results, args.frames, rows, cols)
+    await bench_logging(results, args.messages)
+    await bench_allocations(args.ticks)
+
+    baseline = None if args.save_baseline else load_baseline(args.baseline)
+    if baseline is None:
+        save_baseline(args.baseline, results)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Stand-in for the Node backend, for benchmarking and load testing pong_cli.py offline.
+
+Speaks the parts of the protocol the cli uses: sign-in, the JWT access token
+endpoints and the pong websocket. Game messages have the same shapes as
+backend/src/api/pong/PongMessages.ts and are serialized like JSON.stringify.
+Any username signs in, users are created on first sign-in.
+
+Usage:
+```
+python3 mock_backend.py [--port 8443] [--tick-rate 30] [--payload-padding 0] [--certfile cert.pem --keyfile key.pem]
+python3 pong_cli.py http://localhost:8443
+```
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import math
+import random
+import secrets
+import ssl
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from aiohttp import WSMsgType, web
+
+
+def compact_json(data: Any) -> str:
+    """Serialize like JSON.stringify: no whitespace, keys in insertion order"""
+    return json.dumps(data, separators=(",", ":"))
+
+
+def b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def b64url_decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class TokenSigner:
+    """HS256 JSON web tokens, like jsonwebtoken's sign/verify in backend/src/api/jwt.ts"""
+    def __init__(self, secret: bytes) -> None:
+        self.secret = secret
+
+    def sign(self, payload: Dict[str, Any], expires_in: float) -> str:
+        now = int(time.time())
+        claims = {**payload, "iat": now, "exp": now + int(expires_in)}
+        header = b64url(compact_json({"alg": "HS256", "typ": "JWT"}).encode())
+        body = b64url(compact_json(claims).encode())
+        signature = hmac.new(self.secret, f"{header}.{body}".encode(), hashlib.sha256).digest()
+        return f"{header}.{body}.{b64url(signature)}"
+
+    def verify(self, token: str) -> Optional[Dict[str, Any]]:
+        """Claims of a token with a valid signature that has not expired, None otherwise"""
+        try:
+            header, body, signature = token.split(".")
+            expected = hmac.new(self.secret, f"{header}.{body}".encode(), hashlib.sha256).digest()
+            if not hmac.compare_digest(expected, b64url_decode(signature)):
+                return None
+            claims = json.loads(b64url_decode(body))
+        except ValueError:
+            return None
+        if claims.get("exp", 0) <= time.time():
+            return None
+        return claims
+
+
+@dataclass
+class MockUser:
+    id: str
+    username: str
+    refresh_token: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The UserStateType of backend/src/api/sign-in/sign-in.ts"""
+        return {
+            "id": self.id,
+            "email": f"{self.username}@mock.local",
+            "username": self.username,
+            "isSignedIn": True,
+            "avatar": "",
+        }
+
+
+@dataclass
+class MockGame:
+    """A remote game between two websocket users, simulated like backend/src/api/pong/PongGame.ts"""
+    id: str
+    left_name: str
+    left_alias: str
+    max_score: int
+    right_name: str = ""
+    right_alias: str = ""
+    state: str = "waiting"
+    ball_x: float = 0.5
+    ball_y: float = 0.5
+    ball_dx: float = 0.0
+    ball_dy: float = 0.0
+    left_y: float = 0.4
+    right_y: float = 0.4
+    left_score: int = 0
+    right_score: int = 0
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    PADDLE_HEIGHT = 0.2
+    PADDLE_SPEED = 0.01
+
+    def serve(self, towards_left: bool) -> None:
+        self.ball_x, self.ball_y = 0.5, 0.5
+        angle = random.uniform(-math.pi / 4, math.pi / 4)
+        speed = 0.012
+        self.ball_dx = -speed * math.cos(angle) if towards_left else speed * math.cos(angle)
+        self.ball_dy = speed * math.sin(angle)
+
+    def move_paddle(self, username: str, up: bool) -> None:
+        """Like PongGamePaddle.updatePos: moves that would leave the field are rejected"""
+        step = -self.PADDLE_SPEED if up else self.PADDLE_SPEED
+        if username == self.left_name:
+            if 0 <= self.left_y + step <= 1 - self.PADDLE_HEIGHT:
+                self.left_y += step
+        elif username == self.right_name:
+            if 0 <= self.right_y + step <= 1 - self.PADDLE_HEIGHT:
+                self.right_y += step
+
+    def update(self) -> None:
+        self.ball_x += self.ball_dx
+        self.ball_y += self.ball_dy
+        if self.ball_y <= 0 or self.ball_y >= 1:
+            self.ball_dy = -self.ball_dy
+            self.ball_y = min(max(self.ball_y, 0.0), 1.0)
+        if self.ball_x <= 0.01:
+            if self.left_y <= self.ball_y <= self.left_y + self.PADDLE_HEIGHT:
+                self.ball_dx = abs(self.ball_dx)
+            else:
+                self.right_score += 1
+                self.serve(towards_left=True)
+        elif self.ball_x >= 0.99:
+            if self.right_y <= self.ball_y <= self.right_y + self.PADDLE_HEIGHT:
+                self.ball_dx = -abs(self.ball_dx)
+            else:
+                self.left_score += 1
+                self.serve(towards_left=False)
+        if max(self.left_score, self.right_score) >= self.max_score:
+            self.state = "finished"
+
+    def state_message(self, padding: str) -> str:
+        game: Dict[str, Any] = {
+            "id": self.id,
+            "status": self.state,
+            "ball": {"x": self.ball_x, "y": self.ball_y},
+            "leftPaddle": {"topPoint": {"x": 0, "y": self.left_y}, "height": self.PADDLE_HEIGHT},
+            "rightPaddle": {"topPoint": {"x": 0.99, "y": self.right_y}, "height": self.PADDLE_HEIGHT},
+            "lastUpdateTime": int(time.time() * 1000),
+            "gameMode": "remote",
+            "maxScore": self.max_score,
+            "scores": [
+                {"alias": self.left_alias, "score": self.left_score},
+                {"alias": self.right_alias, "score": self.right_score},
+            ],
+            "countdown": 5,
+        }
+        if padding:
+            game["padding"] = padding
+        return compact_json({"target_endpoint": "pong-api", "type": "game_state", "game": game})
+
+
+class MockBackend:
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.signer = TokenSigner(secrets.token_bytes(32))
+        self.users: Dict[str, MockUser] = {}
+        self.users_by_id: Dict[str, MockUser] = {}
+        self.sockets: Dict[str, web.WebSocketResponse] = {}
+        # games keyed by the usernames of both players, like currentGames in PongMsgHandler.ts
+        self.games: Dict[str, MockGame] = {}
+        self.padding: str = "x" * args.payload_padding
+        self.stats: Dict[str, int] = {"sign_ins": 0, "token_refreshes": 0, "validations": 0, "websockets": 0, "games": 0, "frames": 0, "drops": 0}
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.add_routes([
+            web.post("/api/sign-in", self.sign_in),
+            web.get("/api/ws-token", self.ws_token),
+            web.post("/api/validate-access-token", self.validate_access_token),
+            web.post("/api/generate-new-access-token", self.generate_new_access_token),
+            web.get("/ws", self.websocket),
+        ])
+        return app
+
+    def set_token_cookies(self, response: web.Response, user: MockUser, refresh: bool) -> None:
+        access_token = self.signer.sign({"userId": user.id}, self.args.access_token_ttl)
+        response.set_cookie("accesstoken", access_token, httponly=True, max_age=int(self.args.access_token_ttl))
+        if refresh:
+            user.refresh_token = self.signer.sign({"userId": user.id, "nonce": secrets.token_hex(4)}, 24 * 3600)
+            response.set_cookie("refreshtoken", user.refresh_token, httponly=True, max_age=3 * 24 * 3600)
+
+    def user_from_refresh_cookie(self, request: web.Request) -> Optional[MockUser]:
+        refresh_token = request.cookies.get("refreshtoken", "")
+        claims = self.signer.verify(refresh_token) if refresh_token else None
+        user = self.users_by_id.get(claims["userId"]) if claims else None
+        if user is None or user.refresh_token != refresh_token:
+            return None
+        return user
+
+    async def sign_in(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        username = str(body.get("usernameOrEmail", "")).strip()
+        password = str(body.get("password", "")).strip()
+        if not username or not password:
+            return web.json_response({"errorMessage": "Invalid input", "user": None})
+        if self.args.password and password != self.args.password:
+            return web.json_response({"errorMessage": "Invalid username or password!", "user": None})
+        user = self.users.get(username)
+        if user is None:
+            user = MockUser(id=str(len(self.users) + 1), username=username)
+            self.users[username] = user
+            self.users_by_id[user.id] = user
+        self.stats["sign_ins"] += 1
+        response = web.json_response({"errorMessage": "", "user": user.to_dict()})
+        self.set_token_cookies(response, user, refresh=True)
+        return response
+
+    async def ws_token(self, request: web.Request) -> web.Response:
+        access_token = request.cookies.get("accesstoken")
+        if not access_token:
+            return web.json_response({"errorMessage": "No access token found", "token": ""})
+        return web.json_response({"errorMessage": "", "token": access_token})
+
+    async def validate_access_token(self, request: web.Request) -> web.Response:
+        self.stats["validations"] += 1
+        empty = {"userId": "", "email": "", "username": "", "avatar": ""}
+        user = self.user_from_refresh_cookie(request)
+        if user is None:
+            return web.json_response({
+                "errorMessage": "User is not signed in!", "isRefreshTokenValid": False,
+                "isAccessTokenValid": False, "isNewAccessTokenNeeded": False, "isSignedIn": False, **empty,
+            })
+        if not self.signer.verify(request.cookies.get("accesstoken", "")):
+            return web.json_response({
+                "errorMessage": "Access token is invalid. Refresh token will be used to generate a new access token",
+                "isRefreshTokenValid": True, "isAccessTokenValid": False, "isNewAccessTokenNeeded": True,
+                "isSignedIn": False, **empty,
+            })
+        profile = user.to_dict()
+        return web.json_response({
+            "errorMessage": "", "isRefreshTokenValid": True, "isAccessTokenValid": True,
+            "isNewAccessTokenNeeded": False, "isSignedIn": True, "userId": user.id,
+            "email": profile["email"], "username": user.username, "avatar": "",
+        })
+
+    async def generate_new_access_token(self, request: web.Request) -> web.Response:
+        user = self.user_from_refresh_cookie(request)
+        if user is None:
+            return web.json_response({
+                "errorMessage": "No cookie refresh token. User is not signed in. Redirecting to homepage ...",
+                "userId": "", "email": "", "username": "", "isSignedIn": False, "avatar": "",
+            })
+        self.stats["token_refreshes"] += 1
+        profile = user.to_dict()
+        response = web.json_response({
+            "errorMessage": "", "userId": user.id, "email": profile["email"],
+            "username": user.username, "isSignedIn": True, "avatar": "",
+        })
+        self.set_token_cookies(response, user, refresh=False)
+        return response
+
+    async def websocket(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        claims = self.signer.verify(request.query.get("token", ""))
+        user = self.users_by_id.get(claims["userId"]) if claims else None
+        if user is None:
+            await ws.close(code=4002, message=b"Invalid Token")
+            return ws
+        if request.query.get("type") != "pong":
+            await ws.close(code=4004, message=b"Missing Connection Type")
+            return ws
+        self.sockets[user.username] = ws
+        self.stats["websockets"] += 1
+        try:
+            async for msg in ws:
+                if msg.type == WSMsgType.TEXT:
+                    await self.handle_message(user.username, msg.data)
+                elif msg.type == WSMsgType.ERROR:
+                    break
+        finally:
+            if self.sockets.get(user.username) is ws:
+                del self.sockets[user.username]
+                game = self.games.get(user.username)
+                if game and game.state in ("countdown", "playing"):
+                    winner = game.right_name if user.username == game.left_name else game.left_name
+                    await self.end_game(game, winner, "Opponent disconnected")
+                elif game:
+                    self.remove_game(game)
+        return ws
+
+    async def send(self, username: str, message: str) -> None:
+        ws = self.sockets.get(username)
+        if ws is None or ws.closed:
+            return
+        try:
+            await ws.send_str(message)
+        except ConnectionError:
+            # the reader of this socket cleans up
+            pass
+
+    async def handle_message(self, username: str, raw: str) -> None:
+        try:
+            parsed = json.loads(raw)
+        except ValueError:
+            return
+        if parsed.get("target_endpoint") != "pong-api":
+            return
+        payload = parsed.get("payload") or {}
+        pong_data = payload.get("pong_data") or {}
+        msg_type = payload.get("type")
+        if msg_type == "input":
+            game = self.games.get(username)
+            if game and game.state == "playing" and isinstance(pong_data.get("up"), bool):
+                game.move_paddle(username, pong_data["up"])
+        elif msg_type == "game_list":
+            games = [
+                {"id": game.id, "owner": owner, "alias": game.left_alias, "state": game.state}
+                for owner, game in self.games.items() if game.state == "waiting"
+            ]
+            await self.send(username, compact_json({"target_endpoint": "pong-api", "type": "game_list", "games": games}))
+        elif msg_type == "create_game":
+            game = MockGame(
+                id=f"{username}-Game-{int(time.time() * 1000)}", left_name=username,
+                left_alias=pong_data.get("playerAlias", username), max_score=self.args.max_score,
+            )
+            self.games[username] = game
+            await self.send(username, compact_json({"target_endpoint": "pong-api", "type": "game_created", "gameId": game.id}))
+        elif msg_type == "join_game":
+            for game in list(self.games.values()):
+                if game.id == pong_data.get("gameId") and game.state == "waiting" and game.left_name != username:
+                    game.right_name = username
+                    game.right_alias = pong_data.get("OpponentAlias", username)
+                    self.games[username] = game
+                    game.task = asyncio.create_task(self.run_game(game))
+                    break
+
+    async def run_game(self, game: MockGame) -> None:
+        game.state = "countdown"
+        countdown = compact_json({"target_endpoint": "pong-api", "type": "countdown", "value": self.args.countdown})
+        await self.send(game.left_name, countdown)
+        await self.send(game.right_name, countdown)
+        await asyncio.sleep(self.args.countdown)
+        game.state = "playing"
+        game.serve(towards_left=random.random() < 0.5)
+        self.stats["games"] += 1
+        interval = 1.0 / self.args.tick_rate
+        next_tick = time.monotonic()
+        drop_at = next_tick + self.args.drop_after if self.args.drop_after is not None else math.inf
+        while game.state == "playing":
+            if time.monotonic() >= drop_at:
+                drop_at = math.inf
+                await self.drop_socket(game.left_name)
+                continue
+            game.update()
+            message = game.state_message(self.padding)
+            await self.send(game.left_name, message)
+            await self.send(game.right_name, message)
+            self.stats["frames"] += 2
+            if game.state == "finished":
+                winner = game.left_name if game.left_score > game.right_score else game.right_name
+                await self.end_game(game, winner, f"{winner} won")
+                return
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+
+    async def end_game(self, game: MockGame, winner: str, message: str) -> None:
+        """Like endOfGame in PongMsgHandler.ts"""
+        game.state = "finished"
+        game_over = compact_json({
+            "target_endpoint": "pong-api",
+            "type": "game_over",
+            "pong_data": {
+                "gameId": game.id,
+                "winnerId": winner,
+                "message": message,
+                "finalScore": {"left": game.left_score, "right": game.right_score},
+            },
+        })
+        await self.send(game.left_name, game_over)
+        await self.send(game.right_name, game_over)
+        self.remove_game(game)
+        if game.task and game.task is not asyncio.current_task():
+            game.task.cancel()
+
+    async def drop_socket(self, username: str) -> None:
+        """Fault injection: close a player's websocket like a restarting server would"""
+        ws = self.sockets.get(username)
+        if ws is not None and not ws.closed:
+            self.stats["drops"] += 1
+            print(f"dropping the websocket of {username}", flush=True)
+            await ws.close(code=1012, message=b"Service Restart")
+
+    def remove_game(self, game: MockGame) -> None:
+        for name in (game.left_name, game.right_name):
+            if self.games.get(name) is game:
+                del self.games[name]
+
+    async def report(self) -> None:
+        while True:
+            await asyncio.sleep(self.args.report_interval)
+            print(
+                f"users {len(self.users)}, sockets {len(self.sockets)}, games running "
+                f"{len({id(game) for game in self.games.values() if game.state == 'playing'})}, {self.stats}",
+                flush=True,
+            )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Mock Pong backend for offline benchmarks of pong_cli.py")
+    parser.add_argument("--host", default="localhost", help="interface to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8443, help="port to listen on (default: %(default)s)")
+    parser.add_argument("--tick-rate", type=float, default=30.0, help="game_state messages per second (default: %(default)s)")
+    parser.add_argument(
+        "--payload-padding", type=int, default=0, metavar="BYTES",
+        help="extra bytes in every game_state message, to test larger payloads"
+    )
+    parser.add_argument("--max-score", type=int, default=10, help="score that ends a game (default: %(default)s)")
+    parser.add_argument("--countdown", type=int, default=2, help="seconds between joining and playing (default: %(default)s)")
+    parser.add_argument(
+        "--access-token-ttl", type=float, default=15 * 60, metavar="SECONDS",
+        help="lifetime of access tokens (default: %(default)s, like the backend)"
+    )
+    parser.add_argument("--password", default="", help="only accept this password (default: any)")
+    parser.add_argument("--certfile", help="serve https with this certificate (PEM)")
+    parser.add_argument("--keyfile", help="private key of --certfile")
+    parser.add_argument(
+        "--drop-after", type=float, metavar="SECONDS",
+        help="fault injection: close the websocket of the game creator this long into every match"
+    )
+    parser.add_argument("--report-interval", type=float, default=10.0, metavar="SECONDS", help="time between status lines")
+    return parser.parse_args(argv)
+
+
+async def main() -> None:
+    args = parse_args()
+    backend = MockBackend(args)
+    runner = web.AppRunner(backend.app())
+    await runner.setup()
+    ssl_context: Optional[ssl.SSLContext] = None
+    if args.certfile:
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(args.certfile, args.keyfile)
+    await web.TCPSite(runner, args.host, args.port, ssl_context=ssl_context).start()
+    scheme = "https" if ssl_context else "http"
+    print(f"Mock backend listening on {scheme}://{args.host}:{args.port}", flush=True)
+    try:
+        await backend.report()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
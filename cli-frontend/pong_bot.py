@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""
+Headless load generator for the Pong backend.
+
+Signs in N players with GameClient, pairs them up (the first player of a pair
+creates a game, the second one joins it) and moves both paddles towards the
+ball until the run ends. Reports games started per second, game_state frames
+received per second per client and the gaps between consecutive frames.
+
+With --workers the players are sharded over several processes, each running
+its own event loop. The workers stream their counters and histograms to the
+launching process, which merges them into the live summary and final report.
+
+Usage:
+```
+python3 pong_bot.py <backend url> --players 20 --user-prefix bot --password 'Bot12345!'
+python3 pong_bot.py <backend url> --players 2000 --workers 0  # one worker per core
+```
+The accounts <prefix>0 ... <prefix>N-1 have to exist on the backend, the
+backend keeps a single pong websocket per user.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import pong_cli
+from pong_cli import GameClient, LatencyHistogram, LiveGameState, TickScheduler
+
+
+@dataclass
+class BotStats:
+    """Counters of one simulated player, or of several merged together"""
+    players: int = 1
+    connected: int = 0
+    games_started: int = 0
+    games_finished: int = 0
+    frames: int = 0
+    errors: int = 0
+    # seconds spent in matches, the denominator of the per-client frame rate
+    playing_time: float = 0.0
+    # requests to the authentication endpoints after sign-in (token refreshes and checks)
+    auth_requests: int = 0
+    # websocket reconnects and the seconds the websockets were down
+    reconnects: int = 0
+    downtime: float = 0.0
+    frame_gaps: LatencyHistogram = field(default_factory=lambda: LatencyHistogram("Inter-frame gap"))
+
+    def merge(self, other: "BotStats") -> None:
+        self.players += other.players
+        self.connected += other.connected
+        self.games_started += other.games_started
+        self.games_finished += other.games_finished
+        self.frames += other.frames
+        self.errors += other.errors
+        self.playing_time += other.playing_time
+        self.auth_requests += other.auth_requests
+        self.reconnects += other.reconnects
+        self.downtime += other.downtime
+        self.frame_gaps.merge(other.frame_gaps)
+
+    @property
+    def frames_per_client(self) -> float:
+        """game_state frames per second and client while in a match"""
+        return self.frames / self.playing_time if self.playing_time > 0 else 0.0
+
+    def auth_requests_per_hour(self, elapsed: float) -> float:
+        """Authentication requests per hour and connected client, after sign-in"""
+        client_hours = self.connected * elapsed / 3600
+        return self.auth_requests / client_hours if client_hours > 0 else 0.0
+
+    def summary(self, elapsed: float) -> str:
+        rate = self.games_started / elapsed if elapsed > 0 else 0.0
+        return (
+            f"players {self.connected}/{self.players} connected | "
+            f"games started {rate:.2f}/s ({self.games_started}, {self.games_finished} finished) | "
+            f"frames {self.frames_per_client:.1f}/s per client ({self.frames} total) | "
+            f"gap p50 {self.frame_gaps.percentile(50) * 1000:.1f}ms "
+            f"p99 {self.frame_gaps.percentile(99) * 1000:.1f}ms | "
+            f"auth {self.auth_requests_per_hour(elapsed):.1f}/h per client | "
+            f"reconnects {self.reconnects} ({self.downtime:.1f}s down) | errors {self.errors}"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain data for sending the stats of a worker process to the coordinator"""
+        return {
+            "players": self.players,
+            "connected": self.connected,
+            "games_started": self.games_started,
+            "games_finished": self.games_finished,
+            "frames": self.frames,
+            "errors": self.errors,
+            "playing_time": self.playing_time,
+            "auth_requests": self.auth_requests,
+            "reconnects": self.reconnects,
+            "downtime": self.downtime,
+            "frame_gaps": self.frame_gaps.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BotStats":
+        return cls(**{**data, "frame_gaps": LatencyHistogram.from_dict(data["frame_gaps"])})
+
+    def to_report(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            "elapsed_s": round(elapsed, 1),
+            "players": self.players,
+            "connected": self.connected,
+            "games_started": self.games_started,
+            "games_started_per_s": round(self.games_started / elapsed, 3) if elapsed > 0 else 0.0,
+            "games_finished": self.games_finished,
+            "frames": self.frames,
+            "frames_per_s_per_client": round(self.frames_per_client, 2),
+            "frame_gap_ms": self.frame_gaps.percentiles_ms(),
+            "auth_requests": self.auth_requests,
+            "auth_requests_per_h_per_client": round(self.auth_requests_per_hour(elapsed), 1),
+            "reconnects": self.reconnects,
+            "downtime_s": round(self.downtime, 2),
+            "errors": self.errors,
+        }
+
+
+class BotClient(GameClient):
+    """GameClient that counts game_state frames and steers its paddle towards the ball"""
+    # dead zone around the aim point, avoids jittering around the ball
+    STEER_MARGIN: float = 0.02
+
+    def __init__(self, username: str, password: str, url: str, aim_error: float = 0.0) -> None:
+        super().__init__(username, password, url)
+        self.stats = BotStats()
+        # monotonic start of the current match, None between matches
+        self.playing_since: Optional[float] = None
+        # the paddle aims this far off the ball, rerolled whenever the ball turns towards it
+        self.aim_error = aim_error
+        self._aim_offset: float = 0.0
+        self._ball_incoming: bool = False
+        self._last_ball_x: Optional[float] = None
+        self._last_frame_at: Optional[float] = None
+
+    def update_game_state(self, game_data: Dict[str, Any]) -> None:
+        version = self.game_state_version
+        super().update_game_state(game_data)
+        state = self.game_data
+        if state is None or self.game_state_version == version:
+            # ignored, e.g. a state of another game
+            return
+        now = state.received_at
+        if self._last_frame_at is not None:
+            self.stats.frame_gaps.record(now - self._last_frame_at)
+        self._last_frame_at = now
+        self.stats.frames += 1
+        if self.input_active and self.player_side:
+            self._steer(state)
+
+    def _steer(self, state: LiveGameState) -> None:
+        left = self.player_side == "left"
+        if self._last_ball_x is not None:
+            was_incoming = self._ball_incoming
+            self._ball_incoming = state.ball_x < self._last_ball_x if left else state.ball_x > self._last_ball_x
+            if self._ball_incoming and not was_incoming:
+                self._aim_offset = random.uniform(-self.aim_error, self.aim_error)
+        self._last_ball_x = state.ball_x
+        own_y = state.left_paddle_y if left else state.right_paddle_y
+        center = own_y + state.paddle_height / 2
+        target = state.ball_y + self._aim_offset
+        if target < center - self.STEER_MARGIN:
+            self.set_input_state(up=True, down=False)
+        elif target > center + self.STEER_MARGIN:
+            self.set_input_state(up=False, down=True)
+        else:
+            self.set_input_state(up=False, down=False)
+
+    def clear_game_state(self) -> None:
+        super().clear_game_state()
+        self._last_frame_at = None
+        self._last_ball_x = None
+        self._ball_incoming = False
+
+
+class BotPlayer:
+    def __init__(self, index: int, client: BotClient) -> None:
+        self.index = index
+        self.client = client
+        self.alias = f"{client.username}-alias"
+        self._tasks: List[asyncio.Task] = []
+
+    async def connect(self) -> None:
+        """Sign in and wait until the pong websocket is open"""
+        client = self.client
+        network = asyncio.create_task(client.start())
+        self._tasks = [network, asyncio.create_task(client.consume_backend_messages())]
+        connected = asyncio.create_task(client.ws_connected.wait())
+        try:
+            await asyncio.wait((network, connected), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            connected.cancel()
+        if not client.ws_connected.is_set():
+            network.result()
+            raise ConnectionError(f"{client.username}: network task ended before the websocket opened")
+        client.stats.connected = 1
+
+    async def play(self, creator: bool, stop: asyncio.Event) -> None:
+        """Play the current game until it is over or the run is stopped"""
+        client = self.client
+        subscription = client.subscribe_game_state()
+        try:
+            while not stop.is_set():
+                await subscription.wait()
+                _, state = subscription.take()
+                if client.get_error():
+                    client.stats.errors += 1
+                    break
+                if client._game_over_data:
+                    # both players see the game over, count the game once like games_started
+                    if creator:
+                        client.stats.games_finished += 1
+                    break
+                if state and state.status == 'playing' and client.playing_since is None:
+                    client.playing_since = time.monotonic()
+                    await client.start_continuous_input()
+                    if creator:
+                        client.stats.games_started += 1
+        finally:
+            subscription.close()
+            await client.stop_continuous_input()
+            if client.playing_since is not None:
+                client.stats.playing_time += time.monotonic() - client.playing_since
+                client.playing_since = None
+            client.clear_game_state()
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.client.close()
+
+
+class LoadTest:
+    """Runs pairs of BotPlayers against one backend from a single event loop"""
+    def __init__(self, args: argparse.Namespace, on_report: Optional[Callable[[BotStats, float], None]] = None) -> None:
+        self.args = args
+        # called with the current stats and elapsed time every report interval
+        self.on_report = on_report or print_summary
+        self.scheduler = TickScheduler()
+        self.stop = asyncio.Event()
+        self.players: List[BotPlayer] = []
+        for index in range(args.first_index, args.first_index + args.players):
+            client = BotClient(f"{args.user_prefix}{index}", args.password, args.backend_url, args.aim_error)
+            # one clock for all players, so their input ticks share wakeups
+            client.scheduler = self.scheduler
+            self.players.append(BotPlayer(index, client))
+        self.started_at: float = time.monotonic()
+        self.stopped_at: Optional[float] = None
+
+    def stats(self) -> BotStats:
+        now = time.monotonic()
+        total = BotStats(players=0)
+        for player in self.players:
+            total.merge(player.client.stats)
+            client = player.client
+            total.auth_requests += sum(client.auth_requests.values()) - client.startup_auth_requests
+            total.reconnects += client.reconnects
+            total.downtime += client.downtime
+            if player.client.playing_since is not None:
+                # count the running match as well
+                total.playing_time += now - player.client.playing_since
+        return total
+
+    def elapsed(self) -> float:
+        return (self.stopped_at or time.monotonic()) - self.started_at
+
+    async def connect(self, player: BotPlayer, delay: float) -> bool:
+        await asyncio.sleep(delay)
+        try:
+            await player.connect()
+            return True
+        except Exception as e:
+            player.client.stats.errors += 1
+            print(f"Player {player.client.username} failed to connect: {e}")
+            return False
+
+    async def run_pair(self, creator: BotPlayer, joiner: BotPlayer) -> None:
+        spread = self.args.ramp_up / max(1, len(self.players))
+        first_index = self.args.first_index
+        connected = await asyncio.gather(
+            self.connect(creator, (creator.index - first_index) * spread),
+            self.connect(joiner, (joiner.index - first_index) * spread),
+        )
+        if not all(connected):
+            return
+        while not self.stop.is_set():
+            game = await creator.client.create_and_wait_for_game("classic", 10, creator.alias)
+            if game is None:
+                creator.client.stats.errors += 1
+                # back off before trying again, the backend may be overloaded
+                try:
+                    await asyncio.wait_for(self.stop.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await joiner.client.join_game(game.id, joiner.alias)
+            await asyncio.gather(creator.play(True, self.stop), joiner.play(False, self.stop))
+
+    async def report(self) -> None:
+        ticker = self.scheduler.ticker(1 / self.args.report_interval, "bot-report")
+        try:
+            while not self.stop.is_set():
+                await ticker.wait()
+                self.on_report(self.stats(), self.elapsed())
+        finally:
+            ticker.cancel()
+
+    async def run(self) -> BotStats:
+        self.started_at = time.monotonic()
+        if self.args.record:
+            self.players[0].client.record_session(self.args.record)
+        pairs = [asyncio.create_task(self.run_pair(*self.players[i:i + 2])) for i in range(0, len(self.players) - 1, 2)]
+        reporter = asyncio.create_task(self.report())
+        try:
+            await asyncio.wait(pairs, timeout=self.args.duration)
+        finally:
+            self.stopped_at = time.monotonic()
+            self.stop.set()
+            for player in self.players:
+                # wake up the players that wait for the next game_state
+                player.client.publish_game_state()
+            await asyncio.wait(pairs, timeout=5)
+            for task in pairs + [reporter]:
+                task.cancel()
+            await asyncio.gather(*pairs, reporter, return_exceptions=True)
+            await asyncio.gather(*(player.close() for player in self.players), return_exceptions=True)
+            await self.scheduler.close()
+        return self.stats()
+
+
+def print_summary(stats: BotStats, elapsed: float) -> None:
+    print(f"[{elapsed:6.1f}s] {stats.summary(elapsed)}", flush=True)
+
+
+def raise_open_file_limit() -> None:
+    """Every player holds two sockets, lift the soft limit on open files as far as allowed"""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = hard if hard != resource.RLIM_INFINITY else max(soft, 1 << 16)
+    if soft < target:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+
+
+def setup_bot_logging(args: argparse.Namespace, rollover: bool) -> logging.handlers.QueueListener:
+    """
+    Log to the log file of pong_cli.py. All processes of a run append to the
+    same file, so it is rolled over once by the coordinator and never rotated
+    while the workers write to it.
+    """
+    listener = pong_cli.setup_logging(rollover=rollover, max_bytes=0)
+    if not args.verbose:
+        # per-player INFO logs would measure the log file instead of the backend
+        pong_cli.logger.setLevel(logging.WARNING)
+    return listener
+
+
+def run_worker(worker_id: int, args: argparse.Namespace, first_index: int, players: int, results: Any) -> None:
+    """Entry point of a worker process: plays one shard of the players and streams its stats to `results`"""
+    raise_open_file_limit()
+    # a forked worker inherits the queue of the coordinator's log, but not the thread writing it
+    log_listener = setup_bot_logging(args, rollover=False)
+    shard = argparse.Namespace(**{
+        **vars(args), "first_index": first_index, "players": players,
+        # only the first player of the whole run is recorded
+        "record": args.record if worker_id == 0 else None,
+    })
+
+    def send_stats(stats: BotStats, elapsed: float) -> None:
+        results.put(("stats", worker_id, stats.to_dict(), elapsed))
+
+    load_test = LoadTest(shard, on_report=send_stats)
+    try:
+        asyncio.run(load_test.run())
+    finally:
+        # always tell the coordinator this worker is done, even after an error
+        results.put(("done", worker_id, load_test.stats().to_dict(), load_test.elapsed()))
+        # worker processes exit without running atexit handlers
+        log_listener.stop()
+
+
+def run_sharded(args: argparse.Namespace) -> Tuple[BotStats, float, List[BotStats]]:
+    """
+    Start one worker process per shard of player pairs and merge what they report.
+    Returns the merged stats, the elapsed time and the stats of every worker.
+    """
+    pairs = args.players // 2
+    workers = min(args.workers or os.cpu_count() or 1, pairs)
+    results: Any = multiprocessing.Queue()
+    processes: List[multiprocessing.Process] = []
+    first_index = args.first_index
+    for worker_id in range(workers):
+        players = 2 * (pairs // workers + (1 if worker_id < pairs % workers else 0))
+        process = multiprocessing.Process(
+            target=run_worker, args=(worker_id, args, first_index, players, results), daemon=True
+        )
+        process.start()
+        processes.append(process)
+        first_index += players
+    print(f"Started {workers} workers for {args.players} players", flush=True)
+
+    started_at = time.monotonic()
+    next_report = started_at + args.report_interval
+    latest: Dict[int, BotStats] = {}
+    elapsed: Dict[int, float] = {}
+    done: set = set()
+    while len(done) < workers:
+        try:
+            kind, worker_id, data, worker_elapsed = results.get(timeout=max(0.05, next_report - time.monotonic()))
+            latest[worker_id] = BotStats.from_dict(data)
+            elapsed[worker_id] = worker_elapsed
+            if kind == "done":
+                done.add(worker_id)
+        except queue.Empty:
+            if not any(process.is_alive() for process in processes):
+                print(f"{workers - len(done)} workers exited without a final report", flush=True)
+                break
+        if time.monotonic() >= next_report:
+            next_report += args.report_interval
+            merged = merge_stats(latest.values())
+            print(f"[{time.monotonic() - started_at:6.1f}s] workers {len(latest)}/{workers} | {merged.summary(max(elapsed.values(), default=0.0))}", flush=True)
+    for process in processes:
+        process.join(timeout=5)
+    return merge_stats(latest.values()), max(elapsed.values(), default=0.0), [latest[worker_id] for worker_id in sorted(latest)]
+
+
+def merge_stats(shards: Any) -> BotStats:
+    total = BotStats(players=0)
+    for stats in shards:
+        total.merge(stats)
+    return total
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Headless Pong players for load testing the backend")
+    parser.add_argument("backend_url", help="URL of the backend, e.g. https://localhost:8443")
+    parser.add_argument("--players", type=int, default=2, help="number of simulated players, paired up into games")
+    parser.add_argument("--user-prefix", default="bot", help="players sign in as <prefix><index> (default: %(default)s)")
+    parser.add_argument("--first-index", type=int, default=0, help="index of the first player account")
+    parser.add_argument("--password", default="Bot12345!", help="password shared by all player accounts")
+    parser.add_argument("--duration", type=float, default=60.0, metavar="SECONDS", help="length of the run")
+    parser.add_argument(
+        "--aim-error", type=float, default=0.15,
+        help="how far off the ball the paddles aim, so games end (default: %(default)s, paddles are 0.2 high)"
+    )
+    parser.add_argument("--ramp-up", type=float, default=1.0, metavar="SECONDS", help="spread the sign-ins over this time")
+    parser.add_argument("--report-interval", type=float, default=5.0, metavar="SECONDS", help="time between live summaries")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="worker processes the players are sharded over, 0 for one per core (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--record", type=Path, metavar="FILE",
+        help="append the websocket frames of the first player to FILE (see pong_cli.py --replay)"
+    )
+    parser.add_argument("--json", action="store_true", help="print the final report as JSON")
+    parser.add_argument("--verbose", action="store_true", help="keep the INFO logs of pong_cli.py")
+    args = parser.parse_args()
+    if args.players < 2 or args.players % 2:
+        parser.error("--players must be an even number of at least 2")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    setup_bot_logging(args, rollover=True)
+    workers: List[BotStats] = []
+    if args.workers == 1:
+        raise_open_file_limit()
+        load_test = LoadTest(args)
+        stats = asyncio.run(load_test.run())
+        elapsed = load_test.elapsed()
+    else:
+        stats, elapsed, workers = run_sharded(args)
+    if args.json:
+        report = stats.to_report(elapsed)
+        if workers:
+            report["workers"] = [worker.to_report(elapsed) for worker in workers]
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"Final: {stats.summary(elapsed)}")
+        print(f"  {stats.frame_gaps.summary()}")
+        for worker_id, worker in enumerate(workers):
+            print(f"  worker {worker_id}: {worker.summary(elapsed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,34 +8,184 @@ import asyncio
 import traceback
 import ssl
 import logging
+import logging.handlers
+import argparse
+import atexit
+import queue
+import base64
+import math
+import random
+import threading
+import inspect
+from array import array
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Literal
+from typing import Any, Callable, Coroutine, Deque, Dict, List, Optional, Tuple, Literal, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 
 import aiohttp
 from aiohttp import ClientTimeout, TCPConnector, ClientSession
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+LOG_FILE: Path = Path(__file__).parent / "log_pong_cli.log"
+LOG_FILE_MAX_BYTES: int = 5 * 1024 * 1024
+LOG_FILE_BACKUPS: int = 3
+
+
+class LogQueueHandler(logging.handlers.QueueHandler):
+    """
+    Puts records on the queue as they are: the listener thread formats them,
+    so the event loops only pay for creating the record. Arguments are
+    formatted later and must not be mutated after the logging call.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class RateLimitedLog:
+    """
+    A log site that is hit on every frame, tick or key repeat. It emits at most
+    one record per `interval` seconds and counts the records skipped in between.
+    """
+    def __init__(self, logger: logging.Logger, level: int, interval: float = 1.0) -> None:
+        self.logger = logger
+        self.level = level
+        self.interval = interval
+        self._last: float = -math.inf
+        self.suppressed: int = 0
+
+    def __call__(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+        now = time.monotonic()
+        if now - self._last < self.interval:
+            self.suppressed += 1
+            return
+        self._last = now
+        if self.suppressed:
+            msg += " (%d similar records skipped)"
+            args = (*args, self.suppressed)
+            self.suppressed = 0
+        self.logger.log(self.level, msg, *args, stacklevel=2, **kwargs)
+
+
+def setup_logging(
+    level: Union[int, str] = logging.INFO, rollover: bool = True, max_bytes: int = LOG_FILE_MAX_BYTES
+) -> logging.handlers.QueueListener:
+    """
+    Log to LOG_FILE from a background thread. The event loops only put records
+    on a queue, so a slow disk never delays a frame or an input. With `rollover`
+    the log of the previous run is kept as log_pong_cli.log.1. The file is
+    rotated at `max_bytes`, 0 only appends (for several processes sharing it).
+
+    Call it once per process, forked processes do not inherit the listener
+    thread. The listener is stopped at exit; processes that end without running
+    atexit handlers, like multiprocessing workers, must stop it themselves.
+    """
+    file_handler = logging.handlers.RotatingFileHandler(
+        LOG_FILE, maxBytes=max_bytes, backupCount=LOG_FILE_BACKUPS, delay=True
+    )
+    if rollover and LOG_FILE.exists() and LOG_FILE.stat().st_size > 0:
+        file_handler.doRollover()
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    # stopping flushes the records that are still queued
+    atexit.register(listener.stop)
 
-def setup_logging() -> logging.Logger:
-    log_file = Path(__file__).parent / "log_pong_cli.log"
+    logging.basicConfig(level=level, handlers=[LogQueueHandler(log_queue)], force=True)
+    logger.info("Log file: %s", LOG_FILE)
+    return listener
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, mode='w'),
-        ],
-        force=True
-    )
 
-    logger = logging.getLogger('pong_cli')
-    logger.info("=== Pong CLI Application Started ===")
-    logger.info(f"Log file: {log_file}")
-    return logger
+logger = logging.getLogger('pong_cli')
+
+
+async def read_line(prompt: str) -> str:
+    """
+    input() on a daemon thread, so the event loop keeps running while the user
+    types and a pending prompt never keeps the process from exiting
+    """
+    loop = asyncio.get_running_loop()
+    line: asyncio.Future[str] = loop.create_future()
+
+    def deliver(callback: Callable[[], None]) -> None:
+        try:
+            loop.call_soon_threadsafe(callback)
+        except RuntimeError:
+            # the loop is already closed
+            pass
+
+    def read() -> None:
+        try:
+            text = input(prompt)
+        except EOFError as e:
+            deliver(lambda: line.done() or line.set_exception(e))
+            return
+        deliver(lambda: line.done() or line.set_result(text))
+
+    threading.Thread(target=read, name="read-line", daemon=True).start()
+    return await line
 
 
-logger = setup_logging()
+def jwt_claims(token: str) -> Dict[str, Any]:
+    """Claims of a JSON web token, read without verifying the signature (only the backend can)"""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
+
+class MessageDecoder:
+    """
+    Decodes raw websocket frames into dictionaries.
+    Uses orjson when it is installed and falls back to the stdlib json module.
+    """
+    # The backend serializes game_state frames with JSON.stringify in this key order
+    GAME_STATE_PREFIX: str = '{"target_endpoint":"pong-api","type":"game_state","game":'
+    _log_parse_error = RateLimitedLog(logger, logging.WARNING)
+
+    def __init__(self, loads: Optional[Callable[[Union[str, bytes]], Any]] = None, name: str = "custom") -> None:
+        if loads is not None:
+            self.loads, self.name = loads, name
+        elif orjson is not None:
+            self.loads, self.name = orjson.loads, "orjson"
+        else:
+            self.loads, self.name = json.loads, "json"
+
+    def decode(self, raw: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+        """Decode a frame, returning None if it is not a JSON object"""
+        try:
+            message = self.loads(raw)
+        except ValueError:
+            self._log_parse_error("Failed to parse message as JSON: %.100r", raw, exc_info=True)
+            return None
+        if not isinstance(message, dict):
+            logger.warning(f"Ignoring non-object message: {raw=}")
+            return None
+        return message
+
+    def decode_game_state(self, raw: str) -> Optional[Dict[str, Any]]:
+        """
+        Fast path for the most frequent frame: if `raw` is a game_state message,
+        decode only its `game` object. Returns None for every other frame.
+        """
+        if not raw.startswith(self.GAME_STATE_PREFIX) or raw[-1] != '}':
+            return None
+        try:
+            game = self.loads(raw[len(self.GAME_STATE_PREFIX):-1])
+        except ValueError:
+            return None
+        return game if isinstance(game, dict) else None
 
 
 @dataclass
@@ -123,6 +273,95 @@ class PongGame:
         """Convert lastUpdateTime to datetime"""
         return datetime.fromtimestamp(self.lastUpdateTime / 1000)
 
+    @classmethod
+    def from_live_state(cls, state: "LiveGameState") -> "PongGame":
+        """Create a PongGame from the live game state of the client"""
+        return cls(
+            id=state.id,
+            status=state.status,
+            ball=Ball(x=state.ball_x, y=state.ball_y),
+            leftPaddle=Paddle(topPoint=Point(x=0.0, y=state.left_paddle_y), height=state.paddle_height),
+            rightPaddle=Paddle(topPoint=Point(x=0.99, y=state.right_paddle_y), height=state.paddle_height),
+            lastUpdateTime=state.last_update_time,
+            gameMode="classic",
+            maxScore=state.max_score,
+            countdown=state.countdown
+        )
+
+
+class LiveGameState:
+    """
+    Compact model of the running game (GameStateData in PongMessages.ts).
+    Allocated once per match and updated in place from every game_state frame.
+    """
+    __slots__ = (
+        "id", "status", "ball_x", "ball_y", "left_paddle_y", "right_paddle_y", "paddle_height",
+        "left_score", "right_score", "countdown", "last_update_time", "max_score", "received_at",
+    )
+
+    def __init__(self) -> None:
+        self.id: str = "unknown"
+        self.status: str = "unknown"
+        self.ball_x: float = 0.5
+        self.ball_y: float = 0.5
+        self.left_paddle_y: float = 0.4
+        self.right_paddle_y: float = 0.4
+        self.paddle_height: float = 0.2
+        self.left_score: int = 0
+        self.right_score: int = 0
+        self.countdown: int = 0
+        self.last_update_time: int = 0
+        self.max_score: int = 10
+        # local monotonic time at which the last frame was applied
+        self.received_at: float = 0.0
+
+    def update_from_dict(self, game: Dict[str, Any]) -> None:
+        """Copy a decoded `game` object into this model, indexing the well-known shape directly"""
+        try:
+            ball, left, right, scores = game["ball"], game["leftPaddle"], game["rightPaddle"], game["scores"]
+            self.id = game["id"]
+            self.status = game["status"]
+            self.ball_x = ball["x"]
+            self.ball_y = ball["y"]
+            self.left_paddle_y = left["topPoint"]["y"]
+            self.right_paddle_y = right["topPoint"]["y"]
+            self.paddle_height = left["height"]
+            self.left_score = scores[0]["score"]
+            self.right_score = scores[1]["score"]
+            self.countdown = game.get("countdown") or 0
+            self.last_update_time = game["lastUpdateTime"]
+            self.max_score = game["maxScore"]
+        except (KeyError, IndexError, TypeError):
+            self._update_from_partial_dict(game)
+
+    def _update_from_partial_dict(self, game: Dict[str, Any]) -> None:
+        """Slow path for incomplete frames: fields that are missing keep their previous value"""
+        ball = game.get("ball") or {}
+        left = game.get("leftPaddle") or {}
+        right = game.get("rightPaddle") or {}
+        self.id = game.get("id", self.id)
+        self.status = game.get("status", self.status)
+        self.ball_x = ball.get("x", self.ball_x)
+        self.ball_y = ball.get("y", self.ball_y)
+        self.left_paddle_y = left.get("topPoint", {}).get("y", self.left_paddle_y)
+        self.right_paddle_y = right.get("topPoint", {}).get("y", self.right_paddle_y)
+        self.paddle_height = left.get("height", self.paddle_height)
+        scores = game.get("scores")
+        if isinstance(scores, list) and len(scores) >= 2:
+            self.left_score = scores[0].get("score", 0)
+            self.right_score = scores[1].get("score", 0)
+        self.countdown = game.get("countdown") or 0
+        self.last_update_time = game.get("lastUpdateTime", self.last_update_time)
+        self.max_score = game.get("maxScore", self.max_score)
+
+    def copy(self) -> "LiveGameState":
+        """Snapshot for another thread, which must not see the next frame's update half applied"""
+        snapshot = LiveGameState.__new__(LiveGameState)
+        for name in self.__slots__:
+            setattr(snapshot, name, getattr(self, name))
+        return snapshot
+
+
 @dataclass
 class TournamentPlayer:
     name: str
@@ -176,23 +415,816 @@ class Tournament:
         return len(self.players) == self.max_players and self.state == "waiting"
 
 
+class LatencyHistogram:
+    """
+    Fixed-size histogram of durations in seconds with logarithmic buckets
+    between `min_value` and `max_value`. Histograms with the same bounds can be merged.
+    """
+    def __init__(self, name: str, min_value: float = 1e-5, max_value: float = 10.0, buckets_per_decade: int = 20) -> None:
+        self.name = name
+        self.min_value = min_value
+        self.max_value = max_value
+        self.buckets_per_decade = buckets_per_decade
+        bucket_count = int(math.ceil(math.log10(max_value / min_value) * buckets_per_decade)) + 1
+        self.buckets: List[int] = [0] * bucket_count
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: float = math.inf
+        self.max: float = 0.0
+
+    def _bucket(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        index = int(math.log10(value / self.min_value) * self.buckets_per_decade) + 1
+        return min(index, len(self.buckets) - 1)
+
+    def _bucket_upper_bound(self, index: int) -> float:
+        return self.min_value * 10 ** (index / self.buckets_per_decade)
+
+    def record(self, value: float) -> None:
+        self.buckets[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        assert len(self.buckets) == len(other.buckets), "Cannot merge histograms with different buckets"
+        for index, count in enumerate(other.buckets):
+            self.buckets[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float:
+        """Upper bound of the bucket holding the given percentile, clamped to the observed range"""
+        if not self.count:
+            return 0.0
+        rank = percent / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(max(self._bucket_upper_bound(index), self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> str:
+        if not self.count:
+            return f"{self.name}: no samples"
+        return (
+            f"{self.name}: n={self.count} mean={self.mean * 1000:.2f}ms "
+            f"p50={self.percentile(50) * 1000:.2f}ms p90={self.percentile(90) * 1000:.2f}ms "
+            f"p99={self.percentile(99) * 1000:.2f}ms max={self.max * 1000:.2f}ms"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain data that can be sent to another process and turned back with from_dict"""
+        return {
+            "name": self.name,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+            "buckets_per_decade": self.buckets_per_decade,
+            "buckets": self.buckets,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls(data["name"], data["min_value"], data["max_value"], data["buckets_per_decade"])
+        histogram.buckets = list(data["buckets"])
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"] if data["min"] is not None else math.inf
+        histogram.max = data["max"]
+        return histogram
+
+    def percentiles_ms(self) -> Dict[str, float]:
+        """Count and percentiles in milliseconds, for reports"""
+        return {
+            "count": self.count,
+            "mean": round(self.mean * 1000, 3),
+            "p50": round(self.percentile(50) * 1000, 3),
+            "p90": round(self.percentile(90) * 1000, 3),
+            "p99": round(self.percentile(99) * 1000, 3),
+            "max": round(self.max * 1000, 3),
+        }
+
+
+@dataclass
+class InputSendStats:
+    """Pacing counters of the continuous input sender"""
+    tick_rate: int
+    started_at: float
+    stopped_at: float = 0.0
+    ticks: int = 0
+    missed_ticks: int = 0
+    messages_sent: int = 0
+    # inputs that could not be sent because the websocket was not connected
+    dropped: int = 0
+    # how late each tick ran compared to its deadline
+    jitter: LatencyHistogram = field(default_factory=lambda: LatencyHistogram("Input tick jitter"))
+
+    @property
+    def achieved_tick_rate(self) -> float:
+        elapsed = (self.stopped_at or time.monotonic()) - self.started_at
+        return self.ticks / elapsed if elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Input sender: {self.achieved_tick_rate:.1f}/{self.tick_rate} Hz, {self.ticks} ticks, "
+            f"{self.missed_ticks} missed, {self.messages_sent} inputs sent, {self.dropped} dropped; "
+            f"{self.jitter.summary()}"
+        )
+
+
+class MatchLatencyMetrics:
+    """
+    Latency histograms of one match: shown by the game screen HUD and appended
+    to the latency report when the match ends.
+    """
+    # inputs the server has not echoed after this long were rejected or lost
+    ECHO_TIMEOUT: float = 1.0
+    # game_state lastUpdateTime values below this are not wall clock milliseconds
+    MIN_SERVER_TIMESTAMP: int = 1_000_000_000_000
+
+    def __init__(self, side: Optional[str] = None) -> None:
+        self.side = side
+        self.started_at: float = time.time()
+        self.receive_interval = LatencyHistogram("WebSocket receive interval")
+        self.server_age = LatencyHistogram("Server timestamp age")
+        self.input_echo = LatencyHistogram("Input send-to-echo latency")
+        self.render_time = LatencyHistogram("Render time per frame")
+        self._last_receive: Optional[float] = None
+        # (monotonic send time, up) of inputs the server has not applied yet
+        self._pending_inputs: deque[Tuple[float, bool]] = deque()
+        self._echo_y: Optional[float] = None
+
+    @property
+    def histograms(self) -> List[LatencyHistogram]:
+        return [self.receive_interval, self.server_age, self.input_echo, self.render_time]
+
+    def message_received(self, now: float) -> None:
+        if self._last_receive is not None:
+            self.receive_interval.record(now - self._last_receive)
+        self._last_receive = now
+
+    def game_state_received(self, state: LiveGameState, wall_time: float) -> None:
+        if state.last_update_time >= self.MIN_SERVER_TIMESTAMP:
+            self.server_age.record(wall_time - state.last_update_time / 1000)
+        if self.side:
+            self._own_paddle_moved(
+                state.left_paddle_y if self.side == "left" else state.right_paddle_y, state.received_at
+            )
+
+    def input_sent(self, up: bool, now: float) -> None:
+        if self.side:
+            self._pending_inputs.append((now, up))
+
+    def _own_paddle_moved(self, y: float, now: float) -> None:
+        """Match the displacement of the own paddle with the oldest pending inputs"""
+        previous, self._echo_y = self._echo_y, y
+        pending = self._pending_inputs
+        while pending and now - pending[0][0] > self.ECHO_TIMEOUT:
+            pending.popleft()
+        if previous is None or not pending:
+            return
+        steps = int(round(abs(y - previous) / PaddlePredictor.SPEED))
+        up = y < previous
+        while steps and pending:
+            sent_at, sent_up = pending.popleft()
+            if sent_up == up:
+                self.input_echo.record(now - sent_at)
+                steps -= 1
+
+    def hud_lines(self) -> List[str]:
+        """Two status lines with p50/p99 of every histogram"""
+        def cell(label: str, histogram: LatencyHistogram) -> str:
+            if not histogram.count:
+                return f"{label} n/a"
+            return f"{label} {histogram.percentile(50) * 1000:.1f}/{histogram.percentile(99) * 1000:.1f}ms"
+        return [
+            f"p50/p99  {cell('recv', self.receive_interval)}  |  {cell('server age', self.server_age)}",
+            f"         {cell('echo', self.input_echo)}  |  {cell('render', self.render_time)}",
+        ]
+
+    def write_report(self, path: Path, game_id: str) -> None:
+        """Append the percentiles of this match as one JSON line"""
+        report = {
+            "game_id": game_id,
+            "started_at": datetime.fromtimestamp(self.started_at).isoformat(timespec="seconds"),
+            "duration_s": round(time.time() - self.started_at, 1),
+            "side": self.side,
+        }
+        for histogram in self.histograms:
+            report[histogram.name] = histogram.percentiles_ms()
+        with open(path, "a") as report_file:
+            report_file.write(json.dumps(report) + "\n")
+        logger.info(f"Latency report for game {game_id} written to {path}")
+
+
+class ScheduledJob:
+    """A periodic callback registered with a TickScheduler"""
+    def __init__(self, scheduler: "TickScheduler", name: str, rate: float, callback: Callable[[], None]) -> None:
+        self.scheduler = scheduler
+        self.name = name
+        self.rate = rate
+        self.interval: float = 1.0 / rate
+        self.callback = callback
+        self.next_deadline: float = 0.0
+        # deadline of the most recent run, for consumers that measure their own lateness
+        self.last_deadline: float = 0.0
+        self.paused: bool = False
+        self.cancelled: bool = False
+        self.runs: int = 0
+        self.missed: int = 0
+        # how late the scheduler ran the job compared to its deadline
+        self.lateness = LatencyHistogram(f"{name} lateness")
+
+    def pause(self) -> None:
+        """Stop running the job without unregistering it"""
+        self.paused = True
+
+    def resume(self) -> None:
+        """Run the job again from the next deadline on the scheduler's grid"""
+        if self.paused and not self.cancelled:
+            self.paused = False
+            self.next_deadline = self.scheduler.next_grid_deadline(self.interval)
+            self.scheduler.reschedule()
+
+    def cancel(self) -> None:
+        self.scheduler.remove(self)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the rate, from the next deadline on the grid of the new interval"""
+        self.rate = rate
+        self.interval = 1.0 / rate
+        if not self.paused and not self.cancelled:
+            self.next_deadline = self.scheduler.next_grid_deadline(self.interval)
+            self.scheduler.reschedule()
+
+    def run(self, now: float) -> None:
+        late = now - self.next_deadline
+        self.lateness.record(max(0.0, late))
+        if late >= self.interval:
+            # more than a full interval late: skip the missed deadlines instead of bursting
+            missed = int(late / self.interval)
+            self.missed += missed
+            self.next_deadline += missed * self.interval
+        self.last_deadline = self.next_deadline
+        self.next_deadline += self.interval
+        self.runs += 1
+        try:
+            self.callback()
+        except Exception as e:
+            logger.error(f"Error in scheduled job {self.name}: {e}")
+
+    def summary(self) -> str:
+        return f"Job {self.name} @ {self.rate:g} Hz: {self.runs} runs, {self.missed} missed; {self.lateness.summary()}"
+
+
+class Ticker:
+    """
+    Awaitable periodic tick on a TickScheduler, for loops that used to sleep a fixed time.
+    A tick that fires while the consumer is busy is delivered on the next `wait`;
+    if the consumer stops waiting altogether the job pauses until it waits again.
+    """
+    def __init__(self, scheduler: "TickScheduler", rate: float, name: str) -> None:
+        self._event = asyncio.Event()
+        self.job: ScheduledJob = scheduler.every(rate, self._tick, name, paused=True)
+
+    def _tick(self) -> None:
+        if self._event.is_set():
+            # the previous tick was never consumed, nobody is waiting
+            self.job.pause()
+        self._event.set()
+
+    async def wait(self) -> None:
+        """Wait for the next tick"""
+        self.job.resume()
+        await self._event.wait()
+        self._event.clear()
+
+    def cancel(self) -> None:
+        self.job.cancel()
+
+
+class TickScheduler:
+    """
+    Runs all periodic work of the client from one task on the monotonic clock.
+    Deadlines of every job lie on a shared grid starting at the scheduler's epoch,
+    so jobs with related rates (60 Hz input, 30 Hz render) come due together and
+    are run in a single wakeup. Callbacks must not block; anything that has to
+    await uses a Ticker instead.
+    """
+    # jobs due within this window of each other are run in the same wakeup
+    BATCH_WINDOW: float = 0.001
+
+    def __init__(self) -> None:
+        self._jobs: List[ScheduledJob] = []
+        self._changed: asyncio.Event = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.epoch: Optional[float] = None
+        self.wakeups: int = 0
+        self.job_runs: int = 0
+
+    def every(self, rate: float, callback: Callable[[], None], name: str, paused: bool = False) -> ScheduledJob:
+        """Call `callback` `rate` times per second until the returned job is cancelled"""
+        loop = asyncio.get_running_loop()
+        if self.epoch is None:
+            self.epoch = loop.time()
+        job = ScheduledJob(self, name, rate, callback)
+        job.paused = paused
+        job.next_deadline = self.next_grid_deadline(job.interval)
+        self._jobs.append(job)
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        self.reschedule()
+        logger.info(f"Scheduled job {name} at {rate:g} Hz")
+        return job
+
+    def ticker(self, rate: float, name: str) -> Ticker:
+        return Ticker(self, rate, name)
+
+    def remove(self, job: ScheduledJob) -> None:
+        if job.cancelled:
+            return
+        job.cancelled = True
+        if job in self._jobs:
+            self._jobs.remove(job)
+        logger.info(job.summary())
+
+    def next_grid_deadline(self, interval: float) -> float:
+        """First deadline of a job with the given interval that is not in the past"""
+        now = asyncio.get_running_loop().time()
+        epoch = self.epoch if self.epoch is not None else now
+        return epoch + math.ceil((now - epoch) / interval) * interval
+
+    def reschedule(self) -> None:
+        """Wake the scheduler up to recompute its next deadline"""
+        self._changed.set()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._changed.clear()
+            deadline = min((job.next_deadline for job in self._jobs if not job.paused), default=None)
+            if deadline is None:
+                await self._changed.wait()
+                continue
+            if deadline > loop.time():
+                timer = loop.call_at(deadline, self._changed.set)
+                await self._changed.wait()
+                timer.cancel()
+            now = loop.time()
+            due = [job for job in self._jobs if not job.paused and job.next_deadline <= now + self.BATCH_WINDOW]
+            if not due:
+                continue
+            self.wakeups += 1
+            self.job_runs += len(due)
+            for job in due:
+                # an earlier callback of the same batch may have cancelled or paused it
+                if not job.cancelled and not job.paused:
+                    job.run(now)
+
+    def summary(self) -> str:
+        elapsed = asyncio.get_running_loop().time() - self.epoch if self.epoch is not None else 0.0
+        rate = self.wakeups / elapsed if elapsed > 0 else 0.0
+        return f"Scheduler: {self.wakeups} wakeups ({rate:.1f}/s) for {self.job_runs} job runs"
+
+    async def close(self) -> None:
+        for job in list(self._jobs):
+            self.remove(job)
+        logger.info(self.summary())
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+class GameStateSubscription:
+    """
+    Awaitable view on the versioned game state of a GameClient.
+    The client bumps its version and sets `wakeup` whenever a game_state,
+    game_over or error message arrives, so consumers never have to poll.
+    """
+    def __init__(self, client: "GameClient", wakeup: Optional[asyncio.Event] = None) -> None:
+        self.client = client
+        self.wakeup: asyncio.Event = wakeup if wakeup is not None else asyncio.Event()
+        # start behind the client so the current snapshot is delivered first
+        self.version: int = -1
+
+    @property
+    def changed(self) -> bool:
+        """Check if a new snapshot was published since the last `take`"""
+        return self.client.game_state_version != self.version
+
+    def take(self) -> Tuple[int, Optional[LiveGameState]]:
+        """Mark the current snapshot as seen and return (version, live game state)"""
+        self.version = self.client.game_state_version
+        return self.version, self.client.game_data
+
+    async def wait(self) -> None:
+        """Wait until a snapshot newer than the last seen one is published"""
+        while not self.changed:
+            self.wakeup.clear()
+            await self.wakeup.wait()
+
+    def close(self) -> None:
+        self.client.unsubscribe_game_state(self)
+
+
+class IncomingMailbox:
+    """
+    Queue of frames from the server with a policy per message type. game_state
+    frames are latest-value: a newer one replaces an older one that is still
+    waiting, so a stalled consumer only catches up on the newest state. All other
+    messages (game_over, countdown, error, ...) are delivered in arrival order.
+    """
+    def __init__(self) -> None:
+        # one-element cells, the cell of a replaced game_state is emptied in place
+        self._cells: Deque[List[Optional[str]]] = deque()
+        self._pending_state: Optional[List[Optional[str]]] = None
+        self._ready: asyncio.Event = asyncio.Event()
+        self.depth: int = 0
+        self.max_depth: int = 0
+        self.received: int = 0
+        self.dropped_states: int = 0
+
+    def qsize(self) -> int:
+        return self.depth
+
+    def empty(self) -> bool:
+        return self.depth == 0
+
+    def put_nowait(self, frame: str) -> None:
+        self.received += 1
+        cell: List[Optional[str]] = [frame]
+        if frame.startswith(MessageDecoder.GAME_STATE_PREFIX):
+            if self._pending_state is not None:
+                self._pending_state[0] = None
+                self.dropped_states += 1
+                self.depth -= 1
+            self._pending_state = cell
+        self._cells.append(cell)
+        self.depth += 1
+        if self.depth > self.max_depth:
+            self.max_depth = self.depth
+        self._ready.set()
+
+    async def put(self, frame: str) -> None:
+        self.put_nowait(frame)
+
+    async def get(self) -> str:
+        while True:
+            while self._cells:
+                cell = self._cells.popleft()
+                frame = cell[0]
+                if frame is None:
+                    continue
+                if cell is self._pending_state:
+                    self._pending_state = None
+                self.depth -= 1
+                return frame
+            self._ready.clear()
+            await self._ready.wait()
+
+    def summary(self) -> str:
+        return (
+            f"Incoming queue: {self.received} frames, {self.dropped_states} stale game_state frames dropped, "
+            f"max depth {self.max_depth}"
+        )
+
+
+class OutgoingQueue(asyncio.Queue):
+    """
+    Bounded queue of control frames for the server, producers wait while it is
+    full. Input frames do not go through it, see start_continuous_input.
+    """
+    def __init__(self, maxsize: int = 64) -> None:
+        super().__init__(maxsize)
+        self.max_depth: int = 0
+
+    def put_nowait(self, frame: str) -> None:
+        super().put_nowait(frame)
+        if self.qsize() > self.max_depth:
+            self.max_depth = self.qsize()
+
+    def summary(self) -> str:
+        return f"Outgoing queue: max depth {self.max_depth} of {self.maxsize}"
+
+
+class ConnectionManager:
+    """
+    Owns the single aiohttp session of a client, so the REST calls and the
+    websocket share one cookie jar, one connector with a DNS cache and kept-alive
+    connections, and one TLS context. New connections (TCP and TLS handshakes),
+    reused connections and DNS lookups are counted through a TraceConfig.
+    """
+    # longer than the 20 s between token checks, so they reuse the connection
+    KEEPALIVE_TIMEOUT: float = 60.0
+    DNS_CACHE_TTL: int = 300
+    _tls_context: Optional[ssl.SSLContext] = None
+
+    def __init__(self) -> None:
+        self.session: Optional[ClientSession] = None
+        self.connections_created: int = 0
+        self.connections_reused: int = 0
+        self.dns_lookups: int = 0
+        self.dns_cache_hits: int = 0
+        self.connect_time = LatencyHistogram("Connection setup (TCP and TLS handshake)")
+
+    @classmethod
+    def tls_context(cls) -> ssl.SSLContext:
+        """The TLS context of this process, created once since loading the CA store takes tens of milliseconds"""
+        if cls._tls_context is None:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            cls._tls_context = context
+        return cls._tls_context
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_create_start(_: ClientSession, context: Any, __: Any) -> None:
+            context.connect_started = time.perf_counter()
+
+        async def on_create_end(_: ClientSession, context: Any, __: Any) -> None:
+            self.connections_created += 1
+            self.connect_time.record(time.perf_counter() - context.connect_started)
+
+        async def on_reuse(*_: Any) -> None:
+            self.connections_reused += 1
+
+        async def on_dns_lookup(*_: Any) -> None:
+            self.dns_lookups += 1
+
+        async def on_dns_cache_hit(*_: Any) -> None:
+            self.dns_cache_hits += 1
+
+        trace.on_connection_create_start.append(on_create_start)
+        trace.on_connection_create_end.append(on_create_end)
+        trace.on_connection_reuseconn.append(on_reuse)
+        trace.on_dns_resolvehost_start.append(on_dns_lookup)
+        trace.on_dns_cache_hit.append(on_dns_cache_hit)
+        return trace
+
+    def get_session(self) -> ClientSession:
+        if self.session is None or self.session.closed:
+            connector = TCPConnector(
+                ssl=self.tls_context(),
+                use_dns_cache=True,
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+            )
+            self.session = ClientSession(
+                cookie_jar=aiohttp.CookieJar(unsafe=False),
+                connector=connector,
+                trace_configs=[self._trace_config()],
+            )
+            logger.info("HTTP client session created")
+        return self.session
+
+    async def prewarm(self, url: str) -> None:
+        """Resolve the backend and open a kept-alive TCP/TLS connection to it before the first request"""
+        started = time.perf_counter()
+        try:
+            async with self.get_session().head(url, timeout=ClientTimeout(5)) as response:
+                await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            logger.warning(f"Pre-warming the connection to {url} failed: {e}")
+            return
+        logger.info(f"Connection to {url} pre-warmed in {time.perf_counter() - started:.3f}s")
+
+    def summary(self) -> str:
+        return (
+            f"Connections: {self.connections_created} opened, {self.connections_reused} reused, "
+            f"{self.dns_lookups} DNS lookups, {self.dns_cache_hits} DNS cache hits, "
+            f"setup p50 {self.connect_time.percentile(50) * 1000:.1f}ms"
+        )
+
+    async def close(self) -> None:
+        if self.session and not self.session.closed:
+            await self.session.close()
+            logger.info("HTTP session closed")
+            logger.info(self.summary())
+        self.session = None
+
+
+class SessionRecorder:
+    """
+    Appends the websocket frames of a session to a file, one line per frame:
+    `<seconds>\t<direction>\t<frame>` with '<' for frames from the server and
+    '>' for frames to it. Each session starts with a `#\t<wall time>\t<username>\t<url>`
+    line and the seconds are monotonic time since that line.
+    """
+    INCOMING: str = "<"
+    OUTGOING: str = ">"
+
+    def __init__(self, path: Path, username: str, url: str) -> None:
+        self.path = path
+        self.frames: int = 0
+        self._file = open(path, "a", encoding="utf-8")
+        self._start: float = time.monotonic()
+        self._file.write(f"#\t{datetime.now().isoformat(timespec='milliseconds')}\t{username}\t{url}\n")
+
+    def record(self, direction: str, frame: str) -> None:
+        if "\n" in frame:
+            # JSON only has raw newlines as whitespace between tokens
+            frame = frame.replace("\n", " ")
+        self._file.write(f"{time.monotonic() - self._start:.6f}\t{direction}\t{frame}\n")
+        self.frames += 1
+
+    def flush(self) -> None:
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+            logger.info(f"Recorded {self.frames} frames to {self.path}")
+
+
+@dataclass
+class RecordedFrame:
+    offset: float
+    incoming: bool
+    data: str
+
+
+@dataclass
+class SessionRecording:
+    """One session of a file written by SessionRecorder"""
+    started: str
+    username: str
+    url: str
+    frames: List[RecordedFrame] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: Path, session: int = -1) -> "SessionRecording":
+        """Read the session with the given index, by default the last one in the file"""
+        sessions: List[SessionRecording] = []
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                try:
+                    offset, direction, data = line.rstrip("\n").split("\t", 2)
+                    if offset == "#":
+                        username, _, url = data.partition("\t")
+                        sessions.append(cls(started=direction, username=username, url=url))
+                    elif sessions:
+                        sessions[-1].frames.append(RecordedFrame(float(offset), direction == SessionRecorder.INCOMING, data))
+                except ValueError:
+                    raise ValueError(f"{path}:{number} is not a line of a session recording") from None
+        if not sessions:
+            raise ValueError(f"No recorded session in {path}")
+        return sessions[session]
+
+    @property
+    def incoming(self) -> List[str]:
+        return [frame.data for frame in self.frames if frame.incoming]
+
+
+class ReplaySource:
+    """
+    Feeds the incoming frames of a recording into a client's incoming_messages
+    queue at `speed` times the recorded pace, or as fast as the consumer keeps
+    up with a speed of 0.
+    """
+    def __init__(self, recording: SessionRecording, speed: float = 1.0) -> None:
+        self.recording = recording
+        self.speed = speed
+        self.fed: int = 0
+
+    async def feed(self, queue: IncomingMailbox, on_frame: Optional[Callable[[float], None]] = None) -> None:
+        """Put the frames on `queue`, calling `on_frame` with the time each one is replayed"""
+        frames = [frame for frame in self.recording.frames if frame.incoming]
+        if not frames:
+            return
+        loop = asyncio.get_running_loop()
+        # replay from the first incoming frame, skipping the time spent signing in
+        start = loop.time() - frames[0].offset / self.speed if self.speed > 0 else 0.0
+        for frame in frames:
+            delay = start + frame.offset / self.speed - loop.time() if self.speed > 0 else 0.0
+            # always yield, so the consumer runs between frames
+            await asyncio.sleep(max(0.0, delay))
+            if on_frame:
+                on_frame(time.monotonic())
+            queue.put_nowait(frame.data)
+            self.fed += 1
+        logger.info(f"Replay finished: {self.fed} frames at speed {self.speed or 'max'}")
+
+
 class BackendClient:
+    # stages of startup that are timed, see mark_startup
+    STARTUP_STAGES: Tuple[str, ...] = ("authenticated", "websocket", "menu")
+    # the access token is refreshed this long before it expires, minus up to REFRESH_JITTER
+    # seconds so clients that signed in together spread their refreshes
+    REFRESH_MARGIN: float = 60.0
+    REFRESH_JITTER: float = 30.0
+    # delay between attempts while refreshing keeps failing
+    REFRESH_RETRY_DELAY: float = 5.0
+    # tokens without an exp claim are checked with the server this often instead
+    VALIDATE_INTERVAL: float = 20.0
+    # exponential backoff of websocket reconnects, with jitter, before the client gives up
+    RECONNECT_BASE_DELAY: float = 0.5
+    RECONNECT_MAX_DELAY: float = 30.0
+    RECONNECT_MAX_ATTEMPTS: int = 10
+    # ping interval that detects half-open websocket connections
+    WS_HEARTBEAT: float = 10.0
+    # log sites hit for every frame or every retry
+    _log_received = RateLimitedLog(logger, logging.DEBUG)
+    _log_holding = RateLimitedLog(logger, logging.WARNING)
+
     def __init__(self, username: str, password: str, url: str) -> None:
         self.username: str = username
         self.password: str = password
         self.url: str = url
+        # one session for the REST calls and the websocket, see ConnectionManager
+        self.connections: ConnectionManager = ConnectionManager()
         self.session: Optional[aiohttp.ClientSession] = None
+        # monotonic time start() was called and the seconds from there to each startup stage
+        self.started_at: float = 0.0
+        self.startup_times: Dict[str, float] = {}
+        # requests to the authentication endpoints, by endpoint, and how many of them startup took
+        self.auth_requests: Dict[str, int] = {}
+        self.startup_auth_requests: int = 0
         self.access_token: Optional[str] = None
         self.user_data: Optional[Dict[str, Any]] = None
         self.websocket_client = None
         self.is_connected: asyncio.Event = asyncio.Event()
+        # set while the pong websocket is open
+        self.ws_connected: asyncio.Event = asyncio.Event()
         self.requires_2fa_input: asyncio.Event = asyncio.Event()
         self.got_2fa_input: asyncio.Future[str] = asyncio.Future()
         self.ws: Optional[aiohttp.ClientWebSocketResponse] = None
-        self.incoming_messages: asyncio.Queue[str] = asyncio.Queue()
-        self.outgoing_messages: asyncio.Queue[str] = asyncio.Queue()
+        self.incoming_messages: IncomingMailbox = IncomingMailbox()
+        self.outgoing_messages: OutgoingQueue = OutgoingQueue()
+        # shared clock for everything that runs periodically
+        self.scheduler: TickScheduler = TickScheduler()
+        # websocket reconnects and the total seconds the websocket was down
+        self.reconnects: int = 0
+        self.downtime: float = 0.0
+        # opt-in log of every websocket frame, see record_session
+        self.recorder: Optional[SessionRecorder] = None
         logger.info(f"BackendClient initialized for user: {username}, URL: {url}")
 
+    def mark_startup(self, stage: str) -> None:
+        """Note the time from start() to the first time `stage` is reached"""
+        if stage in self.startup_times or not self.started_at:
+            return
+        self.startup_times[stage] = time.monotonic() - self.started_at
+        logger.info(f"Startup: {stage} after {self.startup_times[stage]:.3f}s")
+        if len(self.startup_times) == len(self.STARTUP_STAGES):
+            logger.info(self.startup_summary())
+
+    def startup_summary(self) -> str:
+        stages = ", ".join(
+            f"time-to-{stage} {self.startup_times[stage] * 1000:.0f}ms"
+            for stage in self.STARTUP_STAGES if stage in self.startup_times
+        )
+        return f"Startup times since sign-in started: {stages}"
+
+    def count_auth_request(self, endpoint: str) -> None:
+        self.auth_requests[endpoint] = self.auth_requests.get(endpoint, 0) + 1
+
+    def auth_summary(self) -> str:
+        total = sum(self.auth_requests.values())
+        later = total - self.startup_auth_requests
+        hours = (time.monotonic() - self.started_at) / 3600 if self.started_at else 0.0
+        per_hour = later / hours if hours > 0 else 0.0
+        endpoints = ", ".join(f"{endpoint} {count}" for endpoint, count in self.auth_requests.items())
+        return (
+            f"Auth requests: {total} ({endpoints}), {self.startup_auth_requests} at startup, "
+            f"{per_hour:.1f} per hour after that"
+        )
+
+    def seconds_until_refresh(self) -> Optional[float]:
+        """Wall clock seconds until the access token should be refreshed, None if it has no expiry"""
+        expires_at = jwt_claims(self.access_token or "").get("exp")
+        if not isinstance(expires_at, (int, float)):
+            return None
+        margin = self.REFRESH_MARGIN + random.uniform(0, self.REFRESH_JITTER)
+        return expires_at - margin - time.time()
+
+    def record_session(self, path: Path) -> None:
+        """Append all websocket frames of this session to `path`, flushed once per second"""
+        self.recorder = SessionRecorder(path, self.username, self.url)
+        self.scheduler.every(1, self.recorder.flush, "record-flush")
+        logger.info(f"Recording websocket frames to {path}")
+
     async def __aenter__(self) -> "BackendClient":
         """Enter the context manager"""
         logger.info("BackendClient entering context manager")
@@ -216,34 +1248,64 @@ class BackendClient:
     async def start(self) -> None:
         """Start the backend client and authenticate"""
         logger.info("Starting BackendClient")
+        self.started_at = time.monotonic()
         # Initialize the aiohttp session
         await self.connect()
         # Authenticate with the backend server
         await self.authenticate()
-        assert self.is_connected, "Failed to authenticate with the backend server"
+        assert self.is_connected.is_set(), "Failed to authenticate with the backend server"
+        self.mark_startup("authenticated")
+        self.startup_auth_requests = sum(self.auth_requests.values())
         logger.info("BackendClient authentication successful, starting background tasks")
 
         async def keep_token_updated() -> None:
-            logger.info("Token validation task started")
+            """Refresh the access token shortly before it expires, the server is only asked when that fails"""
+            logger.info("Token refresh task started")
             while True:
-                # Check if the access token is still valid
-                if not await self.validate_auth_status():
+                refresh_in = self.seconds_until_refresh()
+                if refresh_in is None:
+                    logger.warning(f"Access token has no expiry, validating it every {self.VALIDATE_INTERVAL:.0f}s")
+                    await asyncio.sleep(self.VALIDATE_INTERVAL)
+                    authenticated = await self.validate_auth_status()
+                else:
+                    logger.info(f"Access token refresh in {max(0.0, refresh_in):.0f}s")
+                    refresh_at = time.time() + refresh_in
+                    # wake up now and then to notice wall clock jumps, e.g. after a suspend
+                    while (remaining := refresh_at - time.time()) > 0:
+                        await asyncio.sleep(min(remaining, 60.0))
+                    try:
+                        authenticated = await self.refresh_access_token()
+                    except (ConnectionError, AssertionError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        logger.warning(f"Access token refresh failed ({e}), checking the token with the server")
+                        try:
+                            authenticated = await self.validate_auth_status()
+                        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                            # the network is down, the websocket reconnect re-authenticates if needed
+                            logger.warning(f"Token check failed ({e}), trying again later")
+                            authenticated = True
+                        # still valid: try again soon, the token will expire
+                        await asyncio.sleep(self.REFRESH_RETRY_DELAY)
+                if not authenticated:
                     logger.error("Authentication lost, token validation failed")
                     raise ConnectionError("We're not authenticated anymore")
-                logger.debug("Token validation successful")
-                await asyncio.sleep(20)
 
         async def send_messages_from_queue() -> None:
             logger.info("Message sender task started")
-            while not self.ws:
-                await asyncio.sleep(0.1)
             while True:
                 message = await self.outgoing_messages.get()
                 if message is None:
                     logger.info("Message sender task stopping (None message received)")
                     break
-                logger.debug(f"Sending message to server: {message[:100]}...")
-                await self.send_to_server(message)
+                logger.debug("Sending message to server: %.100s...", message)
+                # hold the message while the websocket is down instead of losing it
+                while True:
+                    await self.ws_connected.wait()
+                    try:
+                        await self.send_to_server(message)
+                        break
+                    except (ConnectionError, aiohttp.ClientError) as e:
+                        self._log_holding("Holding outgoing message until the websocket is back: %s", e)
+                        await asyncio.sleep(self.RECONNECT_BASE_DELAY)
 
         async with asyncio.TaskGroup() as tg:
             tg.create_task(keep_token_updated())
@@ -252,65 +1314,116 @@ class BackendClient:
         raise GracefulExit("network ended")
         
     async def handle_websocket(self) -> None:
-        """Receive messages from the websocket server"""
+        """
+        Keep the pong websocket open: when it drops, reconnect with exponential
+        backoff and jitter, getting a new access token first if the old one is
+        not accepted anymore
+        """
         logger.info("Starting WebSocket handler")
-        while not self.access_token:
-            await asyncio.sleep(1)
-
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-        connector = TCPConnector(ssl=ssl_context)
+        # authentication also retrieves the access token
+        await self.is_connected.wait()
+        attempt = 0
+        down_since: Optional[float] = None
+        while True:
+            try:
+                close_code = await self.receive_websocket_messages(down_since)
+                # the websocket was open: the downtime and the backoff start over
+                reason = f"closed with code {close_code}"
+                attempt = 0
+                down_since = time.monotonic()
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                reason = f"{type(e).__name__}: {e}"
+            if attempt >= self.RECONNECT_MAX_ATTEMPTS:
+                raise ConnectionError(f"websocket closed, giving up after {attempt} reconnect attempts ({reason})")
+            delay = min(self.RECONNECT_MAX_DELAY, self.RECONNECT_BASE_DELAY * 2 ** attempt) * random.uniform(0.5, 1.0)
+            attempt += 1
+            logger.warning(f"WebSocket {reason}, reconnect attempt {attempt} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            try:
+                await self.reauthenticate()
+            except (ConnectionError, AssertionError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Re-authentication failed: {e}")
 
+    async def receive_websocket_messages(self, down_since: Optional[float]) -> Optional[int]:
+        """Open the websocket and put its messages in the incoming queue until it closes, returns the close code"""
         websocket_url = f'{self.url}/ws?token={self.access_token}&type=pong'
-        logger.info(f"Connecting to WebSocket: {websocket_url}")
-
-        async with ClientSession(connector=connector) as session:
-            async with session.ws_connect(websocket_url) as ws:
-                self.ws = ws
-                logger.info("WebSocket connection established")
-                self.incoming_messages.put_nowait("init")
+        logger.info(f"Connecting to WebSocket: {self.url}/ws?type=pong")
+
+        session = await self.connect()
+        async with session.ws_connect(websocket_url, heartbeat=self.WS_HEARTBEAT) as ws:
+            self.ws = ws
+            self.ws_connected.set()
+            logger.info("WebSocket connection established")
+            self.mark_startup("websocket")
+            logger.info(self.connections.summary())
+            if down_since is not None:
+                downtime = time.monotonic() - down_since
+                self.reconnects += 1
+                self.downtime += downtime
+                logger.warning(f"WebSocket reconnected after {downtime:.2f}s down")
+                logger.info(self.reconnect_summary())
+                self.on_reconnected()
+            self.incoming_messages.put_nowait("init")
+            try:
                 async for msg in ws:
                     if msg.type == aiohttp.WSMsgType.TEXT:
                         if msg.data == 'close':
+                            # handle_websocket decides whether to reconnect
                             logger.info("Received close message from WebSocket")
                             await ws.close()
                             break
                         else:
-                            logger.debug(f"Received WebSocket message: {msg.data[:100]}...")
+                            self.on_frame_received(time.monotonic())
+                            self._log_received("Received WebSocket message: %.100s...", msg.data)
+                            if self.recorder:
+                                self.recorder.record(SessionRecorder.INCOMING, msg.data)
                             await self.incoming_messages.put(msg.data)
                     elif msg.type == aiohttp.WSMsgType.ERROR:
                         logger.error(f"WebSocket error: {ws.exception()}")
                         break
-        self.ws = None
-        logger.warning("WebSocket connection closed")
-        raise Exception("websocket closed")
+            finally:
+                self.ws = None
+                self.ws_connected.clear()
+        logger.warning(f"WebSocket connection closed (code {ws.close_code})")
+        return ws.close_code
+
+    async def reauthenticate(self) -> None:
+        """
+        Make sure the access token is accepted before reconnecting: the server
+        may have restarted or the token may have expired while it was down.
+        Refreshes the token if needed, or signs in again if that fails as well.
+        """
+        try:
+            if await self.validate_auth_status():
+                return
+        except (ConnectionError, AssertionError) as e:
+            logger.warning(f"Refreshing the access token failed ({e})")
+        if self.requires_2fa_input.is_set():
+            raise ConnectionError("cannot sign in again without a new 2FA code")
+        logger.info("Access token not accepted anymore, signing in again")
+        await self.authenticate()
+
+    def on_reconnected(self) -> None:
+        """Called once the websocket is open again after it dropped"""
+
+    def on_frame_received(self, now: float) -> None:
+        """Called for every text frame as it arrives, before it is queued for dispatch"""
+
+    def reconnect_summary(self) -> str:
+        return f"WebSocket reconnects: {self.reconnects}, {self.downtime:.2f}s down in total"
     
     async def send_to_server(self, data: str) -> None:
         if not self.ws:
             logger.error("Attempted to send message but WebSocket not connected")
             raise ConnectionError("ws not connected")
-        logger.debug(f"Sending to server: {data[:100]}...")
+        logger.debug("Sending to server: %.100s...", data)
         await self.ws.send_str(data)
+        if self.recorder:
+            self.recorder.record(SessionRecorder.OUTGOING, data)
 
     async def connect(self) -> aiohttp.ClientSession:
-        """Initialize aiohttp client session with cookie support"""
-        logger.info("Initializing HTTP client session")
-        if self.session is None or self.session.closed:
-            # Create a client session that preserves cookies
-            cookie_jar = aiohttp.CookieJar(unsafe=False)
-
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            connector = TCPConnector(ssl=ssl_context)
-
-            self.session = aiohttp.ClientSession(
-                cookie_jar=cookie_jar,
-                connector=connector
-            )
-            logger.info("HTTP client session created")
-
+        """Get the shared aiohttp client session, with cookie support"""
+        self.session = self.connections.get_session()
         return self.session
 
     async def authenticate(self) -> None:
@@ -326,6 +1439,7 @@ class BackendClient:
         # Make the authentication request
         assert self.session is not None
         logger.info(f"Sending authentication request to {self.url}/api/sign-in")
+        self.count_auth_request("sign-in")
         async with self.session.post(
             f"{self.url}/api/sign-in",
             json=payload,
@@ -356,15 +1470,18 @@ class BackendClient:
             await self.retrieve_access_token()
 
             if self.user_data["isSignedIn"] and self.access_token:
-                self.is_connected.set()
                 username = self.user_data['username']
-                print(f"Successfully logged in as {username}")
+                if not self.is_connected.is_set():
+                    # not again when signing in after a reconnect, the terminal belongs to curses then
+                    print(f"Successfully logged in as {username}")
+                self.is_connected.set()
                 logger.info(f"Authentication successful for user: {username}")
 
     async def retrieve_access_token(self) -> None:
         """Retrieve the JWT access token from the dedicated endpoint"""
         logger.info("Retrieving access token from /api/ws-token")
         assert self.session is not None
+        self.count_auth_request("ws-token")
 
         async with self.session.get(
             f"{self.url}/api/ws-token",
@@ -390,6 +1507,7 @@ class BackendClient:
 
         # Send the 2FA validation request
         assert self.session is not None
+        self.count_auth_request("validate-2fa")
         async with self.session.post(
             f"{self.url}/api/validate-2fa",
             json=payload,
@@ -420,6 +1538,7 @@ class BackendClient:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.access_token}"
         }
+        self.count_auth_request("validate-access-token")
         
         async with self.session.post(
             f"{self.url}/api/validate-access-token",
@@ -442,6 +1561,7 @@ class BackendClient:
     async def refresh_access_token(self) -> bool:
         """Request a new access token using the refresh token (in cookies)"""
         assert self.session is not None
+        self.count_auth_request("generate-new-access-token")
         async with self.session.post(
             f"{self.url}/api/generate-new-access-token",
             timeout=ClientTimeout(5),
@@ -476,26 +1596,42 @@ class BackendClient:
     async def close(self) -> None:
         """Close the aiohttp session"""
         logger.info("Closing BackendClient")
-        if self.session and not self.session.closed:
-            await self.session.close()
-            logger.info("HTTP session closed")
+        await self.connections.close()
         self.is_connected.clear()
         self.session = None
+        logger.info(self.incoming_messages.summary())
+        logger.info(self.outgoing_messages.summary())
+        logger.info(self.auth_summary())
+        logger.info(self.reconnect_summary())
+        if self.recorder:
+            self.recorder.close()
+        await self.scheduler.close()
         print("Closed backend client session")
         logger.info("BackendClient closed successfully")
 
 
 class GameClient(BackendClient):
     """Wrapper around the backend client to handle game-specific requests"""
+    # seconds a match may stay silent after a reconnect before it is given up
+    GAME_RESUME_TIMEOUT: float = 3.0
+    # log sites hit for every frame or every key repeat
+    _log_update = RateLimitedLog(logger, logging.DEBUG)
+    _log_other_game = RateLimitedLog(logger, logging.DEBUG)
+    _log_input_state = RateLimitedLog(logger, logging.DEBUG)
+
     def __init__(self, username: str, password: str, url: str) -> None:
         super().__init__(username, password, url)
         self.game_id: Optional[str] = None
-        self.game_data: Optional[Dict[str, Any]] = None
+        # points to _live_game while a game is running, None otherwise
+        self.game_data: Optional[LiveGameState] = None
+        self._live_game: LiveGameState = LiveGameState()
         self.debug_mode: asyncio.Event = asyncio.Event()
-        self.debug_queue: asyncio.Queue[str] = asyncio.Queue()
+        # filled on the network loop and drained by the debug screen, which may run on another thread
+        self.debug_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
         self._error: Optional[Tuple[str, int]] = None
         self._available_games: asyncio.Queue[List[Dict[str, Any]]] = asyncio.Queue()
         self._game_over_data: Optional[Dict[str, Any]] = None
+        self._resume_watchdog: Optional[asyncio.Task] = None
 
         # Tournament-specific properties
         self.tournament_id: Optional[str] = None
@@ -509,8 +1645,40 @@ class GameClient(BackendClient):
         self.input_sender_task: Optional[asyncio.Task] = None
         self.input_active: bool = False
         self.last_key_time: Dict[str, float] = {"up": 0.0, "down": 0.0}
+        self._input_frames: Dict[bool, str] = {}
+        self._input_frames_user: Optional[str] = None
+        self.input_stats: Optional[InputSendStats] = None
         self.key_timeout: float = 0.2  # Stop sending after 200ms of no key repeat
-        logger.info("GameClient initialized")
+        # side of the own paddle ("left" for the creator, "right" for the joiner) if known
+        self.player_side: Optional[str] = None
+        # set by the game screen when local paddle prediction is enabled
+        self.paddle_predictor: Optional["PaddlePredictor"] = None
+        # latency histograms of the current match, replaced by the game screen
+        self.latency: MatchLatencyMetrics = MatchLatencyMetrics()
+
+        # Versioned game state published to subscribers (see GameStateSubscription)
+        self.game_state_version: int = 0
+        self._game_state_subscribers: List[GameStateSubscription] = []
+        # loop of the terminal UI when the network runs on a NetworkThread, None on a single loop.
+        # Subscribers and the paddle predictor live there, and they get snapshots of the game state.
+        self.ui_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Decoding of incoming frames and O(1) dispatch on (target_endpoint, type)
+        self.decoder: MessageDecoder = MessageDecoder()
+        self._message_handlers: Dict[Tuple[str, str], Callable[[Dict[str, Any]], None]] = {}
+        for msg_type, handler in (
+            ("game_state", self._on_game_state),
+            ("error", self._on_error),
+            ("game_list", self._on_game_list),
+            ("game_states", self._on_game_states),
+            ("game_created", self._on_game_created),
+            ("game_over", self._on_game_over),
+            ("tournament_list", self._on_tournament_list),
+            ("tournament_end", self._on_tournament_end),
+            ("countdown", self._on_countdown),
+        ):
+            self.register_message_handler("pong-api", msg_type, handler)
+        logger.info(f"GameClient initialized, JSON decoder: {self.decoder.name}")
 
     @property
     def user_id(self) -> str:
@@ -520,18 +1688,28 @@ class GameClient(BackendClient):
         return ""
 
     @classmethod
-    def from_login(cls, url: Optional[str] = None) -> "GameClient":
+    async def from_login(cls, url: Optional[str] = None) -> "GameClient":
+        """Ask for the credentials while the connection to the backend is opened in the background"""
+        connections = ConnectionManager()
+        prewarm: Optional[asyncio.Task] = None
+        if url:
+            prewarm = asyncio.create_task(connections.prewarm(url))
         # show login screen to enter username and password
-        username = input("Enter username: ")
-        password = input("Enter password: ")
+        username = await read_line("Enter username: ")
+        password = await read_line("Enter password: ")
         if not password or not username:
             # dummy login for development
             username, password = "anonym", "Anonym99!"
         if url is None:
-            url = input("Enter backend URL: ")
+            url = await read_line("Enter backend URL: ")
         assert url, "Backend URL cannot be empty"
         assert username and password, "Username and password cannot be empty"
-        return cls(username=username, password=password, url=url)
+        client = cls(username=username, password=password, url=url)
+        client.connections = connections
+        if prewarm:
+            # usually done long before the user is, otherwise sign-in would open a second connection
+            await prewarm
+        return client
     
     async def __aenter__(self) -> 'GameClient':
         await super().__aenter__()
@@ -540,6 +1718,42 @@ class GameClient(BackendClient):
     async def __aexit__(self, exc_type: Optional[type], exc_val: Optional[Exception], exc_tb: Any) -> None:
         await super().__aexit__(exc_type, exc_val, exc_tb)
 
+    async def replay(self, source: ReplaySource) -> None:
+        """Stand-in for start() that plays back a recorded session instead of connecting to the backend"""
+        self.user_data = {"username": source.recording.username}
+        self.is_connected.set()
+        await source.feed(self.incoming_messages, self.on_frame_received)
+
+    def subscribe_game_state(self, wakeup: Optional[asyncio.Event] = None) -> GameStateSubscription:
+        """Register a subscriber that is woken up on every new game state snapshot"""
+        subscription = GameStateSubscription(self, wakeup)
+        self._game_state_subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe_game_state(self, subscription: GameStateSubscription) -> None:
+        if subscription in self._game_state_subscribers:
+            self._game_state_subscribers.remove(subscription)
+
+    def publish_game_state(self) -> None:
+        """Bump the game state version and wake up all subscribers"""
+        self.game_state_version += 1
+        if self.ui_loop is None:
+            self._wake_subscribers()
+        else:
+            self.ui_loop.call_soon_threadsafe(self._wake_subscribers)
+
+    def _wake_subscribers(self) -> None:
+        for subscription in self._game_state_subscribers:
+            subscription.wakeup.set()
+
+    def set_error(self, error_msg: str, error_code: int) -> None:
+        """Keep an error for get_error, which is called on the UI loop"""
+        if self.ui_loop is None:
+            self._error = (error_msg, error_code)
+        else:
+            # queued before the wakeup of the subscribers and the result of the running call
+            self.ui_loop.call_soon_threadsafe(setattr, self, "_error", (error_msg, error_code))
+
     def get_error(self) -> Optional[Tuple[str, int]]:
         if self._error:
             error_msg, error_code = self._error
@@ -549,84 +1763,121 @@ class GameClient(BackendClient):
 
 
 
+    async def wait_for_sign_in(self) -> bool:
+        """Wait until the client is signed in (True) or needs a 2FA code (False)"""
+        connected = asyncio.create_task(self.is_connected.wait())
+        needs_2fa = asyncio.create_task(self.requires_2fa_input.wait())
+        try:
+            await asyncio.wait((connected, needs_2fa), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            connected.cancel()
+            needs_2fa.cancel()
+        return self.is_connected.is_set()
+
+    async def submit_2fa_code(self, code: str) -> None:
+        self.got_2fa_input.set_result(code)
+        self.requires_2fa_input.clear()
+
+    async def send_message(self, message: str) -> None:
+        """Queue a raw message for the server"""
+        await self.outgoing_messages.put(message)
+
+    def register_message_handler(self, target_endpoint: str, msg_type: str, handler: Callable[[Dict[str, Any]], None]) -> None:
+        """Register the handler for messages of the given endpoint and type, replacing any previous one"""
+        self._message_handlers[(target_endpoint, msg_type)] = handler
+
     async def consume_backend_messages(self) -> None:
         logger.info("Starting backend message consumer")
         await self.is_connected.wait()
         while True:
             message = await self.incoming_messages.get()
             if self.debug_mode.is_set():
-                logger.debug(f"Debug mode: queuing message: {message[:100]}...")
-                await self.debug_queue.put(message)
-                continue
-            try:
-                message_data: Dict[str, Any] = json.loads(message)
-            except Exception:
-                logger.warning(f"Failed to parse message as JSON:, {message=}", exc_info=True)
-                continue
-            message = message_data
-            if not message.get('target_endpoint') == "pong-api":
-                logger.debug(f"Ignoring message with target_endpoint: {message.get('target_endpoint')}")
+                logger.debug("Debug mode: queuing message: %.100s...", message)
+                self.debug_queue.put(message)
                 continue
+            self.dispatch_message(message)
 
-            # Handle the message based on type
-            msg_type = message.get('type')
-            logger.info(f"Processing pong-api message type: {msg_type}")
-            if msg_type == "error":
-                pong_data = message.get('pong_data', {})
-                error_msg = pong_data.get('message', 'Unknown error')
-                error_code = pong_data.get('code', 500)
-                logger.error(f"Received error from server: {error_msg} (code: {error_code})")
-                self._error = (error_msg, error_code)
-            elif msg_type == "game_list":
-                games_data = message.get('games', [])
-                logger.info(f"Received game list: {len(games_data)} games")
-                self._available_games.put_nowait(games_data)
-            elif msg_type == "game_states":
-                pong_data = message.get('pong_data', [])
-                logger.info(f"Received game states: {len(pong_data)} games")
-                self._available_games.put_nowait(pong_data)
-            elif msg_type == "game_state":
-                game_data = message.get('game', {})
-                logger.debug(f"Received game state update for game: {game_data.get('id', 'unknown')}")
-                self.update_game_state(game_data)
-            elif msg_type == "game_created":
-                game_id = message.get('gameId')
-                logger.info(f"Game created with ID: {game_id}")
-                if self._in_tournament or "Tournament" in game_id:
-                    self.tournament_id = game_id
-                    logger.info(f"Tournament ID set: {game_id}")
-                else:
-                    self.game_id = game_id
-            elif msg_type == "game_over":
-                pong_data = message.get('pong_data', {})
-                logger.info(f"Game over received: {pong_data}")
-                self.handle_game_over(pong_data)
-            elif msg_type == "tournament_list":
-                tournaments_data = message.get('games', [])
-                logger.info(f"Received tournament list: {len(tournaments_data)} tournaments")
-                self._available_tournaments.put_nowait(tournaments_data)
-            elif msg_type == "tournament_end":
-                tournament_message = message.get('value', '')
-                logger.info(f"Tournament ended: {tournament_message}")
-                self._tournament_end_message = tournament_message
-                self._in_tournament = False
-            elif msg_type == "countdown":
-                countdown_value = message.get('value', 0)
-                logger.info(f"Tournament countdown: {countdown_value}")
-                # Store countdown value for tournament progression detection
-                if self._in_tournament:
-                    self._tournament_countdown = countdown_value
+    def dispatch_message(self, raw: str) -> None:
+        """Decode a raw frame and hand it to the handler registered for its endpoint and type"""
+        game = self.decoder.decode_game_state(raw)
+        if game:
+            self.update_game_state(game)
+            return
+        message = self.decoder.decode(raw)
+        if message is None:
+            return
+        handler = self._message_handlers.get((message.get('target_endpoint'), message.get('type')))
+        if handler is None:
+            logger.debug("No handler for target_endpoint: %s, type: %s", message.get('target_endpoint'), message.get('type'))
+            return
+        handler(message)
 
-    def update_game_state(self, game_data: Dict[str, Any]) -> None:
-        if not game_data:
+    def _on_game_state(self, message: Dict[str, Any]) -> None:
+        game = message.get('game')
+        if not game:
             logger.warning("Received empty game data")
             return
+        self.update_game_state(game)
+
+    def _on_error(self, message: Dict[str, Any]) -> None:
+        pong_data = message.get('pong_data', {})
+        error_msg = pong_data.get('message', 'Unknown error')
+        error_code = pong_data.get('code', 500)
+        logger.error(f"Received error from server: {error_msg} (code: {error_code})")
+        self.set_error(error_msg, error_code)
+        self.publish_game_state()
+
+    def _on_game_list(self, message: Dict[str, Any]) -> None:
+        games_data = message.get('games', [])
+        logger.info(f"Received game list: {len(games_data)} games")
+        self._available_games.put_nowait(games_data)
+
+    def _on_game_states(self, message: Dict[str, Any]) -> None:
+        pong_data = message.get('pong_data', [])
+        logger.info(f"Received game states: {len(pong_data)} games")
+        self._available_games.put_nowait(pong_data)
+
+    def _on_game_created(self, message: Dict[str, Any]) -> None:
+        game_id = message.get('gameId')
+        logger.info(f"Game created with ID: {game_id}")
+        if self._in_tournament or "Tournament" in game_id:
+            self.tournament_id = game_id
+            logger.info(f"Tournament ID set: {game_id}")
+        else:
+            self.game_id = game_id
+
+    def _on_game_over(self, message: Dict[str, Any]) -> None:
+        pong_data = message.get('pong_data', {})
+        logger.info(f"Game over received: {pong_data}")
+        self.handle_game_over(pong_data)
+
+    def _on_tournament_list(self, message: Dict[str, Any]) -> None:
+        tournaments_data = message.get('games', [])
+        logger.info(f"Received tournament list: {len(tournaments_data)} tournaments")
+        self._available_tournaments.put_nowait(tournaments_data)
+
+    def _on_tournament_end(self, message: Dict[str, Any]) -> None:
+        tournament_message = message.get('value', '')
+        logger.info(f"Tournament ended: {tournament_message}")
+        self._tournament_end_message = tournament_message
+        self._in_tournament = False
+        self.publish_game_state()
+
+    def _on_countdown(self, message: Dict[str, Any]) -> None:
+        countdown_value = message.get('value', 0)
+        logger.info(f"Tournament countdown: {countdown_value}")
+        # Store countdown value for tournament progression detection
+        if self._in_tournament:
+            self._tournament_countdown = countdown_value
+            self.publish_game_state()
+
+    def update_game_state(self, game_data: Dict[str, Any]) -> None:
         game_id = game_data.get('id', 'unknown')
         game_status = game_data.get('status', 'unknown')
-        logger.debug(f"Updating game state for game {game_id}, status: {game_status}")
+        self._log_update("Updating game state for game %s, status: %s", game_id, game_status)
 
         if game_status == 'finished':
-            logger.info(f"Ignoring finished game state update for game {game_id}")
+            logger.info("Ignoring finished game state update for game %s", game_id)
             return
 
         # In tournament mode, accept new game IDs (for next tournament level)
@@ -634,16 +1885,54 @@ class GameClient(BackendClient):
             if self._in_tournament:
                 logger.info(f"Tournament mode: accepting new game {game_id}, previous game: {self.game_id}")
                 # Update to the new tournament game
-                self.game_data = game_data
+                self._store_game_state(game_data)
                 self.game_id = game_id
+                self.publish_game_state()
                 return
             else:
-                logger.debug(f"Ignoring game state update for different game {game_id}, current game: {self.game_id}")
+                self._log_other_game("Ignoring game state update for different game %s, current game: %s", game_id, self.game_id)
                 return
 
-        self.game_data = game_data
+        self._store_game_state(game_data)
         if not self.game_id:
             self.game_id = game_id
+        self.publish_game_state()
+
+    def _store_game_state(self, game_data: Dict[str, Any]) -> None:
+        live_game = self._live_game
+        live_game.update_from_dict(game_data)
+        live_game.received_at = time.monotonic()
+        self.game_data = live_game if self.ui_loop is None else live_game.copy()
+        self.latency.game_state_received(live_game, time.time())
+
+    def on_frame_received(self, now: float) -> None:
+        # measured on arrival, so time spent queued for dispatch does not look like network jitter
+        self.latency.message_received(now)
+
+    def on_reconnected(self) -> None:
+        """
+        game_id, tournament_id and the player side survive the reconnect. The
+        backend ends a match when a player's socket closes, so a match that does
+        not send game states anymore is ended locally instead of waiting forever.
+        """
+        logger.info(f"Resuming after reconnect: game {self.game_id}, tournament {self.tournament_id}")
+        if self.game_id and not self._game_over_data:
+            if self._resume_watchdog:
+                self._resume_watchdog.cancel()
+            self._resume_watchdog = asyncio.create_task(self._watch_game_resume(self.game_id))
+
+    async def _watch_game_resume(self, game_id: str) -> None:
+        version = self.game_state_version
+        await asyncio.sleep(self.GAME_RESUME_TIMEOUT)
+        if self.game_id != game_id or self._game_over_data or self.game_state_version != version:
+            return
+        logger.warning(f"Game {game_id} did not resume after the reconnect, ending it")
+        self.handle_game_over({
+            "gameId": game_id,
+            "winnerId": "",
+            "message": "Connection to the server was lost during the match",
+            "finalScore": {"left": self._live_game.left_score, "right": self._live_game.right_score},
+        })
 
     def handle_game_over(self, pong_data: Dict[str, Any]) -> None:
         logger.info(f"Handling game over: {pong_data}")
@@ -652,6 +1941,7 @@ class GameClient(BackendClient):
             self.game_data = None
             self.game_id = None
         self._game_over_data = pong_data
+        self.publish_game_state()
 
     @staticmethod
     def to_pong_api_request(payload: Dict[str, Any]) -> str:
@@ -668,7 +1958,7 @@ class GameClient(BackendClient):
                 "pong_data": {}
             }
         )
-        await self.send_to_server(get_games_request)
+        await self.outgoing_messages.put(get_games_request)
         try:
             games_data = await asyncio.wait_for(self._available_games.get(), timeout=3)
             self._available_games = asyncio.Queue()
@@ -694,24 +1984,39 @@ class GameClient(BackendClient):
         except Exception as e:
             error_msg = traceback.format_exc()
             logger.error(f"Failed to get joinable games: {error_msg}")
-            self._error = (error_msg, 420)
+            self.set_error(error_msg, 420)
             return []
 
     def set_input_state(self, *, up: Optional[bool] = None, down: Optional[bool] = None) -> None:
         """Set the continuous input state for paddle movement"""
-        import time
-        current_time = time.time()
+        current_time = time.monotonic()
 
         if up is not None:
             self.input_state["up"] = up
             if up:
                 self.last_key_time["up"] = current_time
-            logger.debug(f"Input state UP: {up}")
+            self._log_input_state("Input state UP: %s", up)
         if down is not None:
             self.input_state["down"] = down
             if down:
                 self.last_key_time["down"] = current_time
-            logger.debug(f"Input state DOWN: {down}")
+            self._log_input_state("Input state DOWN: %s", down)
+
+    def _encode_input_frames(self) -> Dict[bool, str]:
+        """Input messages only depend on the user id and the direction, so they are encoded once per session"""
+        if self._input_frames_user != self.user_id:
+            self._input_frames = {
+                up: self.to_pong_api_request({
+                    "type": "input",
+                    "pong_data": {
+                        "userId": self.user_id,
+                        "up": up
+                    }
+                })
+                for up in (True, False)
+            }
+            self._input_frames_user = self.user_id
+        return self._input_frames
 
     async def start_continuous_input(self) -> None:
         """Start the continuous input sender task"""
@@ -734,53 +2039,62 @@ class GameClient(BackendClient):
             except asyncio.CancelledError:
                 pass
         logger.info("Stopped continuous input sender")
+        if self.input_stats:
+            self.input_stats.stopped_at = time.monotonic()
+            logger.info(self.input_stats.summary())
 
     async def _continuous_input_sender(self) -> None:
-        """Continuously send input messages while keys are pressed (like web frontend)"""
-        import time
-
+        """
+        Continuously send input messages while keys are pressed (like web frontend).
+        Ticks come from the shared scheduler: a late tick is sent right away to
+        catch up, ticks that are more than a full interval late are skipped.
+        """
         # Match web frontend TICKRATE (approximately 60 FPS for smooth movement)
         tick_rate = 60  # Hz
-        interval = 1.0 / tick_rate
+        frames = self._encode_input_frames()
+        stats = self.input_stats = InputSendStats(tick_rate=tick_rate, started_at=time.monotonic())
+        loop = asyncio.get_running_loop()
+        ticker = self.scheduler.ticker(tick_rate, "input")
 
         logger.info(f"Continuous input sender started at {tick_rate} Hz")
 
-        while self.input_active:
-            try:
-                current_time = time.time()
-
-                # Check for key timeouts and auto-release
-                for key in ["up", "down"]:
-                    if self.input_state[key] and (current_time - self.last_key_time[key]) > self.key_timeout:
-                        self.input_state[key] = False
-                        logger.debug(f"Auto-released {key} key due to timeout")
-
-                # Send input for any currently pressed keys
-                if self.input_state["up"]:
-                    msg = self.to_pong_api_request({
-                        "type": "input",
-                        "pong_data": {
-                            "userId": self.user_id,
-                            "up": True
-                        }
-                    })
-                    self.outgoing_messages.put_nowait(msg)
-
-                if self.input_state["down"]:
-                    msg = self.to_pong_api_request({
-                        "type": "input",
-                        "pong_data": {
-                            "userId": self.user_id,
-                            "up": False
-                        }
-                    })
-                    self.outgoing_messages.put_nowait(msg)
-
-                await asyncio.sleep(interval)
-            except Exception as e:
-                logger.error(f"Error in continuous input sender: {e}")
-                break
-
+        try:
+            while self.input_active:
+                try:
+                    await ticker.wait()
+                    current_time = time.monotonic()
+                    stats.jitter.record(max(0.0, loop.time() - ticker.job.last_deadline))
+                    stats.missed_ticks = ticker.job.missed
+                    stats.ticks += 1
+
+                    # Check for key timeouts and auto-release
+                    for key in ("up", "down"):
+                        if self.input_state[key] and (current_time - self.last_key_time[key]) > self.key_timeout:
+                            self.input_state[key] = False
+                            logger.debug("Auto-released %s key due to timeout", key)
+
+                    # Send input for any currently pressed keys
+                    for up, key in ((True, "up"), (False, "down")):
+                        if not self.input_state[key]:
+                            continue
+                        if not self.ws or self.ws.closed:
+                            stats.dropped += 1
+                            continue
+                        await self.ws.send_str(frames[up])
+                        if self.recorder:
+                            self.recorder.record(SessionRecorder.OUTGOING, frames[up])
+                        stats.messages_sent += 1
+                        self.latency.input_sent(up, time.monotonic())
+                        if self.paddle_predictor:
+                            if self.ui_loop is None:
+                                self.paddle_predictor.apply_input(up=up)
+                            else:
+                                self.ui_loop.call_soon_threadsafe(self.paddle_predictor.apply_input, up)
+                except Exception as e:
+                    logger.error(f"Error in continuous input sender: {e}")
+                    break
+        finally:
+            ticker.cancel()
         logger.info("Continuous input sender stopped")
 
     async def create_new_game(self, mode: str, max_score: int, player_alias: str) -> None:
@@ -795,6 +2109,7 @@ class GameClient(BackendClient):
                 }
             }
         )
+        self.player_side = "left"
         await self.outgoing_messages.put(create_game_request)
 
     async def join_game(self, game_id: str, player_alias: str) -> None:
@@ -809,11 +2124,15 @@ class GameClient(BackendClient):
                 }
             }
         )
+        self.player_side = "right"
         await self.outgoing_messages.put(join_game_request)
 
     def clear_game_state(self) -> None:
         logger.info("Clearing game state")
+        self.player_side = None
         self.game_data = None
+        # the next match gets a fresh model that is then updated in place on every frame
+        self._live_game = LiveGameState()
         self.game_id = None
         self._game_over_data = None
 
@@ -825,6 +2144,7 @@ class GameClient(BackendClient):
 
         await self.create_new_game(mode, max_score, player_alias)
 
+        ticker = self.scheduler.ticker(10, "wait-for-game")
         try:
             timeout = 5.0
             start_time = time.time()
@@ -844,7 +2164,7 @@ class GameClient(BackendClient):
                         'countdown': None
                     }
                     return PongGame.from_dict(pong_game_data)
-                await asyncio.sleep(0.1)
+                await ticker.wait()
 
             logger.error("Timeout waiting for game creation confirmation")
             return None
@@ -852,6 +2172,8 @@ class GameClient(BackendClient):
         except Exception as e:
             logger.error(f"Error creating game: {e}")
             return None
+        finally:
+            ticker.cancel()
 
     async def get_joinable_tournaments(self) -> List[Tournament]:
         logger.info("Requesting list of joinable tournaments")
@@ -861,7 +2183,7 @@ class GameClient(BackendClient):
                 "pong_data": {}
             }
         )
-        await self.send_to_server(get_tournaments_request)
+        await self.outgoing_messages.put(get_tournaments_request)
         try:
             tournaments_data = await asyncio.wait_for(self._available_tournaments.get(), timeout=3)
             self._available_tournaments = asyncio.Queue()
@@ -874,7 +2196,7 @@ class GameClient(BackendClient):
         except Exception as e:
             error_msg = traceback.format_exc()
             logger.error(f"Failed to get joinable tournaments: {error_msg}")
-            self._error = (error_msg, 420)
+            self.set_error(error_msg, 420)
             return []
 
     async def create_tournament(self, player_alias: str) -> None:
@@ -915,6 +2237,7 @@ class GameClient(BackendClient):
 
         await self.create_tournament(player_alias)
 
+        ticker = self.scheduler.ticker(10, "wait-for-tournament")
         try:
             timeout = 5.0
             start_time = time.time()
@@ -928,7 +2251,7 @@ class GameClient(BackendClient):
                         state="waiting"
                     )
                     return tournament
-                await asyncio.sleep(0.1)
+                await ticker.wait()
 
             logger.error("Timeout waiting for tournament creation confirmation")
             return None
@@ -936,6 +2259,8 @@ class GameClient(BackendClient):
         except Exception as e:
             logger.error(f"Error creating tournament: {e}")
             return None
+        finally:
+            ticker.cancel()
 
     def clear_tournament_state(self) -> None:
         logger.info("Clearing tournament state")
@@ -949,14 +2274,841 @@ class GameClient(BackendClient):
         self._game_over_data = None
 
 
+class NetworkThread:
+    """
+    Event loop on a thread of its own for the network side of a GameClient: the
+    websocket reader, message decoding, token refreshes and the input sender.
+    A blocking curses call or a slow screen on the UI loop then no longer delays
+    them. Everything that loop owns must only be touched through `run` and `call_soon`.
+    """
+    def __init__(self) -> None:
+        self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name="network", daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+        logger.info("Network thread started")
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+            # cancel what is left over, e.g. the tasks of a cancelled `run`
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        finally:
+            self.loop.close()
+
+    async def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run `coro` on the network loop and wait for its result; cancelling the caller cancels it"""
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.loop))
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    async def stop(self) -> None:
+        if not self.thread.is_alive():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        await asyncio.to_thread(self.thread.join, 5.0)
+        logger.info("Network thread stopped")
+
+
+class NetworkClientProxy:
+    """
+    A GameClient running on a NetworkThread, as seen from the UI loop. Coroutine
+    methods run on the network loop and state changes are queued there in call
+    order. Everything else (reading the state, subscriptions, set_input_state)
+    is used directly: game states are handed over as snapshots and subscribers
+    are woken up on the UI loop, see GameClient.ui_loop. Errors are stored on
+    the UI loop as well (set_error) and websocket frames for the debug screen
+    are passed through a thread-safe queue.
+
+    Two attributes are shared without a handoff. `debug_mode` is only set and
+    cleared by the UI, the network loop checks it and nothing waits on it.
+    Every histogram of `latency` has a single writer, the network loop for the
+    receive, server age and input echo times and the UI for the render time.
+    The UI reads the others for the HUD and the report. Their lists never
+    change size, so a read is at worst one sample behind. The game screen
+    replaces `latency` for every match with a single attribute assignment.
+    """
+    # methods that change state the network loop is working with
+    NETWORK_CALLS = frozenset({"clear_game_state", "clear_tournament_state", "mark_startup"})
+
+    def __init__(self, client: GameClient, network: NetworkThread) -> None:
+        object.__setattr__(self, "_client", client)
+        object.__setattr__(self, "_network", network)
+        # timers of the UI, the client's scheduler runs on the network loop
+        object.__setattr__(self, "scheduler", TickScheduler())
+        client.ui_loop = asyncio.get_running_loop()
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._client, name)
+        if not callable(value):
+            return value
+        if inspect.iscoroutinefunction(value):
+            return lambda *args, **kwargs: self._network.run(value(*args, **kwargs))
+        if name in self.NETWORK_CALLS:
+            return lambda *args: self._network.call_soon(value, *args)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._client, name, value)
+
+
+@dataclass
+class RenderStats:
+    frames: int = 0
+    cells_touched: int = 0
+    bytes_written: int = 0
+
+    def per_frame(self) -> Tuple[float, float]:
+        """Average (cells, bytes) written per frame"""
+        if not self.frames:
+            return 0.0, 0.0
+        return self.cells_touched / self.frames, self.bytes_written / self.frames
+
+
+class GameRenderer:
+    """
+    Draws the static game field once and afterwards only repaints the cells
+    that changed since the previous frame (ball, paddles and text lines).
+    """
+    PADDLE_HEIGHT: int = 5
+    BALL_GLYPH: str = 'O'
+    PADDLE_GLYPH: str = '█'
+
+    def __init__(self, stdscr: Any, max_y: int, max_x: int) -> None:
+        self.stdscr = stdscr
+        self.screen_cells: int = (max_y + 1) * (max_x + 1)
+        self.game_width: int = max_x - 10
+        self.game_height: int = max_y - 6
+        self.start_x: int = 5
+        self.start_y: int = 3
+        self.left_paddle_x: int = self.start_x + 1
+        self.right_paddle_x: int = self.start_x + self.game_width - 2
+        self.center_x: int = self.start_x + (self.game_width // 2)
+        # first of the rows below the field, used by the latency HUD
+        self.hud_y: int = self.start_y + self.game_height + 1
+        self.stats = RenderStats()
+        # glyphs of the static field, used to restore cells the ball or a paddle left
+        self._background: Dict[Tuple[int, int], Any] = {}
+        # dynamic cells drawn in the previous frame
+        self._cells: Dict[Tuple[int, int], str] = {}
+        # text currently shown per row, keyed by (y, x)
+        self._text: Dict[Tuple[int, int], str] = {}
+        # position of the last written cell, to estimate cursor movement cost
+        self._cursor: Tuple[int, int] = (-1, -1)
+        # digits of every row and column number in a cursor addressing sequence
+        self._address_digits: List[int] = [len(str(n + 1)) for n in range(max(max_y, max_x) + 2)]
+
+    def _count(self, y: int, x: int, text: str) -> None:
+        """Account for one write of `text` at (y, x) in the render statistics"""
+        stats = self.stats
+        stats.cells_touched += len(text)
+        stats.bytes_written += len(text) if text.isascii() else len(text.encode())
+        if self._cursor != (y, x):
+            # cursor addressing sequence: ESC [ row ; col H
+            stats.bytes_written += 4 + self._address_digits[y] + self._address_digits[x]
+        self._cursor = (y, x + len(text))
+
+    def _put(self, y: int, x: int, glyph: Any) -> None:
+        try:
+            self.stdscr.addch(y, x, glyph)
+        except curses.error:
+            pass
+        self._count(y, x, glyph if isinstance(glyph, str) else ' ')
+
+    def draw_field(self) -> None:
+        """Clear the screen and draw borders, corners and center line"""
+        start_x, start_y = self.start_x, self.start_y
+        end_x, end_y = start_x + self.game_width, start_y + self.game_height
+        self.stdscr.clear()
+        self._background.clear()
+        self._cells.clear()
+        self._text.clear()
+        self._cursor = (-1, -1)
+
+        background = self._background
+        for x in range(start_x, end_x + 1):
+            background[(start_y, x)] = curses.ACS_HLINE
+            background[(end_y, x)] = curses.ACS_HLINE
+        for y in range(start_y, end_y + 1):
+            background[(y, start_x)] = curses.ACS_VLINE
+            background[(y, end_x)] = curses.ACS_VLINE
+        background[(start_y, start_x)] = curses.ACS_ULCORNER
+        background[(start_y, end_x)] = curses.ACS_URCORNER
+        background[(end_y, start_x)] = curses.ACS_LLCORNER
+        background[(end_y, end_x)] = curses.ACS_LRCORNER
+        for y in range(start_y + 1, end_y):
+            if y % 2 == 0:
+                background[(y, self.center_x)] = '|'
+
+        for (y, x), glyph in background.items():
+            self._put(y, x, glyph)
+
+    def draw_text(self, y: int, x: int, text: str) -> None:
+        """Draw a text line, skipping it when unchanged and blanking leftovers of longer previous text"""
+        previous = self._text.get((y, x))
+        if previous == text:
+            return
+        padded = text.ljust(len(previous)) if previous else text
+        try:
+            self.stdscr.addstr(y, x, padded)
+        except curses.error:
+            pass
+        self._count(y, x, padded)
+        self._text[(y, x)] = text
+
+    def draw_objects(self, ball_x: int, ball_y: int, left_paddle_y: int, right_paddle_y: int) -> None:
+        """Repaint only the ball and paddle cells that differ from the previous frame"""
+        top, bottom = self.start_y + 1, self.start_y + self.game_height
+        cells: Dict[Tuple[int, int], str] = {}
+        for y in range(self.PADDLE_HEIGHT):
+            if top <= left_paddle_y + y < bottom:
+                cells[(left_paddle_y + y, self.left_paddle_x)] = self.PADDLE_GLYPH
+            if top <= right_paddle_y + y < bottom:
+                cells[(right_paddle_y + y, self.right_paddle_x)] = self.PADDLE_GLYPH
+        if self.start_x + 1 <= ball_x < self.start_x + self.game_width and top <= ball_y < bottom:
+            cells[(ball_y, ball_x)] = self.BALL_GLYPH
+        self._repaint(cells)
+
+    def draw_positions(self, ball_x: float, ball_y: float, left_paddle_y: float, right_paddle_y: float) -> None:
+        """Draw the ball and the paddle tops given as fractions of the field size"""
+        self.draw_objects(
+            self.start_x + int(ball_x * self.game_width),
+            self.start_y + int(ball_y * self.game_height),
+            self.start_y + int(left_paddle_y * self.game_height),
+            self.start_y + int(right_paddle_y * self.game_height),
+        )
+
+    def draw_frame(
+        self,
+        header: str,
+        instructions: str,
+        state: Optional[LiveGameState],
+        frame_rate: str,
+        left_score: int,
+        right_score: int,
+        hud_lines: Optional[List[str]],
+        positions: Tuple[float, float, float, float],
+    ) -> None:
+        """
+        Everything PongCli.game_screen draws in a frame, without flushing it.
+        `state` gives the status line, `hud_lines` None leaves the HUD rows as
+        they are and `positions` are the ball and paddle tops as fractions of the field.
+        """
+        self.draw_text(0, 0, header)
+        self.draw_text(1, 0, instructions)
+
+        if state:
+            status_line = f"Status: {state.status}"
+            if state.status == 'countdown' and state.countdown > 0:
+                status_line = f"{status_line:<20}Starting in: {state.countdown}"
+            self.draw_text(2, 0, f"{status_line:<40}{frame_rate}")
+
+        score_x = self.start_x + (self.game_width // 2) - 5
+        self.draw_text(self.start_y - 2, score_x, f"{left_score}   -   {right_score}")
+
+        if hud_lines is not None:
+            for row, line in enumerate(hud_lines):
+                self.draw_text(self.hud_y + row, 0, line)
+
+        # paddles and ball, repainting only what moved
+        self.draw_positions(*positions)
+
+    def _repaint(self, cells: Dict[Tuple[int, int], str]) -> None:
+        """Write the dynamic cells that differ from the previous frame and restore the ones left"""
+        previous = self._cells
+        for position in previous.keys() - cells.keys():
+            self._put(*position, self._background.get(position, ' '))
+        for position, glyph in cells.items():
+            if previous.get(position) != glyph:
+                self._put(*position, glyph)
+        self._cells = cells
+
+    def present(self) -> None:
+        """Flush the frame to the terminal"""
+        self.stdscr.refresh()
+        self.stats.frames += 1
+
+    def log_stats(self) -> None:
+        cells, written = self.stats.per_frame()
+        logger.info(
+            f"Render stats: {self.stats.frames} frames, {self.stats.cells_touched} cells / "
+            f"{self.stats.bytes_written} bytes total, {cells:.1f} cells / {written:.1f} bytes per frame "
+            f"(full redraw: {self.screen_cells} cells per frame)"
+        )
+
+
+class HalfBlockRenderer(GameRenderer):
+    """
+    Draws the ball and the paddles with half block glyphs, which doubles the
+    vertical resolution: the ball moves by half a row instead of jumping a whole
+    one. The cells and glyphs for every half row are looked up in tables built
+    once per field size, so a frame does no more work than GameRenderer.
+    """
+    # glyph of a cell by its filled halves, bit 1 is the upper and bit 2 the lower half
+    GLYPHS: Tuple[str, ...] = (' ', '▀', '▄', '█')
+
+    def __init__(self, stdscr: Any, max_y: int, max_x: int) -> None:
+        super().__init__(stdscr, max_y, max_x)
+        self.half_rows: int = self.game_height * 2
+        top, bottom = self.start_y + 1, self.start_y + self.game_height
+        # half row -> (row, halves) of the ball, None on the border
+        self._ball_cells: List[Optional[Tuple[int, int]]] = []
+        # half row of the paddle top -> ((row, column), glyph) of every visible cell of that paddle
+        self._left_cells: List[Tuple[Tuple[Tuple[int, int], str], ...]] = []
+        self._right_cells: List[Tuple[Tuple[Tuple[int, int], str], ...]] = []
+        paddle_halves = self.PADDLE_HEIGHT * 2
+        for half in range(self.half_rows + 1):
+            y = self.start_y + half // 2
+            self._ball_cells.append((y, 1 << (half % 2)) if top <= y < bottom else None)
+            halves: Dict[int, int] = {}
+            for covered in range(half, half + paddle_halves):
+                row = self.start_y + covered // 2
+                if top <= row < bottom:
+                    halves[row] = halves.get(row, 0) | 1 << (covered % 2)
+            self._left_cells.append(tuple(((row, self.left_paddle_x), self.GLYPHS[bits]) for row, bits in halves.items()))
+            self._right_cells.append(tuple(((row, self.right_paddle_x), self.GLYPHS[bits]) for row, bits in halves.items()))
+        self._halves_of: Dict[str, int] = {glyph: bits for bits, glyph in enumerate(self.GLYPHS)}
+
+    def draw_positions(self, ball_x: float, ball_y: float, left_paddle_y: float, right_paddle_y: float) -> None:
+        half_rows = self.half_rows
+        left = int(left_paddle_y * half_rows)
+        right = int(right_paddle_y * half_rows)
+        ball_half = int(ball_y * half_rows)
+        # predicted or extrapolated positions may leave the field
+        cells: Dict[Tuple[int, int], str] = dict(self._left_cells[min(max(left, 0), half_rows)])
+        cells.update(self._right_cells[min(max(right, 0), half_rows)])
+        x = self.start_x + int(ball_x * self.game_width)
+        if 0 <= ball_half <= half_rows and self.start_x < x < self.start_x + self.game_width:
+            ball = self._ball_cells[ball_half]
+            if ball:
+                y, halves = ball
+                # the ball may share a cell with a paddle end
+                shared = cells.get((y, x))
+                if shared:
+                    halves |= self._halves_of[shared]
+                cells[(y, x)] = self.GLYPHS[halves]
+        self._repaint(cells)
+
+
+class StateInterpolator:
+    """
+    Keeps the last few server states and returns ball and paddle positions for
+    any local time, so rendering is decoupled from the server broadcast rate.
+    Positions are interpolated `delay` seconds in the past and extrapolated
+    for at most `extrapolate_limit` seconds when updates are late.
+    """
+    BUFFER_SIZE: int = 8
+    # jumps larger than this (e.g. the ball reset after a point) are not interpolated
+    TELEPORT_DISTANCE: float = 0.25
+
+    def __init__(self, delay: float = 0.05, extrapolate_limit: float = 0.1) -> None:
+        self.delay = delay
+        self.extrapolate_limit = extrapolate_limit
+        # (time, ball_x, ball_y, left_paddle_y, right_paddle_y), oldest first
+        self._samples: deque[Tuple[float, float, float, float, float]] = deque(maxlen=self.BUFFER_SIZE)
+        self._last_server_time: int = 0
+        # smallest (receipt - server) time seen, maps server timestamps onto the local clock
+        self._clock_offset: Optional[float] = None
+
+    def clear(self) -> None:
+        self._samples.clear()
+        self._last_server_time = 0
+        self._clock_offset = None
+
+    def _sample_time(self, state: LiveGameState) -> float:
+        """
+        Key a state by its server timestamp (lastUpdateTime, in ms) while the
+        server provides increasing ones, otherwise by its local receipt time.
+        """
+        server_time = state.last_update_time
+        if server_time > self._last_server_time > 0:
+            offset = state.received_at - server_time / 1000
+            if self._clock_offset is None or offset < self._clock_offset:
+                self._clock_offset = offset
+            self._last_server_time = server_time
+            return server_time / 1000 + self._clock_offset
+        self._last_server_time = server_time
+        return state.received_at
+
+    def push(self, state: LiveGameState) -> None:
+        sample_time = self._sample_time(state)
+        if self._samples and sample_time <= self._samples[-1][0]:
+            self._samples.pop()
+        self._samples.append((
+            sample_time, state.ball_x, state.ball_y, state.left_paddle_y, state.right_paddle_y
+        ))
+
+    def sample(self, now: float) -> Optional[Tuple[float, float, float, float]]:
+        """Positions (ball_x, ball_y, left_paddle_y, right_paddle_y) at local time `now`"""
+        samples = self._samples
+        if not samples:
+            return None
+        render_time = now - self.delay
+        newest = samples[-1]
+        if render_time >= newest[0]:
+            if len(samples) < 2:
+                return newest[1:]
+            # updates are late: extrapolate from the last two states for a limited time
+            previous = samples[-2]
+            return self._blend(previous, newest, render_time, min(render_time - newest[0], self.extrapolate_limit))
+        for index in range(len(samples) - 1, 0, -1):
+            older = samples[index - 1]
+            if older[0] <= render_time:
+                return self._blend(older, samples[index], render_time, 0.0)
+        return samples[0][1:]
+
+    def _blend(
+        self, older: Tuple[float, ...], newer: Tuple[float, ...], render_time: float, overshoot: float
+    ) -> Tuple[float, float, float, float]:
+        span = newer[0] - older[0]
+        if span <= 0:
+            return newer[1:]
+        if overshoot:
+            fraction = 1.0 + overshoot / span
+        else:
+            fraction = (render_time - older[0]) / span
+        positions = []
+        for old_value, new_value in zip(older[1:], newer[1:]):
+            if abs(new_value - old_value) > self.TELEPORT_DISTANCE:
+                positions.append(new_value)
+            else:
+                positions.append(min(1.0, max(0.0, old_value + (new_value - old_value) * fraction)))
+        return positions[0], positions[1], positions[2], positions[3]
+
+
+class PaddlePredictor:
+    """
+    Client-side prediction of the own paddle. Mirrors PongGamePaddle.updatePos in
+    backend/src/api/pong/PongPaddle.ts: every input message moves the paddle by
+    SPEED unless that would leave the field. Inputs get a local sequence number
+    and stay pending until an authoritative state shows the server applied them;
+    pending inputs are replayed on top of the server position and mispredictions
+    are corrected over a few frames.
+    """
+    SPEED: float = 0.01
+    # pending inputs older than this are assumed to be lost or rejected at the field border
+    INPUT_TIMEOUT: float = 0.5
+    # share of a misprediction that is still shown after each frame
+    CORRECTION_DECAY: float = 0.5
+    # larger corrections (e.g. paddles reset after a point) are applied at once
+    SNAP_DISTANCE: float = 0.1
+
+    def __init__(self, side: str, on_change: Optional[Callable[[], None]] = None) -> None:
+        self.side = side
+        self.on_change = on_change
+        self.height: float = 0.2
+        self.server_y: Optional[float] = None
+        self.acked_seq: int = -1
+        self.changed: bool = False
+        self._next_seq: int = 0
+        # (sequence number, monotonic send time, up)
+        self._pending: deque[Tuple[int, float, bool]] = deque()
+        self._predicted: Optional[float] = None
+        self._correction: float = 0.0
+
+    def _step(self, y: float, up: bool) -> float:
+        if up:
+            return y - self.SPEED if y - self.SPEED >= 0 else y
+        return y + self.SPEED if y + self.height + self.SPEED <= 1 else y
+
+    def apply_input(self, up: bool) -> int:
+        """Predict the effect of an input message that was just sent, returns its sequence number"""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._pending.append((seq, time.monotonic(), up))
+        if self._predicted is not None:
+            self._predicted = self._step(self._predicted, up)
+            self.changed = True
+            if self.on_change:
+                self.on_change()
+        return seq
+
+    def on_server_state(self, y: float, height: float) -> None:
+        """Reconcile the prediction with an authoritative paddle position"""
+        self.height = height
+        if self.server_y is not None:
+            # the server moved the paddle once per applied input: acknowledge that many, oldest first
+            moved = round((y - self.server_y) / self.SPEED)
+            while moved and self._pending and self._pending[0][2] == (moved < 0):
+                self.acked_seq = self._pending.popleft()[0]
+                moved += 1 if moved < 0 else -1
+        now = time.monotonic()
+        while self._pending and now - self._pending[0][1] > self.INPUT_TIMEOUT:
+            self.acked_seq = self._pending.popleft()[0]
+        self.server_y = y
+
+        target = y
+        for _, _, up in self._pending:
+            target = self._step(target, up)
+        if self._predicted is not None:
+            # keep showing the previous position and converge to the new target
+            self._correction += self._predicted - target
+            if abs(self._correction) > self.SNAP_DISTANCE:
+                self._correction = 0.0
+        self._predicted = target
+        self.changed = True
+
+    def position(self) -> Optional[float]:
+        """Paddle position to display this frame"""
+        self.changed = False
+        if self._predicted is None:
+            return None
+        y = self._predicted + self._correction
+        self._correction = self._correction * self.CORRECTION_DECAY if abs(self._correction) > 1e-4 else 0.0
+        return y
+
+
+class InputLatencyTracker:
+    """Measures the time from pressing a movement key until the own paddle moves on screen"""
+    TIMEOUT: float = 1.0
+
+    def __init__(self, histogram: LatencyHistogram) -> None:
+        self.histogram = histogram
+        # (monotonic press time, up, paddle row at press time)
+        self._press: Optional[Tuple[float, bool, int]] = None
+
+    def key_pressed(self, up: bool, row: int) -> None:
+        if self._press is None:
+            self._press = (time.monotonic(), up, row)
+
+    def frame_drawn(self, row: int) -> None:
+        if self._press is None:
+            return
+        pressed_at, up, pressed_row = self._press
+        now = time.monotonic()
+        if (row < pressed_row) if up else (row > pressed_row):
+            self.histogram.record(now - pressed_at)
+            self._press = None
+        elif now - pressed_at > self.TIMEOUT:
+            # the paddle could not move (field border) or the input was lost
+            self._press = None
+
+
+class FramePacer:
+    """
+    Frame rate of the game screen, adapted to the terminal: when refresh() takes
+    more than REFRESH_SHARE of the frame interval (a slow terminal or ssh link)
+    the rate drops until the output keeps up, and climbs back once refreshes are
+    fast again. Also measures how often the server sends new states and the
+    frame rate actually achieved, for the status line. Both are counted over
+    the adjustment window, so the status line changes at most once per window.
+    """
+    START_FPS: float = 30.0
+    MAX_FPS: float = 60.0
+    MIN_FPS: float = 5.0
+    # share of the frame interval refresh() may take
+    REFRESH_SHARE: float = 0.5
+    # seconds between adjustments, also the window of the effective frame rate
+    ADJUST_INTERVAL: float = 1.0
+    # largest step up per adjustment, steps down are taken at once
+    MAX_INCREASE: float = 1.25
+    # weight of the newest sample in the moving averages
+    ALPHA: float = 0.2
+
+    def __init__(self, now: float) -> None:
+        self.fps: float = self.START_FPS
+        self.effective_fps: float = 0.0
+        self.state_rate: float = 0.0
+        # moving average in seconds
+        self.refresh_time: float = 0.0
+        self._window_start: float = now
+        self._window_frames: int = 0
+        self._window_states: int = 0
+        self.adjustments: int = 0
+
+    def state_received(self) -> None:
+        self._window_states += 1
+
+    def frame_presented(self, now: float, refresh_time: float) -> bool:
+        """Account one frame and its refresh() time, returns True when `fps` changed"""
+        if self.refresh_time:
+            refresh_time = self.refresh_time + self.ALPHA * (refresh_time - self.refresh_time)
+        self.refresh_time = refresh_time
+        self._window_frames += 1
+        elapsed = now - self._window_start
+        if elapsed < self.ADJUST_INTERVAL:
+            return False
+        self.effective_fps = self._window_frames / elapsed
+        self.state_rate = self._window_states / elapsed
+        self._window_start, self._window_frames, self._window_states = now, 0, 0
+
+        target = min(self.MAX_FPS, self.fps * self.MAX_INCREASE)
+        if self.refresh_time > 0:
+            target = min(target, self.REFRESH_SHARE / self.refresh_time)
+        target = max(self.MIN_FPS, float(round(target)))
+        if target == self.fps:
+            return False
+        logger.info(
+            "Frame rate %g -> %g fps (refresh %.1fms, effective %.1f fps, server %.1f states/s)",
+            self.fps, target, self.refresh_time * 1000, self.effective_fps, self.state_rate
+        )
+        self.fps = target
+        self.adjustments += 1
+        return True
+
+    def status(self) -> str:
+        return f"{self.effective_fps:.0f} fps (limit {self.fps:g}, server {self.state_rate:.0f}/s)"
+
+    def summary(self) -> str:
+        return (
+            f"Frame pacing: {self.fps:g} fps at the end, {self.adjustments} adjustments, "
+            f"refresh {self.refresh_time * 1000:.2f}ms, server {self.state_rate:.1f} states/s"
+        )
+
+
+class KeyboardSource:
+    """
+    Keys typed in the terminal as an async stream. stdin is watched by the event
+    loop and curses only decodes the keys once it is readable, so waiting for a
+    key costs no wakeups and a key is delivered as soon as it arrives.
+    """
+    def __init__(self, stdscr: Any, fd: Optional[int] = None) -> None:
+        self.stdscr = stdscr
+        self.fd: int = fd if fd is not None else sys.stdin.fileno()
+        self._keys: Deque[int] = deque()
+        # events of everyone waiting for a key, set together with other wakeup sources
+        self._listeners: List[asyncio.Event] = []
+        self.keys_read: int = 0
+        self.wakeups: int = 0
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self.fd, self._on_readable)
+
+    def _on_readable(self) -> None:
+        self.wakeups += 1
+        # curses may read several keys (or an escape sequence) at once, decode all of them
+        while (key := self.stdscr.getch()) != curses.ERR:
+            self._keys.append(key)
+            self.keys_read += 1
+        if self._keys:
+            for event in self._listeners:
+                event.set()
+
+    def attach(self, event: asyncio.Event) -> None:
+        """Set `event` whenever keys arrive"""
+        self._listeners.append(event)
+
+    def detach(self, event: asyncio.Event) -> None:
+        if event in self._listeners:
+            self._listeners.remove(event)
+
+    def get_nowait(self) -> Optional[int]:
+        """The next key that was typed, None if there is none"""
+        return self._keys.popleft() if self._keys else None
+
+    async def get(self, subscription: Optional[GameStateSubscription] = None) -> Optional[int]:
+        """
+        Wait for the next key. With a `subscription` this also returns (None)
+        when a new game state, error or tournament message is published.
+        """
+        event = subscription.wakeup if subscription else asyncio.Event()
+        self.attach(event)
+        try:
+            while not self._keys:
+                if subscription and subscription.changed:
+                    return None
+                event.clear()
+                await event.wait()
+            return self._keys.popleft()
+        finally:
+            self.detach(event)
+
+    def close(self) -> None:
+        self._loop.remove_reader(self.fd)
+        logger.info(f"Keyboard: {self.keys_read} keys in {self.wakeups} wakeups")
+
+
+class FrameProfiler:
+    """
+    Time spent in the phases of every game_screen iteration: draining the keys,
+    applying the new game state, drawing into the curses buffer and flushing it
+    to the terminal. The last `capacity` iterations are kept in a ring buffer
+    that is allocated once, so profiling does not allocate per frame. A
+    `sampler` only samples stacks while a match is on the screen.
+    """
+    PHASES: Tuple[str, ...] = ("input", "state", "draw", "refresh")
+    INPUT, STATE, DRAW, REFRESH = range(4)
+
+    def __init__(self, capacity: int = 16384, sampler: Optional["StackSampler"] = None) -> None:
+        self.capacity = capacity
+        self.sampler = sampler
+        # one row of phase durations per iteration, NaN for phases the iteration skipped
+        self._samples = array("d", [math.nan]) * (capacity * len(self.PHASES))
+        self._row: int = 0
+        self._mark: float = 0.0
+        self.frames: int = 0
+
+    def match_started(self) -> None:
+        if self.sampler:
+            self.sampler.resume()
+
+    def match_ended(self) -> None:
+        if self.sampler:
+            self.sampler.pause()
+
+    def frame_started(self) -> None:
+        self._row = (self.frames % self.capacity) * len(self.PHASES)
+        for phase in range(len(self.PHASES)):
+            self._samples[self._row + phase] = math.nan
+        self._mark = time.perf_counter()
+
+    def phase_ended(self, phase: int) -> None:
+        """Account the time since the previous phase (or the start of the iteration) to `phase`"""
+        now = time.perf_counter()
+        self._samples[self._row + phase] = now - self._mark
+        self._mark = now
+
+    def frame_ended(self) -> None:
+        self.frames += 1
+
+    def durations(self, phase: int) -> List[float]:
+        """Durations of `phase` in the kept iterations that ran it"""
+        rows = min(self.frames, self.capacity)
+        step = len(self.PHASES)
+        values = self._samples[phase:rows * step:step]
+        return [value for value in values if not math.isnan(value)]
+
+    def totals(self) -> List[float]:
+        """Duration of every kept iteration, all phases together"""
+        step = len(self.PHASES)
+        return [
+            math.fsum(value for value in self._samples[row:row + step] if not math.isnan(value))
+            for row in range(0, min(self.frames, self.capacity) * step, step)
+        ]
+
+    def report(self) -> str:
+        """Percentile table of every phase, in milliseconds"""
+        kept = min(self.frames, self.capacity)
+        lines = [
+            f"Frame phases of the last {kept} of {self.frames} game screen iterations (ms)",
+            f"{'phase':<10}{'count':>8}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}",
+        ]
+        columns = [(name, self.durations(phase)) for phase, name in enumerate(self.PHASES)]
+        columns.append(("total", self.totals()))
+        for name, values in columns:
+            if not values:
+                lines.append(f"{name:<10}{0:>8}")
+                continue
+            values.sort()
+            def at(percent: float) -> float:
+                return values[min(len(values) - 1, int(percent / 100 * len(values)))] * 1000
+            lines.append(
+                f"{name:<10}{len(values):>8}{math.fsum(values) / len(values) * 1000:>10.3f}"
+                f"{at(50):>10.3f}{at(90):>10.3f}{at(99):>10.3f}{values[-1] * 1000:>10.3f}"
+            )
+        return "\n".join(lines)
+
+
+class StackSampler:
+    """
+    Samples the Python stacks of some threads at a fixed rate from a thread of
+    its own and counts them in the collapsed format of flamegraph.pl, speedscope
+    and similar tools: one line per stack, frames separated by ';', then the count.
+    Time spent in C functions (curses, json) shows up in their Python caller.
+    """
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.stacks: Dict[str, int] = {}
+        self.samples: int = 0
+        # thread id -> root frame name
+        self._threads: Dict[int, str] = {}
+        self._labels: Dict[Any, str] = {}
+        self._stop = threading.Event()
+        # samples are only taken while this is set
+        self._active = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def add_thread(self, thread: threading.Thread) -> None:
+        assert thread.ident is not None, "Thread is not running"
+        self._threads[thread.ident] = thread.name
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def resume(self) -> None:
+        self._active.set()
+
+    def pause(self) -> None:
+        self._active.clear()
+
+    def stop(self) -> None:
+        self._stop.set()
+        # wake the thread up if it is paused
+        self._active.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _label(self, code: Any) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+        return label
+
+    def _run(self) -> None:
+        while self._active.wait() and not self._stop.wait(self.interval):
+            if not self._active.is_set():
+                continue
+            frames = sys._current_frames()
+            for ident, name in self._threads.items():
+                frame = frames.get(ident)
+                if frame is None:
+                    continue
+                stack: List[str] = []
+                while frame is not None:
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(name)
+                key = ";".join(reversed(stack))
+                self.stacks[key] = self.stacks.get(key, 0) + 1
+            self.samples += 1
+            # drop the references to the frames before sleeping
+            del frames
+
+    def write_collapsed(self, path: Path) -> None:
+        with open(path, "w") as collapsed_file:
+            for stack, count in sorted(self.stacks.items()):
+                collapsed_file.write(f"{stack} {count}\n")
+
+
+LATENCY_REPORT_FILE: Path = Path(__file__).parent / "latency_pong_cli.jsonl"
+PROFILE_FILE: Path = Path(__file__).parent / "profile_pong_cli.txt"
+PROFILE_STACKS_FILE: Path = Path(__file__).parent / "profile_pong_cli.collapsed"
+
+
+@dataclass
+class CliSettings:
+    """Options of the terminal interface, see parse_args"""
+    interpolate: bool = False
+    interp_delay: float = 0.05
+    extrapolate_limit: float = 0.1
+    predict: bool = False
+    hud: bool = False
+    latency_report: Optional[Path] = LATENCY_REPORT_FILE
+    # seconds every frame blocks the UI loop, to test how the network copes with a slow terminal
+    slow_ui: float = 0.0
+    half_blocks: bool = False
+
+
 class PongCli:
     MAX_SCORE: int = 30
     GAME_MODES: List[str] = ["classic"]
+    GAME_INSTRUCTIONS: str = "Press 'q' to quit, ↑/↓ to move paddle, 'h' to toggle the latency HUD"
+    _log_arrow_key = RateLimitedLog(logger, logging.DEBUG)
 
-    def __init__(self, game_client: GameClient) -> None:
+    def __init__(
+        self, game_client: GameClient, settings: Optional[CliSettings] = None, profiler: Optional[FrameProfiler] = None
+    ) -> None:
         assert game_client.is_connected, "Backend client is not authenticated"
         logger.info("Initializing PongCli terminal interface")
         self.client: GameClient = game_client
+        self.settings: CliSettings = settings or CliSettings()
+        self.profiler: Optional[FrameProfiler] = profiler
         self.stdscr = curses.initscr()
         curses.noecho()
         curses.cbreak()
@@ -968,23 +3120,18 @@ class PongCli:
         self.stdscr.timeout(0)  # Ensure immediate return from getch()
         self.stdscr.clear()
         self.stdscr.refresh()
+        self.keyboard: KeyboardSource = KeyboardSource(self.stdscr)
         logger.info("PongCli terminal interface initialized successfully")
 
     async def run(self) -> None:
         logger.info("Starting PongCli main loop")
         async def wait_for_connection() -> None:
-            while True:
-                await asyncio.sleep(0.1)
-                if self.client.requires_2fa_input.is_set():
-                    logger.info("2FA input required, prompting user")
-                    self.client.got_2fa_input.set_result(
-                        await self.text_input(msg="Enter two-factor authentication code:")
-                    )
-                    self.client.requires_2fa_input.clear()
-                elif self.client.is_connected.is_set():
-                    break
+            while not await self.client.wait_for_sign_in():
+                logger.info("2FA input required, prompting user")
+                await self.client.submit_2fa_code(await self.text_input(msg="Enter two-factor authentication code:"))
         await asyncio.wait_for(wait_for_connection(), timeout=60)
         logger.info("Connection established, entering main menu loop")
+        self.client.mark_startup("menu")
         while True:
             # clear any previous game state before showing main menu
             self.client.clear_game_state()
@@ -1008,6 +3155,21 @@ class PongCli:
                 await self.show_game_result(game_result)
         raise GracefulExit(f"gui cancelled")
 
+    async def replay(self) -> None:
+        """Show the match of a replayed recording instead of the menus"""
+        logger.info("Waiting for the first game state of the replay")
+        self.print_at([(0, 0, "Waiting for the first game state of the recording (Ctrl-C to abort)...")])
+        subscription = self.client.subscribe_game_state()
+        try:
+            while self.client.game_data is None:
+                await subscription.wait()
+                subscription.take()
+        finally:
+            subscription.close()
+        game_result = await self.game_screen(PongGame.from_live_state(self.client.game_data))
+        await self.show_game_result(game_result)
+        raise GracefulExit("replay ended")
+
     def print_at(self, lines: List[Tuple[int, int, str]], refresh: bool = True) -> None:
         """
         Print text at the given coordinates (y, x).
@@ -1026,11 +3188,8 @@ class PongCli:
         self.print_at([(y, x, msg)])
         result = ""
         while True:
-            key = self.stdscr.getch()
-            if key == curses.ERR:
-                await asyncio.sleep(0.1)
-                continue
-            elif key == ord('\n'):
+            key = await self.keyboard.get()
+            if key == ord('\n'):
                 return result
             elif key in (curses.KEY_BACKSPACE, ord('\b'), ord('\x7f')):
                 result = result[:-1]
@@ -1049,10 +3208,8 @@ class PongCli:
 
     async def wait_until_input(self, input_key: Optional[str] = None) -> str:
         while True:
-            key = self.stdscr.getch()
-            if key == curses.ERR:
-                await asyncio.sleep(0.25)
-            elif input_key and key == ord(input_key):
+            key = await self.keyboard.get()
+            if input_key and key == ord(input_key):
                 return chr(key)
             elif not input_key:
                 return chr(key)
@@ -1099,34 +3256,38 @@ class PongCli:
         ]
         selected_item = 0
         self.draw_centered_menu(f"Welcome to Pong CLI {self.client.user_id}!", menu, selected_item)
-        while True:
-            key = self.stdscr.getch()
-            if key == curses.ERR:
-                await asyncio.sleep(0.05)
-            elif key == curses.KEY_UP:
-                selected_item = (selected_item - 1) % len(menu)
-                logger.debug(f"Menu navigation: UP, selected item: {selected_item}")
-                self.draw_centered_menu(f"Welcome to Pong CLI {self.client.user_id}!", menu, selected_item)
-            elif key == curses.KEY_DOWN:
-                selected_item = (selected_item + 1) % len(menu)
-                logger.debug(f"Menu navigation: DOWN, selected item: {selected_item}")
-                self.draw_centered_menu(f"Welcome to Pong CLI {self.client.user_id}!", menu, selected_item)
-            elif key == curses.KEY_ENTER or key == ord('\n'):
-                menu_option = menu[selected_item][0]
-                logger.info(f"User selected menu option: {menu_option}")
-                if menu[selected_item][1]:
-                    if ret_val := await menu[selected_item][1]():
-                        return ret_val
-                else:
-                    return None
-                self.draw_centered_menu(f"Welcome to Pong CLI {self.client.user_id}!", menu, selected_item)
-
-            if self.client._error:
-                error_msg = str(self.client._error)
-                logger.error(f"Displaying error to user: {error_msg}")
-                await self.show_error(error_msg=error_msg)
-                self.client._error = None
-                self.draw_centered_menu(f"Welcome to Pong CLI {self.client.user_id}!", menu, selected_item)
+        subscription = self.client.subscribe_game_state()
+        try:
+            while True:
+                # server errors wake the menu up as well
+                key = await self.keyboard.get(subscription)
+                if key is None:
+                    subscription.take()
+                elif key == curses.KEY_UP:
+                    selected_item = (selected_item - 1) % len(menu)
+                    logger.debug("Menu navigation: UP, selected item: %d", selected_item)
+                    self.draw_centered_menu(f"Welcome to Pong CLI {self.client.user_id}!", menu, selected_item)
+                elif key == curses.KEY_DOWN:
+                    selected_item = (selected_item + 1) % len(menu)
+                    logger.debug("Menu navigation: DOWN, selected item: %d", selected_item)
+                    self.draw_centered_menu(f"Welcome to Pong CLI {self.client.user_id}!", menu, selected_item)
+                elif key == curses.KEY_ENTER or key == ord('\n'):
+                    menu_option = menu[selected_item][0]
+                    logger.info(f"User selected menu option: {menu_option}")
+                    if menu[selected_item][1]:
+                        if ret_val := await menu[selected_item][1]():
+                            return ret_val
+                    else:
+                        return None
+                    self.draw_centered_menu(f"Welcome to Pong CLI {self.client.user_id}!", menu, selected_item)
+
+                if error := self.client.get_error():
+                    error_msg = str(error)
+                    logger.error(f"Displaying error to user: {error_msg}")
+                    await self.show_error(error_msg=error_msg)
+                    self.draw_centered_menu(f"Welcome to Pong CLI {self.client.user_id}!", menu, selected_item)
+        finally:
+            subscription.close()
 
     async def create_game_screen(self) -> Optional[PongGame]:
         game_mode = self.GAME_MODES[0]
@@ -1144,10 +3305,8 @@ class PongCli:
         selected_item = 0
         self.draw_centered_menu("Create a new game:", options, selected_item)
         while True:
-            key = self.stdscr.getch()
-            if key == curses.ERR:
-                await asyncio.sleep(0.01)
-            elif key == curses.KEY_UP:
+            key = await self.keyboard.get()
+            if key == curses.KEY_UP:
                 selected_item = (selected_item - 1) % len(options)
                 self.draw_centered_menu("Create a new game:", options, selected_item)
             elif key == curses.KEY_DOWN:
@@ -1212,10 +3371,8 @@ class PongCli:
         selected_item = 0
         self.draw_centered_menu(f"Select one of the available games to join (Alias: {player_alias}):", menu, selected_item, "Press q to go back")
         while True:
-            key = self.stdscr.getch()
-            if key == curses.ERR:
-                await asyncio.sleep(0.05)
-            elif key == curses.KEY_UP:
+            key = await self.keyboard.get()
+            if key == curses.KEY_UP:
                 selected_item = (selected_item - 1) % len(menu)
                 self.draw_centered_menu(f"Select one of the available games to join (Alias: {player_alias}):", menu, selected_item, "Press q to go back")
             elif key == curses.KEY_DOWN:
@@ -1242,10 +3399,8 @@ class PongCli:
         selected_item = 0
         self.draw_centered_menu("Create a new tournament (4 players):", options, selected_item)
         while True:
-            key = self.stdscr.getch()
-            if key == curses.ERR:
-                await asyncio.sleep(0.01)
-            elif key == curses.KEY_UP:
+            key = await self.keyboard.get()
+            if key == curses.KEY_UP:
                 selected_item = (selected_item - 1) % len(options)
                 self.draw_centered_menu("Create a new tournament (4 players):", options, selected_item)
             elif key == curses.KEY_DOWN:
@@ -1300,10 +3455,8 @@ class PongCli:
         selected_item = 0
         self.draw_centered_menu(f"Select one of the available tournaments to join (Alias: {player_alias}):", menu, selected_item, "Press q to go back")
         while True:
-            key = self.stdscr.getch()
-            if key == curses.ERR:
-                await asyncio.sleep(0.05)
-            elif key == curses.KEY_UP:
+            key = await self.keyboard.get()
+            if key == curses.KEY_UP:
                 selected_item = (selected_item - 1) % len(menu)
                 self.draw_centered_menu(f"Select one of the available tournaments to join (Alias: {player_alias}):", menu, selected_item, "Press q to go back")
             elif key == curses.KEY_DOWN:
@@ -1321,39 +3474,40 @@ class PongCli:
     async def tournament_waiting_screen(self, tournament: Tournament, player_alias: str) -> Optional[PongGame]:
         logger.info(f"Entering tournament waiting screen for tournament: {tournament.id}")
 
-        while True:
-            self.stdscr.clear()
-            self.stdscr.addstr(0, 0, f"Tournament: {tournament.id}")
-            self.stdscr.addstr(1, 0, f"Your alias: {player_alias}")
-            self.stdscr.addstr(2, 0, "Waiting for players to join...")
-            self.stdscr.addstr(4, 0, "Tournament will start when 4 players have joined.")
-            self.stdscr.addstr(6, 0, "Press 'q' to leave tournament")
-            self.stdscr.refresh()
-
-            # Check for tournament end message
-            if self.client._tournament_end_message:
-                await self.show_tournament_result(self.client._tournament_end_message)
-                self.client._tournament_end_message = None
-                return None
+        subscription = self.client.subscribe_game_state()
+        try:
+            while True:
+                self.stdscr.clear()
+                self.stdscr.addstr(0, 0, f"Tournament: {tournament.id}")
+                self.stdscr.addstr(1, 0, f"Your alias: {player_alias}")
+                self.stdscr.addstr(2, 0, "Waiting for players to join...")
+                self.stdscr.addstr(4, 0, "Tournament will start when 4 players have joined.")
+                self.stdscr.addstr(6, 0, "Press 'q' to leave tournament")
+                self.stdscr.refresh()
 
-            # Check if we have a game (tournament started)
-            if self.client.game_data and self.client.game_id:
-                logger.info("Tournament game started, transitioning to game screen")
-                # Create a PongGame object from the current game data
-                game = PongGame.from_dict(self.client.game_data)
-                return game
-
-            # Handle input
-            key = self.stdscr.getch()
-            if key == ord('q'):
-                logger.info("User chose to leave tournament")
-                self.client.clear_tournament_state()
-                return None
-            elif key != curses.ERR:
-                # Any other key, just continue waiting
-                pass
+                # Check for tournament end message
+                if self.client._tournament_end_message:
+                    await self.show_tournament_result(self.client._tournament_end_message)
+                    self.client._tournament_end_message = None
+                    return None
 
-            await asyncio.sleep(0.1)
+                # Check if we have a game (tournament started)
+                if self.client.game_data and self.client.game_id:
+                    logger.info("Tournament game started, transitioning to game screen")
+                    # Create a PongGame object from the current game data
+                    game = PongGame.from_live_state(self.client.game_data)
+                    return game
+
+                # Wait for a key or the next game state or tournament message
+                key = await self.keyboard.get(subscription)
+                if key is None:
+                    subscription.take()
+                elif key == ord('q'):
+                    logger.info("User chose to leave tournament")
+                    self.client.clear_tournament_state()
+                    return None
+        finally:
+            subscription.close()
 
     async def show_tournament_result(self, message: str) -> None:
         max_y, _ = self.screen_size
@@ -1400,53 +3554,57 @@ class PongCli:
         # Clear any previous countdown
         self.client._tournament_countdown = None
 
-        while self.client._in_tournament:
-            self.stdscr.clear()
-            self.stdscr.addstr(0, 0, "Tournament in progress...")
-            self.stdscr.addstr(2, 0, "Waiting for next match or tournament results...")
-            self.stdscr.addstr(4, 0, "Press 'q' to quit tournament")
-            self.stdscr.refresh()
-
-            # Check for tournament end
-            if self.client._tournament_end_message:
-                return None
+        subscription = self.client.subscribe_game_state()
+        try:
+            while self.client._in_tournament:
+                self.stdscr.clear()
+                self.stdscr.addstr(0, 0, "Tournament in progress...")
+                self.stdscr.addstr(2, 0, "Waiting for next match or tournament results...")
+                self.stdscr.addstr(4, 0, "Press 'q' to quit tournament")
+                self.stdscr.refresh()
 
-            # CRITICAL FIX: Check for tournament countdown (indicates new game starting)
-            # This matches the web frontend behavior - countdown message = immediate transition to game
-            if self.client._tournament_countdown is not None:
-                logger.info(f"Tournament countdown received: {self.client._tournament_countdown} - transitioning to game immediately!")
-                # Create a placeholder game object for the countdown phase
-                # This matches exactly what the web frontend does - transition immediately on countdown
-                placeholder_game_data = {
-                    'id': f"tournament-final-{int(time.time() * 1000)}",  # Temporary ID for final
-                    'status': 'countdown',
-                    'ball': {'x': 0.5, 'y': 0.5},
-                    'leftPaddle': {'topPoint': {'x': 0.0, 'y': 0.4}, 'height': 0.2},
-                    'rightPaddle': {'topPoint': {'x': 0.99, 'y': 0.4}, 'height': 0.2},
-                    'lastUpdateTime': int(time.time() * 1000),
-                    'gameMode': 'classic',
-                    'maxScore': 10,
-                    'scores': [],
-                    'countdown': self.client._tournament_countdown
-                }
-                return PongGame.from_dict(placeholder_game_data)
-
-            # Check for new game - must be different from the finished game
-            if (self.client.game_data and self.client.game_id and
-                self.client.game_id != finished_game_id):
-                logger.info(f"Next tournament game available: {self.client.game_id}")
-                return PongGame.from_dict(self.client.game_data)
-
-            # Handle input
-            key = self.stdscr.getch()
-            if key == ord('q'):
-                logger.info("User chose to quit tournament")
-                self.client.clear_tournament_state()
-                return None
+                # Check for tournament end
+                if self.client._tournament_end_message:
+                    return None
 
-            await asyncio.sleep(0.1)
+                # CRITICAL FIX: Check for tournament countdown (indicates new game starting)
+                # This matches the web frontend behavior - countdown message = immediate transition to game
+                if self.client._tournament_countdown is not None:
+                    logger.info(f"Tournament countdown received: {self.client._tournament_countdown} - transitioning to game immediately!")
+                    # Create a placeholder game object for the countdown phase
+                    # This matches exactly what the web frontend does - transition immediately on countdown
+                    placeholder_game_data = {
+                        'id': f"tournament-final-{int(time.time() * 1000)}",  # Temporary ID for final
+                        'status': 'countdown',
+                        'ball': {'x': 0.5, 'y': 0.5},
+                        'leftPaddle': {'topPoint': {'x': 0.0, 'y': 0.4}, 'height': 0.2},
+                        'rightPaddle': {'topPoint': {'x': 0.99, 'y': 0.4}, 'height': 0.2},
+                        'lastUpdateTime': int(time.time() * 1000),
+                        'gameMode': 'classic',
+                        'maxScore': 10,
+                        'scores': [],
+                        'countdown': self.client._tournament_countdown
+                    }
+                    return PongGame.from_dict(placeholder_game_data)
+
+                # Check for new game - must be different from the finished game
+                if (self.client.game_data and self.client.game_id and
+                    self.client.game_id != finished_game_id):
+                    logger.info(f"Next tournament game available: {self.client.game_id}")
+                    return PongGame.from_live_state(self.client.game_data)
+
+                # Wait for a key or the next game state or tournament message
+                key = await self.keyboard.get(subscription)
+                if key is None:
+                    subscription.take()
+                elif key == ord('q'):
+                    logger.info("User chose to quit tournament")
+                    self.client.clear_tournament_state()
+                    return None
 
-        return None
+            return None
+        finally:
+            subscription.close()
 
     async def show_tournament_game_result(self, game_result: Dict[str, Any]) -> None:
         if not game_result:
@@ -1477,8 +3635,11 @@ class PongCli:
         self.print_at([(0, 0, "Debug mode: Press 'q' to quit, 'i' to dump a msg on the ws")])
         while True:
             # get messages from the queue
-            while not self.client.debug_queue.empty():
-                message = await self.client.debug_queue.get()
+            while True:
+                try:
+                    message = self.client.debug_queue.get_nowait()
+                except queue.Empty:
+                    break
                 messages.append(message)
                 if len(messages) > curses.LINES - 1:
                     messages.pop(0)
@@ -1500,7 +3661,7 @@ class PongCli:
             elif key == 'i':
                 input_str = await self.text_input()
                 try:
-                    await self.client.outgoing_messages.put(input_str)
+                    await self.client.send_message(input_str)
                 except Exception as error:
                     await self.show_error(str(error))
                 self.print_at([(0, 0, "Debug mode: Press 'q' to quit, 'i' to dump a msg on the ws")])
@@ -1511,25 +3672,22 @@ class PongCli:
         """Real remote gameplay implementation"""
         logger.info(f"Starting game screen for game: {game.id}")
         max_y, max_x = self.screen_size
+        renderer = (HalfBlockRenderer if self.settings.half_blocks else GameRenderer)(self.stdscr, max_y, max_x)
 
-        game_width: int = max_x - 10
-        game_height: int = max_y - 6
-        start_x: int = 5
-        start_y: int = 3
+        game_width: int = renderer.game_width
+        game_height: int = renderer.game_height
+        start_x: int = renderer.start_x
+        start_y: int = renderer.start_y
 
-        paddle_height: int = 5
-        left_paddle_x: int = start_x + 1
-        right_paddle_x: int = start_x + game_width - 2
+        paddle_height: int = renderer.PADDLE_HEIGHT
 
         game_id: str = game.id
         max_score: int = game.maxScore
 
         running: bool = True
-        last_render_time: float = time.time()
-        fps: int = 30
-        frame_duration: float = 1.0 / fps
-
-        instructions: str = "Press 'q' to quit, ↑/↓ to move paddle"
+        needs_render: bool = True
+        last_render_time: float = 0.0
+        frame_due: bool = True
 
         left_score: int = 0
         right_score: int = 0
@@ -1537,82 +3695,148 @@ class PongCli:
         ball_y: int = start_y + game_height // 2
         left_paddle_y: int = start_y + (game_height // 2) - (paddle_height // 2)
         right_paddle_y: int = start_y + (game_height // 2) - (paddle_height // 2)
-
-        logger.info(f"Game screen initialized: {game_width}x{game_height}, FPS: {fps}")
+        # the same positions as fractions of the field, the renderer may draw them at sub-cell precision
+        ball_fx: float = 0.5
+        ball_fy: float = 0.5
+        left_fy: float = (left_paddle_y - start_y) / game_height
+        right_fy: float = left_fy
+
+        # Smooth positions between server states, rendering every frame while the game is playing
+        interpolator: Optional[StateInterpolator] = None
+        if self.settings.interpolate:
+            interpolator = StateInterpolator(self.settings.interp_delay, self.settings.extrapolate_limit)
+        playing: bool = False
+
+        # Measure how long a key press takes to move the own paddle on screen
+        side: Optional[str] = self.client.player_side
+        predictor: Optional[PaddlePredictor] = None
+        input_latency = InputLatencyTracker(LatencyHistogram(
+            f"Input-to-display latency ({'with' if self.settings.predict else 'without'} prediction)"
+        ))
+        # Network, server and render latencies of this match, shown on demand below the field
+        latency = self.client.latency = MatchLatencyMetrics(side)
+        show_hud: bool = self.settings.hud
+        hud_interval: float = 0.25
+        hud_updated_at: float = 0.0
+
+        logger.info(f"Game screen initialized: {game_width}x{game_height}, interpolation: {bool(interpolator)}")
 
         # Wait for game to be in playing state before starting continuous input
         continuous_input_started = False
 
+        # Sleep until a new game state is published, a key is pressed or the next frame is due
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        subscription = self.client.subscribe_game_state(wakeup)
+        # Frame rate follows how fast the terminal takes the output
+        pacer = FramePacer(loop.time())
+        self.keyboard.attach(wakeup)
+
+        # Frame deadlines come from the shared scheduler and only run while there is something to draw
+        def on_frame() -> None:
+            nonlocal frame_due
+            frame_due = True
+            wakeup.set()
+        frame_job = self.client.scheduler.every(pacer.fps, on_frame, "render", paused=True)
+
+        # Move the own paddle locally as soon as an input is sent, the server state corrects it
+        if self.settings.predict and side:
+            predictor = PaddlePredictor(side, on_change=wakeup.set)
+            self.client.paddle_predictor = predictor
+
+        profiler = self.profiler
+        if profiler:
+            profiler.match_started()
+        renderer.draw_field()
         try:
             while running:
+                wakeup.clear()
+                if profiler:
+                    profiler.frame_started()
                 # Handle input first and process all available input
-                while True:
-                    key = self.stdscr.getch()
-                    if key == curses.ERR:
-                        break
-                    elif key == ord('q'):
+                while (key := self.keyboard.get_nowait()) is not None:
+                    if key == ord('q'):
                         logger.info("User pressed 'q' to quit game")
                         running = False
                         break
+                    elif key == ord('h'):
+                        show_hud = not show_hud
+                        hud_updated_at = 0.0
+                        needs_render = True
                     elif key == curses.KEY_UP:
-                        logger.debug("User input: UP arrow pressed (continuous up movement)")
+                        self._log_arrow_key("User input: UP arrow pressed (continuous up movement)")
                         if continuous_input_started:
+                            if side and not self.client.input_state["up"]:
+                                input_latency.key_pressed(True, left_paddle_y if side == "left" else right_paddle_y)
                             self.client.set_input_state(up=True, down=False)
                     elif key == curses.KEY_DOWN:
-                        logger.debug("User input: DOWN arrow pressed (continuous down movement)")
+                        self._log_arrow_key("User input: DOWN arrow pressed (continuous down movement)")
                         if continuous_input_started:
+                            if side and not self.client.input_state["down"]:
+                                input_latency.key_pressed(False, left_paddle_y if side == "left" else right_paddle_y)
                             self.client.set_input_state(down=True, up=False)
 
                 if not running:
                     break
+                if profiler:
+                    profiler.phase_ended(FrameProfiler.INPUT)
 
-                current_time = time.time()
-                should_render = current_time - last_render_time >= frame_duration
-
-                # Update game state from server
+                # Update game state from server, only when a new snapshot was published
                 # In tournament mode, accept any game data (game ID may change between rounds)
-                if self.client.game_data and (
-                    self.client.game_data.get('id') == game_id or
+                server_game: Optional[LiveGameState] = None
+                if subscription.changed:
+                    _, server_game = subscription.take()
+                    needs_render = True
+                    if server_game:
+                        pacer.state_received()
+                if server_game and (
+                    server_game.id == game_id or
                     (self.client._in_tournament and game_id.startswith('tournament-final-'))
                 ):
-                    server_game: Dict[str, Any] = self.client.game_data
                     # Update game_id if it changed (tournament progression)
-                    if self.client._in_tournament and self.client.game_data.get('id') != game_id:
-                        logger.info(f"Tournament game ID updated: {game_id} -> {self.client.game_data.get('id')}")
-                        game_id = self.client.game_data.get('id', game_id)
+                    if self.client._in_tournament and server_game.id != game_id:
+                        logger.info(f"Tournament game ID updated: {game_id} -> {server_game.id}")
+                        game_id = server_game.id
+                        if interpolator:
+                            interpolator.clear()
+                    if interpolator:
+                        interpolator.push(server_game)
+                    if predictor:
+                        predictor.on_server_state(
+                            server_game.left_paddle_y if side == "left" else server_game.right_paddle_y,
+                            server_game.paddle_height
+                        )
+
+                    ball_fx, ball_fy = server_game.ball_x, server_game.ball_y
+                    left_fy, right_fy = server_game.left_paddle_y, server_game.right_paddle_y
 
                     # Update ball position
-                    ball_data: Dict[str, Any] = server_game.get('ball', {})
-                    new_ball_x: int = start_x + int(ball_data.get('x', 0.5) * game_width)
-                    new_ball_y: int = start_y + int(ball_data.get('y', 0.5) * game_height)
+                    new_ball_x: int = start_x + int(server_game.ball_x * game_width)
+                    new_ball_y: int = start_y + int(server_game.ball_y * game_height)
 
                     # Log significant ball movement
                     if abs(new_ball_x - ball_x) > 5 or abs(new_ball_y - ball_y) > 3:
-                        logger.debug(f"Ball moved significantly: ({ball_x},{ball_y}) -> ({new_ball_x},{new_ball_y})")
+                        logger.debug("Ball moved significantly: (%d,%d) -> (%d,%d)", ball_x, ball_y, new_ball_x, new_ball_y)
 
                     ball_x, ball_y = new_ball_x, new_ball_y
 
                     # Update paddle positions
-                    left_paddle_data: Dict[str, Any] = server_game.get('leftPaddle', {}).get('topPoint', {})
-                    right_paddle_data: Dict[str, Any] = server_game.get('rightPaddle', {}).get('topPoint', {})
-
-                    left_paddle_y = start_y + int(left_paddle_data.get('y', 0.4) * game_height)
-                    right_paddle_y = start_y + int(right_paddle_data.get('y', 0.4) * game_height)
+                    left_paddle_y = start_y + int(server_game.left_paddle_y * game_height)
+                    right_paddle_y = start_y + int(server_game.right_paddle_y * game_height)
 
                     # Update scores
-                    scores: List[Dict[str, Any]] = server_game.get('scores', [])
-                    if len(scores) >= 2:
-                        new_left_score: int = scores[0].get('score', 0)
-                        new_right_score: int = scores[1].get('score', 0)
+                    new_left_score: int = server_game.left_score
+                    new_right_score: int = server_game.right_score
 
-                        # Log score changes
-                        if new_left_score != left_score or new_right_score != right_score:
-                            logger.info(f"Score update: {left_score}-{right_score} -> {new_left_score}-{new_right_score}")
+                    # Log score changes
+                    if new_left_score != left_score or new_right_score != right_score:
+                        logger.info("Score update: %d-%d -> %d-%d", left_score, right_score, new_left_score, new_right_score)
 
-                        left_score, right_score = new_left_score, new_right_score
+                    left_score, right_score = new_left_score, new_right_score
 
                     # Check game status and start continuous input when playing
-                    game_status: str = server_game.get('status', 'waiting')
+                    game_status: str = server_game.status
+                    playing = game_status == 'playing'
                     if game_status == 'playing' and not continuous_input_started:
                         logger.info("Game is now playing, starting continuous input system")
                         await self.client.start_continuous_input()
@@ -1621,69 +3845,66 @@ class PongCli:
                         logger.info("Game finished, exiting game loop")
                         running = False
 
+                if predictor and predictor.changed:
+                    needs_render = True
+
                 # Check for game over from server
                 if self.client._game_over_data:
                     running = False
-
-                # Only render if enough time has passed or if this is the first frame
-                if should_render:
-                    last_render_time = current_time
-                    self.stdscr.clear()
-
-                    # Display game info
-                    self.stdscr.addstr(0, 0, f"Game ID: {game_id} | Max Score: {max_score}")
-                    self.stdscr.addstr(1, 0, instructions)
-
-                    # Display game status
-                    if self.client.game_data:
-                        status = self.client.game_data.get('status', 'unknown')
-                        self.stdscr.addstr(2, 0, f"Status: {status}")
-                        if status == 'countdown':
-                            countdown = self.client.game_data.get('countdown', 0)
-                            if countdown > 0:
-                                self.stdscr.addstr(2, 20, f"Starting in: {countdown}")
-
-                    # Display scores
-                    score_x = start_x + (game_width // 2) - 5
-                    self.stdscr.addstr(start_y - 2, score_x, f"{left_score}   -   {right_score}")
-
-                    # Draw game field borders
-                    for x in range(start_x, start_x + game_width + 1):
-                        self.stdscr.addch(start_y, x, curses.ACS_HLINE)
-                        self.stdscr.addch(start_y + game_height, x, curses.ACS_HLINE)
-
-                    for y in range(start_y, start_y + game_height + 1):
-                        self.stdscr.addch(y, start_x, curses.ACS_VLINE)
-                        self.stdscr.addch(y, start_x + game_width, curses.ACS_VLINE)
-
-                    # Draw corners
-                    self.stdscr.addch(start_y, start_x, curses.ACS_ULCORNER)
-                    self.stdscr.addch(start_y, start_x + game_width, curses.ACS_URCORNER)
-                    self.stdscr.addch(start_y + game_height, start_x, curses.ACS_LLCORNER)
-                    self.stdscr.addch(start_y + game_height, start_x + game_width, curses.ACS_LRCORNER)
-
-                    # Draw center line
-                    center_x = start_x + (game_width // 2)
-                    for y in range(start_y + 1, start_y + game_height):
-                        if y % 2 == 0:
-                            self.stdscr.addch(y, center_x, '|')
-
-                    # Draw paddles
-                    for y in range(paddle_height):
-                        if left_paddle_y + y >= start_y + 1 and left_paddle_y + y < start_y + game_height:
-                            self.stdscr.addch(left_paddle_y + y, left_paddle_x, '█')
-                        if right_paddle_y + y >= start_y + 1 and right_paddle_y + y < start_y + game_height:
-                            self.stdscr.addch(right_paddle_y + y, right_paddle_x, '█')
-
-                    # Draw ball
-                    try:
-                        if (ball_x >= start_x + 1 and ball_x < start_x + game_width and
-                            ball_y >= start_y + 1 and ball_y < start_y + game_height):
-                            self.stdscr.addch(int(ball_y), int(ball_x), 'O')
-                    except curses.error:
-                        pass
-
-                    self.stdscr.refresh()
+                if profiler:
+                    profiler.phase_ended(FrameProfiler.STATE)
+
+                # Only render if something changed and the frame deadline has passed
+                if needs_render and not frame_due and frame_job.paused:
+                    # first change after being idle, draw right away unless the last frame was too recent
+                    frame_due = loop.time() - last_render_time >= 1.0 / pacer.fps
+                if needs_render and frame_due:
+                    frame_due = False
+                    last_render_time = loop.time()
+                    frame_started = time.perf_counter()
+                    # keep rendering at the local frame rate while interpolating
+                    needs_render = interpolator is not None and playing
+
+                    if interpolator and (positions := interpolator.sample(time.monotonic())):
+                        ball_fx, ball_fy, left_fy, right_fy = positions
+                        ball_x = start_x + int(ball_fx * game_width)
+                        ball_y = start_y + int(ball_fy * game_height)
+                        left_paddle_y = start_y + int(left_fy * game_height)
+                        right_paddle_y = start_y + int(right_fy * game_height)
+                    if predictor and (own_y := predictor.position()) is not None:
+                        if side == "left":
+                            left_fy = own_y
+                            left_paddle_y = start_y + int(own_y * game_height)
+                        else:
+                            right_fy = own_y
+                            right_paddle_y = start_y + int(own_y * game_height)
+
+                    # Latency HUD, refreshed a few times per second so it stays readable
+                    hud_lines: Optional[List[str]] = None
+                    if not show_hud:
+                        hud_lines = ["", ""]
+                    elif last_render_time - hud_updated_at >= hud_interval:
+                        hud_updated_at = last_render_time
+                        hud_lines = latency.hud_lines()
+
+                    renderer.draw_frame(
+                        f"Game ID: {game_id} | Max Score: {max_score}", self.GAME_INSTRUCTIONS, self.client.game_data,
+                        pacer.status(), left_score, right_score, hud_lines, (ball_fx, ball_fy, left_fy, right_fy)
+                    )
+                    if profiler:
+                        profiler.phase_ended(FrameProfiler.DRAW)
+                    refresh_started = time.perf_counter()
+                    renderer.present()
+                    if self.settings.slow_ui:
+                        # blocking on purpose, like a slow terminal
+                        time.sleep(self.settings.slow_ui)
+                    if profiler:
+                        profiler.phase_ended(FrameProfiler.REFRESH)
+                    if pacer.frame_presented(loop.time(), time.perf_counter() - refresh_started):
+                        frame_job.set_rate(pacer.fps)
+                    latency.render_time.record(time.perf_counter() - frame_started)
+                    if side:
+                        input_latency.frame_drawn(left_paddle_y if side == "left" else right_paddle_y)
 
                 # Check for errors
                 error = self.client.get_error()
@@ -1692,13 +3913,38 @@ class PongCli:
                     await self.show_error(f"Game error: {error[0]}")
                     running = False
 
-                # Small sleep to prevent excessive CPU usage while still being responsive
-                await asyncio.sleep(0.005)
+                if not running:
+                    break
+
+                if profiler:
+                    profiler.frame_ended()
+                # Pending changes are drawn at the next frame deadline, otherwise sleep until woken
+                if needs_render:
+                    frame_job.resume()
+                else:
+                    frame_job.pause()
+                await wakeup.wait()
 
         finally:
+            if profiler:
+                profiler.match_ended()
+            self.keyboard.detach(wakeup)
+            frame_job.cancel()
+            subscription.close()
+            self.client.paddle_predictor = None
             # Clean up continuous input system
             await self.client.stop_continuous_input()
             logger.info("Game loop ended, continuous input stopped")
+            renderer.log_stats()
+            logger.info(pacer.summary())
+            logger.info(input_latency.histogram.summary())
+            for histogram in latency.histograms:
+                logger.info(histogram.summary())
+            if self.settings.latency_report:
+                try:
+                    latency.write_report(self.settings.latency_report, game_id)
+                except OSError as e:
+                    logger.error(f"Failed to write latency report: {e}")
 
         # Determine winner
         if left_score == right_score:
@@ -1725,6 +3971,7 @@ class PongCli:
 
     def cleanup(self) -> None:
         logger.info("Cleaning up PongCli terminal interface")
+        self.keyboard.close()
         try:
             self.stdscr.clear()
             self.stdscr.refresh()
@@ -1739,27 +3986,159 @@ class PongCli:
 
 class GracefulExit(Exception): pass
 
+def write_profile(profiler: FrameProfiler, sampler: Optional[StackSampler]) -> None:
+    """Write the frame phase percentiles and the sampled stacks of a --profile run"""
+    report = profiler.report()
+    if sampler:
+        sampler.stop()
+        sampler.write_collapsed(PROFILE_STACKS_FILE)
+        report += f"\n\n{sampler.samples} stack samples every {sampler.interval * 1000:.1f}ms during matches in {PROFILE_STACKS_FILE.name}"
+        print(f"Stack samples written to {PROFILE_STACKS_FILE}")
+    with open(PROFILE_FILE, "w") as profile_file:
+        profile_file.write(report + "\n")
+    logger.info(report)
+    print(f"Frame profile written to {PROFILE_FILE}")
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="pong_cli.py", description="Terminal client for Pong")
+    parser.add_argument("backend_url", nargs="?", help="URL of the backend, e.g. https://localhost:8443")
+    parser.add_argument(
+        "--interpolate", action="store_true",
+        help="render interpolated ball and paddle positions at the local frame rate"
+    )
+    parser.add_argument(
+        "--interp-delay", type=float, default=0.05, metavar="SECONDS",
+        help="how far in the past interpolated positions are rendered (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--extrapolate-limit", type=float, default=0.1, metavar="SECONDS",
+        help="how long positions are extrapolated when server updates are late (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--predict", action="store_true",
+        help="move the own paddle locally before the server confirms the input"
+    )
+    parser.add_argument(
+        "--hud", action="store_true",
+        help="show the latency HUD from the start of a match (toggle with 'h')"
+    )
+    parser.add_argument(
+        "--half-blocks", action="store_true",
+        help="draw the ball and paddles with half block characters, at twice the vertical resolution"
+    )
+    parser.add_argument(
+        "--latency-report", type=Path, default=LATENCY_REPORT_FILE, metavar="FILE",
+        help="file the latency percentiles of every match are appended to (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--record", type=Path, metavar="FILE",
+        help="append every websocket frame of the session to FILE, for --replay"
+    )
+    parser.add_argument(
+        "--replay", type=Path, metavar="FILE",
+        help="show the match of the last session recorded in FILE instead of connecting to a backend"
+    )
+    parser.add_argument(
+        "--replay-speed", type=float, default=1.0, metavar="FACTOR",
+        help="playback speed of --replay, 0 for as fast as possible (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--single-loop", action="store_true",
+        help="run the network on the event loop of the terminal UI instead of a thread of its own"
+    )
+    parser.add_argument(
+        "--slow-ui", type=float, default=0.0, metavar="SECONDS",
+        help="block the UI this long after every frame, to test the input timing under a slow terminal"
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help=f"time the phases of every game screen frame and sample the stacks of the cli, "
+             f"written to {PROFILE_FILE.name} and {PROFILE_STACKS_FILE.name} on exit"
+    )
+    parser.add_argument(
+        "--profile-sample-rate", type=float, default=200.0, metavar="HZ",
+        help="stack samples per second with --profile, 0 to only time the frame phases (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--log-level", default="INFO", type=str.upper,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="lowest level written to log_pong_cli.log (default: %(default)s)"
+    )
+    args = parser.parse_args(argv)
+    if args.backend_url is None and args.replay is None:
+        parser.error("the backend_url is required unless --replay is given")
+    return args
+
 async def main() -> None:
+    args = parse_args(sys.argv[1:])
+    setup_logging(args.log_level)
     logger.info("=== Starting Pong CLI Application ===")
-    # TODO: move network on separate thread
-    cli_args: List[str] = sys.argv[1:]
-    if len(cli_args) != 1:
-        logger.error("Invalid command line arguments")
-        print("Usage: ./pong_cli.py <backend_url>", file=sys.stderr)
-        sys.exit(1)
-
-    backend_url: str = cli_args[0]
+    backend_url: Optional[str] = args.backend_url
     logger.info(f"Backend URL: {backend_url}")
+    settings = CliSettings(
+        interpolate=args.interpolate,
+        interp_delay=args.interp_delay,
+        extrapolate_limit=args.extrapolate_limit,
+        predict=args.predict,
+        hud=args.hud,
+        latency_report=args.latency_report,
+        slow_ui=args.slow_ui,
+        half_blocks=args.half_blocks,
+    )
 
+    recording: Optional[SessionRecording] = None
+    if args.replay:
+        # before anything is started, so a bad file only prints an error
+        try:
+            recording = SessionRecording.load(args.replay)
+        except (OSError, ValueError) as e:
+            logger.error(f"Cannot replay {args.replay}: {e}")
+            sys.exit(f"Cannot replay {args.replay}: {e}")
+        logger.info(f"Replaying {len(recording.frames)} frames of {recording.username} recorded {recording.started}")
+
+    # the network side runs on its own thread unless --single-loop is given
+    network: Optional[NetworkThread] = None if args.single_loop else NetworkThread()
+    def on_network(coro: Coroutine[Any, Any, Any]) -> Coroutine[Any, Any, Any]:
+        return network.run(coro) if network else coro
+
+    sampler: Optional[StackSampler] = None
+    if args.profile and args.profile_sample_rate > 0:
+        sampler = StackSampler(1.0 / args.profile_sample_rate)
+    profiler: Optional[FrameProfiler] = FrameProfiler(sampler=sampler) if args.profile else None
+
+    game_client: Optional[GameClient] = None
+    ui_client: Optional[Union[GameClient, NetworkClientProxy]] = None
+    terminal_ui: Optional[PongCli] = None
     try:
-        game_client: GameClient = GameClient.from_login(backend_url)
-        terminal_ui: PongCli = PongCli(game_client)
-        logger.info("Starting application task group")
+        if network:
+            network.start()
+        if sampler:
+            sampler.add_thread(threading.current_thread())
+            if network:
+                sampler.add_thread(network.thread)
+            sampler.start()
+        if recording:
+            game_client = GameClient(recording.username, "", recording.url)
+            # latencies of a replay say nothing about the network
+            settings.latency_report = None
+        else:
+            game_client = await on_network(GameClient.from_login(backend_url))
+            if args.record:
+                if network:
+                    network.call_soon(game_client.record_session, args.record)
+                else:
+                    game_client.record_session(args.record)
+        ui_client = NetworkClientProxy(game_client, network) if network else game_client
+        terminal_ui = PongCli(ui_client, settings, profiler)
+        logger.info(f"Starting application task group, network on {'a thread of its own' if network else 'the UI loop'}")
 
         async with asyncio.TaskGroup() as tg:
-            tg.create_task(game_client.start())
-            tg.create_task(game_client.consume_backend_messages())
-            tg.create_task(terminal_ui.run())
+            if recording:
+                tg.create_task(on_network(game_client.replay(ReplaySource(recording, args.replay_speed))))
+            else:
+                tg.create_task(on_network(game_client.start()))
+            tg.create_task(on_network(game_client.consume_backend_messages()))
+            tg.create_task(terminal_ui.replay() if recording else terminal_ui.run())
     except* Exception as exc_group:
         for exc in exc_group.exceptions:
             if not isinstance(exc, GracefulExit):
@@ -1769,8 +4148,16 @@ async def main() -> None:
                 logger.info(f"Graceful exit: {exc}")
     finally:
         logger.info("Application shutting down")
-        terminal_ui.cleanup()
-        await game_client.close()
+        if terminal_ui:
+            terminal_ui.cleanup()
+        if game_client:
+            await on_network(game_client.close())
+        if network:
+            if ui_client:
+                await ui_client.scheduler.close()
+            await network.stop()
+        if profiler:
+            write_profile(profiler, sampler)
         print("Exiting Pong CLI...")
         logger.info("=== Pong CLI Application Ended ===")
 
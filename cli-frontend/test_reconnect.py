@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Fault injection test of the websocket reconnect: mock_backend.py closes the
+websocket of the game creator in the middle of a match, both bots have to
+end that match and play the next one.
+
+Usage:
+```
+python3 -m unittest test_reconnect
+```
+"""
+
+import asyncio
+import unittest
+from typing import Any, Dict, List
+
+from aiohttp import web
+
+import mock_backend
+from pong_bot import BotClient, BotPlayer
+
+
+class ReconnectTest(unittest.IsolatedAsyncioTestCase):
+    DROP_AFTER: float = 1.0
+    # whole run, the match that is dropped ends after about 2 seconds
+    TIMEOUT: float = 20.0
+
+    async def asyncSetUp(self) -> None:
+        args = mock_backend.parse_args([
+            "--drop-after", str(self.DROP_AFTER), "--countdown", "0", "--max-score", "1000", "--report-interval", "3600",
+        ])
+        self.backend = mock_backend.MockBackend(args)
+        self.runner = web.AppRunner(self.backend.app())
+        await self.runner.setup()
+        await web.TCPSite(self.runner, "127.0.0.1", 0).start()
+        # a host name, the cookie jar of the client does not keep cookies of IP addresses
+        url = f"http://localhost:{self.runner.addresses[0][1]}"
+        self.game_overs: Dict[str, List[Dict[str, Any]]] = {}
+        self.players: List[BotPlayer] = []
+        for index in range(2):
+            client = BotClient(f"bot{index}", "Bot12345!", url)
+            # do not wait long for a match the mock has already ended
+            client.GAME_RESUME_TIMEOUT = 0.5
+            self.record_game_overs(client)
+            self.players.append(BotPlayer(index, client))
+
+    async def asyncTearDown(self) -> None:
+        await asyncio.gather(*(player.close() for player in self.players), return_exceptions=True)
+        await self.runner.cleanup()
+
+    def record_game_overs(self, client: BotClient) -> None:
+        game_overs = self.game_overs.setdefault(client.username, [])
+        handle_game_over = client.handle_game_over
+        def record(pong_data: Dict[str, Any]) -> None:
+            game_overs.append(pong_data)
+            handle_game_over(pong_data)
+        client.handle_game_over = record  # type: ignore[method-assign]
+
+    async def start_match(self, stop: asyncio.Event) -> asyncio.Future:
+        creator, joiner = self.players
+        game = await creator.client.create_and_wait_for_game("classic", 1000, creator.alias)
+        self.assertIsNotNone(game)
+        assert game is not None
+        await joiner.client.join_game(game.id, joiner.alias)
+        return asyncio.gather(creator.play(True, stop), joiner.play(False, stop))
+
+    async def test_match_dropped_mid_match(self) -> None:
+        creator, joiner = self.players
+        await asyncio.wait_for(asyncio.gather(creator.connect(), joiner.connect()), self.TIMEOUT)
+
+        # the mock drops the creator, ends the match for the joiner and the
+        # creator ends it locally when it does not resume after the reconnect
+        await asyncio.wait_for(await self.start_match(asyncio.Event()), self.TIMEOUT)
+        self.assertEqual(self.backend.stats["drops"], 1)
+        self.assertGreaterEqual(creator.client.reconnects, 1)
+        self.assertGreater(creator.client.downtime, 0.0)
+        self.assertEqual(creator.client.stats.games_started, 1)
+        self.assertEqual(creator.client.stats.games_finished, 1)
+        self.assertEqual(len(self.game_overs[creator.client.username]), 1)
+        self.assertEqual(len(self.game_overs[joiner.client.username]), 1)
+        self.assertEqual(self.game_overs[joiner.client.username][0]["message"], "Opponent disconnected")
+        self.assertEqual(self.game_overs[creator.client.username][0]["winnerId"], "")
+        self.assertEqual(creator.client.stats.errors + joiner.client.stats.errors, 0)
+
+        # the next match is played over the new websocket
+        self.backend.args.drop_after = None
+        frames = creator.client.stats.frames
+        stop = asyncio.Event()
+        match = await self.start_match(stop)
+        deadline = asyncio.get_running_loop().time() + self.TIMEOUT
+        while creator.client.stats.frames < frames + 10 and not match.done():
+            self.assertLess(asyncio.get_running_loop().time(), deadline, "no game states in the second match")
+            await asyncio.sleep(0.1)
+        self.assertFalse(match.done(), "the second match ended early")
+        self.assertEqual(creator.client.stats.games_started, 2)
+        self.assertGreaterEqual(joiner.client.stats.frames, 10)
+        stop.set()
+        for player in self.players:
+            player.client.publish_game_state()
+        await asyncio.wait_for(match, self.TIMEOUT)
+
+
+if __name__ == "__main__":
+    unittest.main()